@@ -0,0 +1,52 @@
+"""
+Benchmarks for PynamoModelFactory.build()
+
+    python -m benchmarks run [CASE ...]       Measure and print the results
+    python -m benchmarks save [CASE ...]      Measure and store the results as the baseline
+    python -m benchmarks compare [CASE ...]   Measure and exit with status 1 if any case regressed from the baseline
+"""
+import argparse
+import os
+import sys
+
+from benchmarks.cases import CASES
+from benchmarks.runner import DEFAULT_THRESHOLD, IMPORT, ITEMS, ROUNDS, compare, format_results, load, run, save
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks for PynamoModelFactory")
+    parser.add_argument("command", choices=["run", "save", "compare"])
+    parser.add_argument("cases", nargs="*", metavar="CASE",
+                        help=f"cases to run, from: {', '.join([*CASES, IMPORT])}. Defaults to all of them.")
+    parser.add_argument("--baseline", default=BASELINE, help="the baseline file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="the fraction items/sec may fall, or import time rise, before it's a regression")
+    parser.add_argument("--items", type=int, default=ITEMS, help="items to build per round")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="timed rounds per case")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.cases if name not in CASES and name != IMPORT]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    results = run(args.cases, args.items, args.rounds)
+    print(format_results(results))
+
+    if args.command == "save":
+        baseline = load(args.baseline) if os.path.exists(args.baseline) else {}
+        baseline.update(results)
+        save(baseline, args.baseline)
+        print(f"Saved baseline to {args.baseline}")
+    elif args.command == "compare":
+        regressions = compare(results, load(args.baseline), args.threshold)
+        if regressions:
+            print("Regressions:")
+            print("\n".join(regressions))
+            return 1
+        print("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
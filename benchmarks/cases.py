@@ -0,0 +1,54 @@
+from typing import Callable, Dict, Type
+
+from pynamodb.attributes import MapAttribute, NumberAttribute, UnicodeAttribute, UTCDateTimeAttribute, \
+    BooleanAttribute
+from pynamodb.models import Model
+
+from pynamodb_factories.factory import PynamoModelFactory
+from tests.test_models.models import Meta, EmptyModel, NumberModel, BinaryModel, BooleanModel, UnicodeModel, \
+    JsonModel, VersionModel, TtlModel, DateModel, NullModel, MapModel, ListModel, MapListMapModel
+
+WIDE_ATTRIBUTES = 200
+DEEP_NESTING = 8
+
+
+def wide_model(width: int = WIDE_ATTRIBUTES) -> Type[Model]:
+    """A model with width scalar attributes, cycling through a few common types"""
+    types = [UnicodeAttribute, NumberAttribute, BooleanAttribute, UTCDateTimeAttribute]
+    attributes = {f"attr_{i}": types[i % len(types)]() for i in range(width)}
+    return type("WideModel", (Model,), {"Meta": Meta, **attributes})
+
+
+def deep_model(depth: int = DEEP_NESTING) -> Type[Model]:
+    """A model whose only attribute is a chain of depth typed maps, each holding a few scalars"""
+    inner = None
+    for level in range(depth):
+        attributes = {"name": UnicodeAttribute(), "num": NumberAttribute()}
+        if inner is not None:
+            attributes["child"] = inner()
+        inner = type(f"Level{level}Map", (MapAttribute,), attributes)
+    return type("DeepModel", (Model,), {"Meta": Meta, "root": inner()})
+
+
+def _factory(model: Type[Model], **attributes) -> Type[PynamoModelFactory]:
+    return type(f"{model.__name__}BenchFactory", (PynamoModelFactory,), {"__model__": model, **attributes})
+
+
+# Each case builds a factory, and the benchmark times that factory's build()
+CASES: Dict[str, Callable[[], Type[PynamoModelFactory]]] = {
+    "empty": lambda: _factory(EmptyModel),
+    "number": lambda: _factory(NumberModel),
+    "binary": lambda: _factory(BinaryModel),
+    "boolean": lambda: _factory(BooleanModel),
+    "unicode": lambda: _factory(UnicodeModel),
+    "json": lambda: _factory(JsonModel),
+    "version": lambda: _factory(VersionModel),
+    "ttl": lambda: _factory(TtlModel),
+    "date": lambda: _factory(DateModel),
+    "null": lambda: _factory(NullModel),
+    "map": lambda: _factory(MapModel),
+    "list": lambda: _factory(ListModel),
+    "map_list_map": lambda: _factory(MapListMapModel),
+    "wide": lambda: _factory(wide_model()),
+    "deep": lambda: _factory(deep_model()),
+}
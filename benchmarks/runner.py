@@ -0,0 +1,133 @@
+import gc
+import json
+import subprocess
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional
+
+from benchmarks.cases import CASES
+
+# Build this many items per timed round, and keep the best of the rounds
+ITEMS = 500
+ROUNDS = 7
+SEED = 1
+# A case regresses when its items/sec falls by more than this fraction of the baseline
+DEFAULT_THRESHOLD = 0.25
+# The case measuring how long importing the package takes, in a fresh interpreter. It regresses when the time rises
+# by more than the threshold.
+IMPORT = "import"
+IMPORT_CODE = "import time; start = time.perf_counter(); import pynamodb_factories; print(time.perf_counter() - start)"
+
+
+def measure(name: str, items: int = ITEMS, rounds: int = ROUNDS) -> Dict[str, float]:
+    """
+    Measure one benchmark case
+
+    Args:
+        name: The name of the case in CASES
+        items: The number of items to build per round
+        rounds: The number of timed rounds
+    Returns:
+        A dict with the best items_per_second over the rounds, the peak_bytes traced while building one round, and the
+        bytes_per_item and blocks_per_item still allocated by the built items
+    """
+    factory = CASES[name]()
+    factory.set_random_seed(SEED)
+    factory.build()
+
+    best = 0.0
+    for _ in range(rounds):
+        gc.collect()
+        start = perf_counter()
+        for _ in range(items):
+            factory.build()
+        best = max(best, items / (perf_counter() - start))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        built = [factory.build() for _ in range(items)]
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained = [stat for stat in after.compare_to(before, "filename") if stat.size_diff > 0]
+    del built
+
+    return {
+        "items_per_second": round(best, 1),
+        "peak_bytes": peak,
+        "bytes_per_item": round(sum(stat.size_diff for stat in retained) / items, 1),
+        "blocks_per_item": round(sum(stat.count_diff for stat in retained) / items, 1),
+    }
+
+
+def measure_import(rounds: int = ROUNDS) -> Dict[str, float]:
+    """
+    Measure importing pynamodb_factories in a fresh interpreter
+
+    Returns:
+        A dict with the best import_seconds over the rounds
+    """
+    best = None
+    for _ in range(rounds):
+        output = subprocess.run([sys.executable, "-c", IMPORT_CODE], check=True, capture_output=True, text=True)
+        seconds = float(output.stdout)
+        best = seconds if best is None else min(best, seconds)
+    return {"import_seconds": round(best, 4)}
+
+
+def run(names: Optional[Iterable[str]] = None, items: int = ITEMS, rounds: int = ROUNDS) -> Dict[str, Dict]:
+    """Measure each named case, or all of them and the import time"""
+    return {name: measure_import(rounds) if name == IMPORT else measure(name, items, rounds)
+            for name in (names or [*CASES, IMPORT])}
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    Compare results against a baseline
+
+    Returns:
+        A description of each case whose items/sec, or import time, regressed by more than the threshold
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        if name == IMPORT:
+            expected = baseline[name]["import_seconds"]
+            actual = result["import_seconds"]
+            if actual > expected * (1 + threshold):
+                regressions.append(f"{name}: {actual * 1000:.1f} ms, baseline {expected * 1000:.1f} ms "
+                                   f"({(actual - expected) / expected:+.0%})")
+            continue
+        expected = baseline[name]["items_per_second"]
+        actual = result["items_per_second"]
+        if actual < expected * (1 - threshold):
+            regressions.append(f"{name}: {actual:.1f} items/sec, baseline {expected:.1f} "
+                               f"({(actual - expected) / expected:+.0%})")
+    return regressions
+
+
+def load(path: str) -> Dict[str, Dict]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(results: Dict[str, Dict], path: str):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def format_results(results: Dict[str, Dict]) -> str:
+    lines = [f"{'case':<14}{'items/sec':>12}{'peak KiB':>12}{'bytes/item':>12}{'blocks/item':>13}"]
+    for name, result in results.items():
+        if name == IMPORT:
+            lines.append(f"{name:<14}{result['import_seconds'] * 1000:>10.1f} ms")
+            continue
+        lines.append(f"{name:<14}{result['items_per_second']:>12.1f}{result['peak_bytes'] / 1024:>12.1f}"
+                     f"{result['bytes_per_item']:>12.1f}{result['blocks_per_item']:>13.1f}")
+    return "\n".join(lines)
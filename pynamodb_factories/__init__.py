@@ -1,6 +1,7 @@
 from .factory import PynamoModelFactory
 from .fields import Use, Required, Ignored
 from .exceptions import UnsupportedException, ModelError
+from .keys import KeyDistribution
 
 __all__ = [
     'PynamoModelFactory',
@@ -9,4 +10,5 @@ __all__ = [
     'Ignored',
     'UnsupportedException',
     'ModelError',
+    'KeyDistribution',
 ]
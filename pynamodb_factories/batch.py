@@ -0,0 +1,333 @@
+import marshal
+from abc import ABC, abstractmethod
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Type, TypeVar, Union
+
+from pynamodb.attributes import (
+    Attribute, BooleanAttribute, NumberAttribute, TTLAttribute, UnicodeAttribute, UTCDateTimeAttribute
+)
+from pynamodb.exceptions import AttributeNullError
+
+from pynamodb_factories.serialization import compile_serializer
+
+T = TypeVar("T")
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+# Strings stop being dictionary encoded once a column has this many rows, and more than this fraction are distinct
+STRING_DICTIONARY_ROWS = 1024
+STRING_DICTIONARY_RATIO = 0.5
+
+
+class _Column(ABC):
+    """
+    The values of one attribute for every row of a batch. Typed columns store values compactly, and return False from
+    append() for a value they can't store, so the batch can fall back to a SerializedColumn.
+    """
+
+    def __init__(self, field_name: str, field: Attribute):
+        self.field_name = field_name
+        self.field = field
+        self.attr_name = field.attr_name
+        self.attr_type = field.attr_type
+        self._default = field.default_for_new if field.default_for_new is not None else field.default
+
+    def value(self, build_args: dict) -> Any:
+        """Get this attribute's value from the args for the model constructor, following the model's defaults"""
+        if self.field_name in build_args:
+            return build_args[self.field_name]
+        return self._default() if callable(self._default) else self._default
+
+    @abstractmethod
+    def append(self, build_args: dict) -> bool:
+        """Add this attribute's value from the args for the model constructor, or return False if it can't be stored"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def get(self, row: int) -> Any:
+        """Get the value of a row, as it would be on a model instance"""
+
+    def attribute_value(self, row: int) -> Any:
+        """Get the serialized value of a row, without its type key, or None if it's left out of the item"""
+        value = self.get(row)
+        return None if value is None else self.field.serialize(value)
+    pass
+
+
+class _ArrayColumn(_Column):
+    """Stores values in an array, with a mask of the rows that are None"""
+    typecode = "q"
+
+    def __init__(self, field_name: str, field: Attribute):
+        super().__init__(field_name, field)
+        self.values = array(self.typecode)
+        self.nulls: Optional[bytearray] = None
+
+    def append(self, build_args: dict) -> bool:
+        value = self.value(build_args)
+        if value is None:
+            if self.nulls is None:
+                self.nulls = bytearray(len(self.values))
+            self.values.append(0)
+            self.nulls.append(1)
+            return True
+        encoded = self.encode(value)
+        if encoded is None:
+            return False
+        self.values.append(encoded)
+        if self.nulls is not None:
+            self.nulls.append(0)
+        return True
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get(self, row: int) -> Any:
+        if self.nulls is not None and self.nulls[row]:
+            return None
+        return self.decode(self.values[row])
+
+    @abstractmethod
+    def encode(self, value: Any) -> Optional[Any]:
+        """Encode a value for the array, or return None if it can't be stored"""
+
+    @abstractmethod
+    def decode(self, encoded: Any) -> Any:
+        """Decode a value from the array"""
+    pass
+
+
+class IntColumn(_ArrayColumn):
+    """Stores ints in 8 bytes each. Floats and other numbers aren't stored, since they serialize differently."""
+
+    def encode(self, value):
+        if type(value) is int and INT64_MIN <= value <= INT64_MAX:
+            return value
+        return None
+
+    def decode(self, encoded):
+        return encoded
+    pass
+
+
+class BoolColumn(_ArrayColumn):
+    """Stores bools in 1 byte each"""
+    typecode = "b"
+
+    def encode(self, value):
+        return int(value) if type(value) is bool else None
+
+    def decode(self, encoded):
+        return bool(encoded)
+    pass
+
+
+class DatetimeColumn(_ArrayColumn):
+    """Stores timezone-aware datetimes as 8 byte microsecond timestamps, and returns them in UTC"""
+
+    def encode(self, value):
+        if type(value) is not datetime or value.tzinfo is None:
+            return None
+        return (value - EPOCH) // MICROSECOND
+
+    def decode(self, encoded):
+        return EPOCH + timedelta(microseconds=encoded)
+    pass
+
+
+class StringColumn(_Column):
+    """
+    Dictionary encodes strings, so each distinct string is stored once and each row takes 4 bytes. When most of the
+    strings are distinct, the dictionary costs more than it saves, so the column stores them in a plain list instead.
+    """
+
+    def __init__(self, field_name: str, field: Attribute):
+        super().__init__(field_name, field)
+        self.codes: Optional[array] = array("i")
+        self.strings: List[Optional[str]] = []
+        self._codes_by_string: Dict[str, int] = {}
+
+    def append(self, build_args: dict) -> bool:
+        value = self.value(build_args)
+        if value is not None and type(value) is not str:
+            return False
+        if self.codes is None:
+            self.strings.append(value)
+            return True
+        if value is None:
+            self.codes.append(-1)
+            return True
+        code = self._codes_by_string.get(value)
+        if code is None:
+            code = self._codes_by_string[value] = len(self.strings)
+            self.strings.append(value)
+        self.codes.append(code)
+        rows = len(self.codes)
+        if rows >= STRING_DICTIONARY_ROWS and len(self.strings) > rows * STRING_DICTIONARY_RATIO:
+            strings = self.strings
+            self.strings = [strings[code] if code >= 0 else None for code in self.codes]
+            self.codes = None
+            self._codes_by_string = {}
+        return True
+
+    def __len__(self) -> int:
+        return len(self.strings) if self.codes is None else len(self.codes)
+
+    def get(self, row: int) -> Any:
+        if self.codes is None:
+            return self.strings[row]
+        code = self.codes[row]
+        return self.strings[code] if code >= 0 else None
+    pass
+
+
+class SerializedColumn(_Column):
+    """
+    Stores each value in its serialized form, marshalled to bytes. Maps and lists of maps are built directly in
+    serialized form, so they're never created as MapAttribute instances.
+    """
+
+    def __init__(self, field_name: str, field: Attribute):
+        super().__init__(field_name, field)
+        self.values: List[Optional[bytes]] = []
+        self._serializer = compile_serializer(field_name, field)
+
+    def append(self, build_args: dict) -> bool:
+        attribute_values = {}
+        try:
+            self._serializer(build_args, attribute_values)
+        except AttributeNullError:
+            pass
+        attribute_value = attribute_values.get(self.attr_name)
+        self.values.append(None if attribute_value is None else marshal.dumps(attribute_value[self.attr_type]))
+        return True
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get(self, row: int) -> Any:
+        value = self.attribute_value(row)
+        return None if value is None else self.field.deserialize(value)
+
+    def attribute_value(self, row: int) -> Any:
+        value = self.values[row]
+        return None if value is None else marshal.loads(value)
+
+    @classmethod
+    def from_column(cls, column: _Column) -> "SerializedColumn":
+        """Convert a typed column which was given a value it can't store"""
+        converted = cls(column.field_name, column.field)
+        for row in range(len(column)):
+            converted.append({column.field_name: column.get(row)})
+        return converted
+    pass
+
+
+def _column_for(field_name: str, field: Attribute) -> _Column:
+    if isinstance(field, NumberAttribute):
+        return IntColumn(field_name, field)
+    if isinstance(field, BooleanAttribute):
+        return BoolColumn(field_name, field)
+    if isinstance(field, (UTCDateTimeAttribute, TTLAttribute)):
+        return DatetimeColumn(field_name, field)
+    if isinstance(field, UnicodeAttribute):
+        return StringColumn(field_name, field)
+    return SerializedColumn(field_name, field)
+
+
+class ColumnarBatch(Generic[T]):
+    """
+    A batch of generated instances of a model, stored column by column instead of as model instances. Numbers,
+    booleans and datetimes are kept in arrays, strings are dictionary encoded, and everything else is kept in its
+    serialized form. An instance is only created when a row is accessed.
+
+    Create one with PynamoModelFactory.build_columnar(). Batches support len(), indexing, slicing and iteration.
+    Slices share the columns of the batch they're taken from.
+
+    Args:
+        model: The model class
+    """
+
+    def __init__(self, model: Type[T]):
+        self.model = model
+        self._columns: List[_Column] = [
+            _column_for(field_name, field) for field_name, field in model.get_attributes().items()
+        ]
+        self._rows: Optional[range] = None
+
+    def append(self, build_args: dict):
+        """Add a row, from the args for the model constructor"""
+        if self._rows is not None:
+            raise ValueError("rows can't be added to a slice of a batch")
+        for position, column in enumerate(self._columns):
+            if not column.append(build_args):
+                column = self._columns[position] = SerializedColumn.from_column(column)
+                column.append(build_args)
+
+    def extend(self, build_args: Iterable[dict]):
+        """Add a row for each of the args for the model constructor"""
+        for each in build_args:
+            self.append(each)
+
+    def _get_rows(self) -> range:
+        if self._rows is not None:
+            return self._rows
+        return range(len(self._columns[0])) if self._columns else range(0)
+
+    def __len__(self) -> int:
+        return len(self._get_rows())
+
+    def serialized(self, index: int) -> Dict[str, Dict[str, Any]]:
+        """Get a row in serialized form, the same as from Model.serialize(), without creating an instance"""
+        row = self._get_rows()[index]
+        attribute_values = {}
+        for column in self._columns:
+            value = column.attribute_value(row)
+            if value is not None:
+                attribute_values[column.attr_name] = {column.attr_type: value}
+        return attribute_values
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, "ColumnarBatch[T]"]:
+        """Get an instance of the model for a row, or a batch of a slice of the rows"""
+        if isinstance(index, slice):
+            sliced = ColumnarBatch.__new__(ColumnarBatch)
+            sliced.model = self.model
+            sliced._columns = self._columns
+            sliced._rows = self._get_rows()[index]
+            return sliced
+        return self.model.from_raw_data(self.serialized(index))
+
+    def __iter__(self) -> Iterator[T]:
+        """Create an instance of the model for each row, one at a time"""
+        from_raw_data = self.model.from_raw_data
+        return (from_raw_data(item) for item in self.iter_serialized())
+
+    def iter_serialized(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """Serialize each row, one at a time, without creating instances"""
+        columns = [(column.attr_name, column.attr_type, column.attribute_value) for column in self._columns]
+        for row in self._get_rows():
+            attribute_values = {}
+            for attr_name, attr_type, attribute_value in columns:
+                value = attribute_value(row)
+                if value is not None:
+                    attribute_values[attr_name] = {attr_type: value}
+            yield attribute_values
+
+    def to_serialized(self) -> List[Dict[str, Dict[str, Any]]]:
+        """Serialize every row, without creating instances"""
+        return list(self.iter_serialized())
+
+    def column(self, field_name: str) -> List[Any]:
+        """Get the values of one attribute, as they would be on each instance, without creating instances"""
+        for column in self._columns:
+            if column.field_name == field_name:
+                get = column.get
+                return [get(row) for row in self._get_rows()]
+        raise KeyError(field_name)
+    pass
@@ -0,0 +1,338 @@
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+import uuid
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+
+from pynamodb.attributes import Attribute, ListAttribute, MapAttribute
+
+from pynamodb_factories import random_state
+from pynamodb_factories.export import ItemReader, write_binary
+from pynamodb_factories.fields import Use
+
+if TYPE_CHECKING:
+    from pynamodb_factories.factory import PynamoModelFactory
+
+# Bump this when the way entries are keyed or stored changes, so old entries are never read
+CACHE_VERSION = 1
+CACHE_SUFFIX = ".pnmf"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+CACHE_DIR_ENV = "PYNAMODB_FACTORIES_CACHE"
+
+# Class attributes of factories which don't affect what they build
+_IGNORED_ATTRIBUTES = {
+    "__module__", "__qualname__", "__doc__", "__dict__", "__weakref__", "__abstractmethods__", "__annotations__",
+    "__parameters__", "__orig_bases__", "__slots__", "__init_subclass__", "__class_getitem__",
+}
+# Private class attributes of factories which do affect what they build
+_FINGERPRINTED_PRIVATE_ATTRIBUTES = {"_providers", "_factory_registry"}
+_VERSIONED_DISTRIBUTIONS = ("pynamodb-factories", "pynamodb", "Faker", "numpy")
+
+
+def default_cache_dir() -> str:
+    """The directory of the default cache: $PYNAMODB_FACTORIES_CACHE, or pynamodb-factories in the user cache dir"""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if directory:
+        return directory
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pynamodb-factories")
+
+
+def describe(value: Any, _seen: frozenset = frozenset()) -> str:
+    """
+    Describe a value for a fingerprint. The description is the same in every run for values that would build the
+    same instances. Functions are described by their compiled code and the values they close over, classes by their
+    qualified name, and Fakers by their locales and providers.
+    """
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    code = getattr(value, "__code__", None)
+    if code is not None:
+        digest = hashlib.sha256(marshal.dumps(code)).hexdigest()
+        text = f"{getattr(value, '__module__', None)}.{getattr(value, '__qualname__', None)}:{digest}"
+        if id(value) in _seen:
+            # A recursive function closes over itself
+            return text
+        closure = getattr(value, "__closure__", None) or ()
+        cells = [_describe_cell(cell, _seen | {id(value)}) for cell in closure]
+        return f"{text}({', '.join(cells)})" if cells else text
+    if isinstance(value, Use):
+        return f"Use({describe(value.call, _seen)}, {describe(value.args, _seen)}, {describe(value.kwargs, _seen)})"
+    if isinstance(value, Attribute):
+        return describe_attribute(value)
+    if isinstance(value, dict):
+        return "{" + ", ".join(sorted(f"{describe(key, _seen)}: {describe(each, _seen)}"
+                                      for key, each in value.items())) + "}"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(describe(each, _seen) for each in value)) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(describe(each, _seen) for each in value) + "]"
+    if type(value).__module__.split(".")[0] == "faker" and hasattr(value, "random"):
+        return _describe_faker(value)
+    text = repr(value)
+    if " at 0x" in text:
+        # The default repr changes every run, so fall back to the type
+        return describe(type(value))
+    return text
+
+
+def _describe_cell(cell, seen: frozenset) -> str:
+    try:
+        return describe(cell.cell_contents, seen)
+    except ValueError:
+        # The variable hasn't been assigned yet
+        return "<empty>"
+
+
+def _describe_faker(faker) -> str:
+    # A Faker proxy has a generator for each locale. A bare Generator is its own.
+    generators = getattr(faker, "factories", [faker])
+    providers = [sorted(describe(type(provider)) for provider in generator.get_providers()) for generator in generators]
+    return f"Faker({describe(getattr(faker, 'locales', None))}, {describe(providers)})"
+
+
+def describe_attribute(field: Attribute) -> str:
+    """Describe a schema attribute, and the attributes of typed maps and lists, for a fingerprint"""
+    parts = [
+        describe(type(field)), field.attr_name, field.attr_type, f"null={field.null}",
+        f"default={describe(field.default)}", f"hash_key={field.is_hash_key}", f"range_key={field.is_range_key}",
+    ]
+    if isinstance(field, MapAttribute) and type(field) is not MapAttribute:
+        parts.append(describe_attributes(type(field).get_attributes()))
+    if isinstance(field, ListAttribute) and field.element_type is not None:
+        parts.append(f"of={describe(field.element_type)}")
+        if issubclass(field.element_type, MapAttribute):
+            parts.append(describe_attributes(field.element_type.get_attributes()))
+    return "(" + ", ".join(parts) + ")"
+
+
+def describe_attributes(attributes: Dict[str, Attribute]) -> str:
+    return "{" + ", ".join(f"{name}: {describe_attribute(attributes[name])}" for name in sorted(attributes)) + "}"
+
+
+def schema_fingerprint(model: Type[Any]) -> str:
+    """
+    Fingerprint a model schema: the name, type, nullability and default of each attribute, its keys and the keys of
+    its indexes
+
+    Args:
+        model: A PynamoDB model class, or a MapAttribute class
+    Returns:
+        A hex digest, which changes whenever the schema does
+    """
+    parts = [describe(model), describe_attributes(model.get_attributes())]
+    for index_name, index in sorted(getattr(model, "_indexes", {}).items()):
+        attributes = getattr(index.Meta, "attributes", {})
+        parts.append(f"{index_name}: {describe(type(index))} {describe_attributes(attributes)}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def factory_fingerprint(factory: Type["PynamoModelFactory"], _seen: frozenset = frozenset()) -> str:
+    """
+    Fingerprint a factory: its model's schema, and the options, overrides, providers, registered nested factories and
+    methods of the factory and each factory it inherits from. Registered nested factories are fingerprinted too.
+
+    Returns:
+        A hex digest, which changes whenever what the factory builds might
+    """
+    from pynamodb_factories.factory import PynamoModelFactory
+    seen = _seen | {factory}
+    parts = [schema_fingerprint(factory._get_model())]
+    for klass in factory.__mro__:
+        if not (isinstance(klass, type) and issubclass(klass, PynamoModelFactory)):
+            continue
+        for name in sorted(klass.__dict__):
+            if name in _IGNORED_ATTRIBUTES or (name.startswith("_") and not name.startswith("__")
+                                               and name not in _FINGERPRINTED_PRIVATE_ATTRIBUTES):
+                continue
+            value = klass.__dict__[name]
+            if name == "_factory_registry":
+                # A factory registered for a recursive map can be registered on itself, so only name it the second time
+                value = {model: describe(nested) if nested in seen else factory_fingerprint(nested, seen)
+                         for model, nested in value.items()}
+            parts.append(f"{describe(klass)}.{name} = {describe(value)}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def library_versions() -> str:
+    """
+    The versions of the libraries which decide what a factory builds. When this library isn't installed, as in a
+    checkout of its source, its source files are hashed instead.
+    """
+    from importlib import metadata
+    versions = []
+    for distribution in _VERSIONED_DISTRIBUTIONS:
+        try:
+            versions.append(f"{distribution}=={metadata.version(distribution)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{distribution}=={_source_digest() if distribution == 'pynamodb-factories' else None}")
+    return ", ".join(versions)
+
+
+def _source_digest() -> str:
+    package = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(package)):
+        if name.endswith(".py"):
+            with open(os.path.join(package, name), "rb") as f:
+                digest.update(name.encode("utf-8"))
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+class FixtureCache:
+    """
+    A cache of seeded batches of instances on local disk, so identical datasets are only built once across test
+    runs. Each batch is stored in the binary format of PynamoModelFactory.export(), keyed by a fingerprint of the
+    factory, its model's schema, the default Faker configuration, the versions of the libraries which generate it, the
+    seed and the build kwargs.
+
+    Batches are built with build_range(), so a cached batch is the same as a freshly built one. When the cache grows
+    past max_bytes, the least recently used batches are removed.
+
+    Args:
+        directory: (Optional) The directory to keep batches in. Defaults to default_cache_dir().
+        max_bytes: (Optional) The size to keep the cache under. Defaults to 512 MiB.
+        enabled: (Optional) Whether to use the cache at all. When False, every batch is built into a temporary file,
+            which build_batch() removes once it's read.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES, enabled: bool = True):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, factory: Type["PynamoModelFactory"], n: int, seed: Any, kwargs: Dict[str, Any]) -> str:
+        """The cache key of a batch"""
+        # Factories without a __faker__ of their own use the Faker configured by configure_default_faker()
+        parts = [CACHE_VERSION, factory_fingerprint(factory), describe(random_state._faker_config), library_versions(),
+                 n, describe(seed), describe(kwargs)]
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+    def path(self, factory: Type["PynamoModelFactory"], key: str) -> str:
+        return os.path.join(self.directory, f"{factory._get_model().__name__}-{key[:32]}{CACHE_SUFFIX}")
+
+    def load(self, factory: Type["PynamoModelFactory"], n: int, seed: Any = 0, **kwargs) -> ItemReader:
+        """
+        Get a reader of a cached batch, building and storing it first if it isn't cached. Close the reader when
+        you're done with it.
+
+        Args:
+            factory: The factory to build the batch with
+            n: The number of instances in the batch
+            seed: (Optional) The seed for the batch. See build_range. Defaults to 0.
+            kwargs: Build kwargs shared by every instance. They must describe the same way in every run, so they
+                can't be objects without a repr of their own.
+        """
+        model = factory._get_model()
+        if not self.enabled:
+            self.misses += 1
+            handle, path = tempfile.mkstemp(suffix=CACHE_SUFFIX)
+            os.close(handle)
+            write_binary(path, model, factory.build_range(0, n, seed, serialized=True, **kwargs))
+            return ItemReader(path, model)
+        path = self.path(factory, self.key(factory, n, seed, kwargs))
+        if os.path.exists(path):
+            try:
+                reader = ItemReader(path, model)
+            except (OSError, ValueError):
+                # Damaged, or written by another version of Python. Build it again.
+                pass
+            else:
+                self.hits += 1
+                # Mark the batch as recently used
+                os.utime(path)
+                return reader
+        self.misses += 1
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first, so concurrent test runs never read a partial batch
+        temporary = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            write_binary(temporary, model, factory.build_range(0, n, seed, serialized=True, **kwargs))
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        self.evict(keep=path)
+        return ItemReader(path, model)
+
+    def build_batch(self, factory: Type["PynamoModelFactory"], n: int, seed: Any = 0, serialized: bool = False,
+                    **kwargs) -> list:
+        """
+        Get a cached batch as a list, building and storing it first if it isn't cached. See load.
+
+        Returns:
+            A list of instances of the factory's __model__, or their serialized form
+        """
+        reader = self.load(factory, n, seed, **kwargs)
+        try:
+            return list(reader.iter_serialized() if serialized else reader)
+        finally:
+            reader.close()
+            if not self.enabled:
+                os.remove(reader.path)
+
+    def entries(self) -> List[str]:
+        """The paths of the cached batches, from least to most recently used"""
+        if not os.path.isdir(self.directory):
+            return []
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if name.endswith(CACHE_SUFFIX)]
+        return sorted(paths, key=_modified)
+
+    def evict(self, keep: Optional[str] = None):
+        """Remove the least recently used batches until the cache is under max_bytes"""
+        entries = [(path, _size(path)) for path in self.entries()]
+        total = sum(size for _, size in entries)
+        for path, size in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Remove every cached batch"""
+        for path in self.entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    pass
+
+
+def _modified(path: str) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+def _size(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+_default_cache: Optional[FixtureCache] = None
+
+
+def default_cache() -> FixtureCache:
+    """The cache used by PynamoModelFactory.build_batch_cached() when it isn't given one"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = FixtureCache()
+    return _default_cache
@@ -0,0 +1,90 @@
+from bisect import bisect
+from datetime import datetime, timezone
+from importlib.util import find_spec
+from random import Random
+from typing import List, Optional, Union, Any
+
+
+def numpy_available() -> bool:
+    """Whether NumPy is installed. This doesn't import it, so it doesn't slow down importing this package."""
+    return find_spec("numpy") is not None
+
+
+class ColumnGenerator:
+    """
+    Generates whole columns of scalar attribute values at once, for vectorized batch builds.
+
+    Uses a numpy.random.Generator when NumPy is installed, and falls back to a random.Random otherwise. The two
+    backends produce different values for the same seed.
+
+    Args:
+        seed: (Optional) Any seed random.Random takes, or an existing numpy.random.Generator to draw from
+        use_numpy: (Optional) Whether to use NumPy. Defaults to True when NumPy is installed.
+    """
+
+    def __init__(self, seed: Optional[Union[int, Any]] = None, use_numpy: Optional[bool] = None):
+        if use_numpy is None:
+            use_numpy = numpy_available()
+        self._numpy = None
+        if use_numpy:
+            import numpy
+            self._numpy = numpy
+        self.use_numpy = use_numpy
+        self.seed(seed)
+
+    def seed(self, seed: Optional[Union[int, Any]] = None):
+        """Reset the random state with a known seed, or a numpy.random.Generator"""
+        if self.use_numpy:
+            random = self._numpy.random
+            if isinstance(seed, random.Generator):
+                self._rng = seed
+                return
+            if seed is not None and not (type(seed) is int and seed >= 0):
+                # NumPy only takes non-negative ints, so derive one from any seed random.Random takes
+                seed = Random(seed).getrandbits(128)
+            self._rng = random.default_rng(seed)
+        else:
+            self._rng = Random(seed)
+
+    def integers(self, n: int, low: int, high: int) -> List[int]:
+        """Generate n ints between low and high, inclusive"""
+        if self.use_numpy:
+            return self._rng.integers(low, high, size=n, endpoint=True).tolist()
+        randint = self._rng.randint
+        return [randint(low, high) for _ in range(n)]
+
+    def booleans(self, n: int) -> List[bool]:
+        """Generate n bools"""
+        if self.use_numpy:
+            return self._rng.integers(0, 1, size=n, endpoint=True, dtype=self._numpy.bool_).tolist()
+        getrandbits = self._rng.getrandbits
+        return [bool(getrandbits(1)) for _ in range(n)]
+
+    def choices(self, n: int, cum_weights: List[float]) -> List[int]:
+        """Generate n indexes into a list of cumulative weights, each chosen with the probability of its weight"""
+        total = cum_weights[-1]
+        last = len(cum_weights) - 1
+        if self.use_numpy:
+            indexes = self._numpy.searchsorted(cum_weights, self._rng.random(n) * total, side="right")
+            return self._numpy.minimum(indexes, last).tolist()
+        random = self._rng.random
+        return [min(bisect(cum_weights, random() * total), last) for _ in range(n)]
+
+    def datetimes(self, n: int, start: datetime, end: datetime) -> List[datetime]:
+        """
+        Generate n UTC datetimes between start and end, to the second. The range usually ends at the current time, so
+        the datetimes are scaled from floats, which draw the same amount of the random state whatever the range is.
+        Drawing bounded ints instead would change every column drawn after this one as soon as the clock ticked.
+        """
+        low = int(start.timestamp())
+        span = int(end.timestamp()) - low + 1
+        if self.use_numpy:
+            numpy = self._numpy
+            offsets = numpy.minimum((self._rng.random(n) * span).astype(numpy.int64), span - 1)
+            seconds = (offsets + low).tolist()
+        else:
+            random = self._rng.random
+            seconds = [low + min(int(random() * span), span - 1) for _ in range(n)]
+        from_timestamp = datetime.fromtimestamp
+        return [from_timestamp(s, timezone.utc) for s in seconds]
+    pass
@@ -0,0 +1,209 @@
+import json
+import marshal
+import mmap
+import struct
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from pynamodb.models import Model as PynamoModel
+
+JSONL = "jsonl"
+BINARY = "binary"
+FORMATS = (JSONL, BINARY)
+
+# The binary format is a header, the attribute names and types as JSON, one record per item, and an index of the
+# offset of each record, followed by the end of the last one. A record is the marshalled tuple of the item's raw
+# attribute values, in column order, with None for missing attributes. The types are stored once in the columns.
+MAGIC = b"PNMF"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHQQI")
+
+Item = Dict[str, Dict[str, Any]]
+
+
+def write_jsonl(path: str, items: Iterable[Item]) -> int:
+    """
+    Write serialized items as JSON lines, in the same format as a DynamoDB export to S3
+
+    Args:
+        path: The file to write
+        items: Serialized items, as from Model.serialize()
+    Returns:
+        The number of items written
+    """
+    written = 0
+    dumps = json.JSONEncoder(separators=(",", ":")).encode
+    with open(path, "w", encoding="utf-8") as f:
+        for item in items:
+            f.write(dumps({"Item": item}))
+            f.write("\n")
+            written += 1
+    return written
+
+
+def write_binary(path: str, model: Type[PynamoModel], items: Iterable[Item]) -> int:
+    """
+    Write serialized items in the compact binary format
+
+    Args:
+        path: The file to write
+        model: The model class of the items, which decides the columns
+        items: Serialized items, as from Model.serialize()
+    Returns:
+        The number of items written
+    """
+    columns = [(field.attr_name, field.attr_type) for field in model.get_attributes().values()]
+    columns_json = json.dumps(columns).encode("utf-8")
+    offsets = array("Q")
+    dumps = marshal.dumps
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version, 0, 0, len(columns_json)))
+        f.write(columns_json)
+        offset = f.tell()
+        for item in items:
+            values = []
+            for attr_name, attr_type in columns:
+                attribute_value = item.get(attr_name)
+                values.append(None if attribute_value is None else attribute_value[attr_type])
+            record = dumps(tuple(values))
+            offsets.append(offset)
+            f.write(record)
+            offset += len(record)
+        offsets.append(offset)
+        if offsets.itemsize != 8:
+            raise RuntimeError("array('Q') must be 8 bytes")
+        offsets.tofile(f)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version, len(offsets) - 1, offset, len(columns_json)))
+    return len(offsets) - 1
+
+
+class ItemReader:
+    """
+    Reads items written by write_jsonl or write_binary, by memory-mapping the file. Items are only parsed when they're
+    accessed, either by index or by iterating.
+
+    The binary format uses marshal, so only read files you wrote, with the same major version of Python.
+
+    Args:
+        path: The file to read
+        model: (Optional) The model class to build instances of. Without it, only the serialized items can be read.
+    """
+
+    def __init__(self, path: str, model: Optional[Type[PynamoModel]] = None):
+        self.path = path
+        self.model = model
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file can't be mapped
+            self._map = b""
+        self._offsets: Optional[memoryview] = None
+        self._columns: List[Tuple[str, str]] = []
+        if self._map[:len(MAGIC)] == MAGIC:
+            self.format = BINARY
+            try:
+                self._read_binary_header()
+            except Exception:
+                self.close()
+                raise
+        else:
+            self.format = JSONL
+
+    def _read_binary_header(self):
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{self.path} is truncated")
+        magic, version, marshal_version, length, index_offset, columns_length = HEADER.unpack_from(self._map)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} is format version {version}, not {FORMAT_VERSION}")
+        if marshal_version != marshal.version:
+            raise ValueError(f"{self.path} was written with marshal version {marshal_version}, not {marshal.version}")
+        start = HEADER.size
+        self._columns = [tuple(column) for column in json.loads(self._map[start:start + columns_length])]
+        self._offsets = memoryview(self._map)[index_offset:index_offset + (length + 1) * 8].cast("Q")
+
+    def _get_offsets(self) -> memoryview:
+        if self._offsets is None:
+            # Index the lines of a JSONL file the first time an item is accessed by index
+            offsets = array("Q", [0])
+            find = self._map.find
+            position = find(b"\n")
+            while position != -1:
+                offsets.append(position + 1)
+                position = find(b"\n", position + 1)
+            if offsets[-1] != len(self._map):
+                offsets.append(len(self._map))
+            self._offsets = memoryview(offsets)
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self._get_offsets()) - 1
+
+    def serialized(self, index: int) -> Item:
+        """Get the serialized item at an index"""
+        offsets = self._get_offsets()
+        if index < 0:
+            index += len(offsets) - 1
+        if not 0 <= index < len(offsets) - 1:
+            raise IndexError("item index out of range")
+        return self._parse(self._map[offsets[index]:offsets[index + 1]])
+
+    def __getitem__(self, index: int) -> PynamoModel:
+        """Get the instance of the model at an index"""
+        return self._get_model().from_raw_data(self.serialized(index))
+
+    def iter_serialized(self) -> Iterator[Item]:
+        """Stream the serialized items in order"""
+        if self.format == JSONL:
+            # Stream the lines, without indexing them first
+            map_ = self._map
+            start = 0
+            end = len(map_)
+            while start < end:
+                newline = map_.find(b"\n", start)
+                stop = end if newline == -1 else newline
+                if stop > start:
+                    yield self._parse(map_[start:stop])
+                start = stop + 1
+            return
+        offsets = self._get_offsets()
+        parse = self._parse
+        map_ = self._map
+        for index in range(len(offsets) - 1):
+            yield parse(map_[offsets[index]:offsets[index + 1]])
+
+    def __iter__(self) -> Iterator[PynamoModel]:
+        """Stream the instances of the model in order"""
+        from_raw_data = self._get_model().from_raw_data
+        return (from_raw_data(item) for item in self.iter_serialized())
+
+    def _parse(self, record: bytes) -> Item:
+        if self.format == JSONL:
+            return json.loads(record)["Item"]
+        return {
+            attr_name: {attr_type: value}
+            for (attr_name, attr_type), value in zip(self._columns, marshal.loads(record))
+            if value is not None
+        }
+
+    def _get_model(self) -> Type[PynamoModel]:
+        if self.model is None:
+            raise ValueError("a model class is needed to build instances")
+        return self.model
+
+    def close(self):
+        if isinstance(self._offsets, memoryview):
+            # The map can't be closed while the index still views it
+            self._offsets.release()
+        self._offsets = None
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+    pass
@@ -1,30 +1,78 @@
-from abc import ABC
-from datetime import timezone
-from random import random, seed as random_seed, randint
-from typing import Generic, Type, Optional, TypeVar, cast, Union, Any
+from abc import ABC, ABCMeta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+from threading import Lock
+from time import perf_counter
+from random import Random
+from typing import TYPE_CHECKING, Generic, Type, Optional, TypeVar, cast, Union, Any, Callable, Dict, List, Tuple, Iterable, Iterator, AsyncIterator
 
-from faker import Faker
 from pynamodb.models import Model as PynamoModel
-from pynamodb.attributes import (
-    Attribute, BinaryAttribute, BinarySetAttribute, UnicodeAttribute, UnicodeSetAttribute, JSONAttribute,
-    BooleanAttribute, NumberAttribute, NumberSetAttribute, VersionAttribute, TTLAttribute, UTCDateTimeAttribute,
-    NullAttribute, MapAttribute, ListAttribute
-)
-
-try:
-    from pynamodb.attributes import DynamicMapAttribute
-except ImportError:
-    DynamicMapAttribute = None
-    pass
+from pynamodb.attributes import Attribute, BinaryAttribute, MapAttribute, UnicodeAttribute, VersionAttribute
+from pynamodb.constants import MAP
+from pynamodb.indexes import Index
 
+from pynamodb_factories.columns import ColumnGenerator
 from pynamodb_factories.exceptions import UnsupportedException, ModelError, RequiredArgumentError
 from pynamodb_factories.fields import Use, Required, Ignored
+from pynamodb_factories.instrumentation import FactoryStats, DEFAULT, NONE, OVERRIDE, GENERATED, REQUIRED, IGNORED
+from pynamodb_factories.keys import KeyDistribution, KeySpace, compile_key_value
+from pynamodb_factories.parallel import DEFAULT_CHUNK_SIZE, iter_build_parallel
+from pynamodb_factories.pools import ValuePool
+from pynamodb_factories.providers import DEFAULT_PROVIDERS, PROVIDER_COLUMNS, Provider, Column, fake_map, fake_list
+from pynamodb_factories.random_state import RandomState, configure_default_faker, index_seed
+from pynamodb_factories.saving import SaveResult, save_models
+from pynamodb_factories.serialization import SerializedValue, Serializer, compile_serializer, serialize_build_args
+from pynamodb_factories.sizes import MAX_ITEM_BYTES, compile_sizer, resize_binary, resize_text, utf8_size
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+    from pynamodb_factories.batch import ColumnarBatch
+    from pynamodb_factories.cache import FixtureCache
+    from pynamodb_factories.export import ItemReader
+    from pynamodb_factories.pipeline import PipelineMetrics
+    from pynamodb_factories.prototype import Prototype
 
 T = TypeVar("T", bound=Union[PynamoModel, Attribute])
-default_faker = Faker()
+
+# Incremented whenever an attribute is assigned on any factory class. Compiled build plans record the generation they
+# were compiled in, and are recompiled when it no longer matches.
+_plan_generation = count()
+_current_generation = next(_plan_generation)
+
+BuildStep = Callable[[dict, dict], None]
+ItemKwargs = Optional[Union[Callable[[int], dict], Iterable[dict]]]
+
+# Vectorized batch builds generate scalar values this many items at a time
+VECTORIZED_CHUNK_SIZE = 1024
+
+# Nested factories are created on demand for typed MapAttributes and ListAttribute(of=...). They're kept in a bounded
+# LRU cache, so that each build doesn't mint a new factory class.
+NESTED_FACTORY_CACHE_SIZE = 256
+_nested_factories: "OrderedDict[tuple, Type[PynamoModelFactory]]" = OrderedDict()
+_nested_factories_lock = Lock()
+_random_state_lock = Lock()
+
+
+class _FactoryMeta(ABCMeta):
+    """Invalidates compiled build plans when factory class attributes change"""
+
+    def __setattr__(cls, name, value):
+        _invalidate_plans()
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name):
+        _invalidate_plans()
+        super().__delattr__(name)
+
+
+def _invalidate_plans():
+    global _current_generation
+    _current_generation = next(_plan_generation)
 
 
-class PynamoModelFactory(ABC, Generic[T]):
+class PynamoModelFactory(ABC, Generic[T], metaclass=_FactoryMeta):
     """
     This class is used to define a factory for the provided Pynamodb model.
     To get a factory class, inherit this class and assign the desired Pynamodb model schema class to the __model__ attr.
@@ -46,27 +94,88 @@ class PynamoModelFactory(ABC, Generic[T]):
 
     Attributes:
         __model__: The schema to generate fake models of
-        __faker__: (Optional) Your own custom configured Faker instance
+        __faker__: (Optional) Your own custom configured Faker instance. Each thread builds with its own copy of it,
+            which draws from the factory's random state.
         __allow_nulls__: (Optional) Whether to allow None values in attributes which can accept them. Defaults to True.
         __allow_empty__: (Optional) Whether to allow collection attributes to have zero length. Defaults to True.
         __raise_unsupported: (Optional) Whether to raise an exception when an unsupported attribute is encounterd.
             Defaults to False. As of PynamoDB 5.3.x, only the DiscriminatorAttribute is unsupported. Raising can make
             this issue easier to identify. Suppressing the exception allows you to provide handling for it yourself.
             To do this, override the set_field() method in your factory class.
+        __vectorize__: (Optional) Whether batch builds should generate number, boolean, version, TTL and datetime
+            attributes a whole column at a time, instead of one value at a time with Faker. Defaults to False.
+        __columns__: (Optional) Your own ColumnGenerator to use for vectorized batch builds
+        __pool_size__: (Optional) When set, sentences, words and JSON and raw map values are sampled from a pool of
+            up to this many pre-generated values, instead of being generated by Faker every time. Defaults to 0, which
+            turns pooling off.
+        __pool_refresh__: (Optional) The chance, from 0 to 1, that sampling from a pool first replaces a random pool
+            member with a newly generated value. Defaults to 0.
+        __instrument__: (Optional) Whether to count and time the building of each attribute, and record which path
+            each build took. Get the counters with get_stats(). Defaults to False, which adds no overhead.
+        __unique_keys__: (Optional) Whether to generate unique hash and range keys, so a batch of instances can be
+            saved without overwriting each other. Keys are allocated from a permuted counter, shared by every thread
+            using the factory's random state, and restarted by set_random_seed(). Defaults to False.
+        __hash_key_cardinality__: (Optional) With __unique_keys__, the number of distinct hash keys to spread the
+            instances over. The range keys are unique instead, so the model must have one. Defaults to None, which
+            makes every hash key unique.
+        __hash_key_skew__: (Optional) The exponent of a Zipf distribution of instances over the hash keys, to
+            simulate hot partitions. Defaults to 0, which spreads them uniformly.
+        __index_keys__: (Optional) A KeyDistribution for the hash key of some of the model's secondary indexes, by
+            index name or by the name of the index attribute on the model. Each index hash key then takes one of a
+            fixed number of values, instead of a new random value for every instance, so queries fan out like they
+            would against real data. Nullable index keys are still left out of some instances, like a sparse index,
+            unless __allow_nulls__ is False.
+        __index_range_keys__: (Optional) A KeyDistribution for the range key of some of the model's secondary indexes
+        __collection_sizes__: (Optional) The number of elements to generate for some of the set and list attributes,
+            by attribute name. Each is either a number, a (low, high) range to draw it from, or a callable taking the
+            factory's random.Random and returning it. Names apply to the attributes of nested maps too. Others get
+            up to 5 elements.
+        __target_item_bytes__: (Optional) The size to make each instance, as DynamoDB counts it, or a (low, high)
+            range to draw each instance's size from. Generated string and binary attributes are padded or truncated
+            to reach it. Keys, overrides and build args are left alone, so an instance with too few other string and
+            binary attributes can miss it. Defaults to None, which leaves sizes alone.
+        __lazy__: (Optional) Whether build() and non-vectorized batch builds should build lazily, generating each
+            attribute when it's first read. See build_lazy(). Defaults to False.
 
     """
 
     __model__: Type[T]
-    __faker__: Optional[Faker]
+    __faker__: Optional["Faker"]
     __allow_nulls__: bool = True
     __allow_empty__: bool = True
     __raise_unsupported__: bool = False
+    __vectorize__: bool = False
+    __columns__: Optional[ColumnGenerator]
+    __pool_size__: int = 0
+    __pool_refresh__: float = 0.0
+    __instrument__: bool = False
+    __unique_keys__: bool = False
+    __hash_key_cardinality__: Optional[int] = None
+    __hash_key_skew__: float = 0.0
+    __index_keys__: Dict[str, KeyDistribution] = {}
+    __index_range_keys__: Dict[str, KeyDistribution] = {}
+    __collection_sizes__: Dict[str, Union[int, Tuple[int, int], Callable[[Random], int]]] = {}
+    __target_item_bytes__: Optional[Union[int, Tuple[int, int]]] = None
+    __lazy__: bool = False
+    _random_state: RandomState = RandomState()
+    _key_spaces: Dict[tuple, KeySpace] = {}
+    _providers: Dict[Type[Attribute], Provider] = dict(DEFAULT_PROVIDERS)
 
     @classmethod
     def set_random_seed(cls, seed):
-        """Set a known random seed to make your tests reproducible"""
-        Faker.seed(seed)
-        random_seed(seed)
+        """
+        Set a known random seed to make your tests reproducible. This gives the factory its own random state, shared
+        with its subclasses and nested factories, so it doesn't affect other factories. The seed only applies to the
+        calling thread. Other threads should set their own seed.
+        """
+        with _random_state_lock:
+            if "_random_state" not in cls.__dict__:
+                cls._random_state = RandomState()
+                cls._key_spaces = {}
+        cls._random_state.seed(seed)
+        cls._key_spaces.clear()
+        if hasattr(cls, "__columns__") and cls.__columns__:
+            cls.__columns__.seed(seed)
 
     @classmethod
     def build(cls, **kwargs) -> T:
@@ -79,20 +188,529 @@ class PynamoModelFactory(ABC, Generic[T]):
         Returns:
             An instance of the __model__ schema class
         """
-        keys = []
-        for field_name, field in cls._get_model().get_attributes().items():
-            keys.append(field_name)
-            if cls.should_set_field_default(field_name=field_name, field=field):
-                # Leave the field out of the dict and PynamoDB will set the default value on creation
-                pass
-            elif isinstance(field, Attribute):
-                build_arg, required = cls._build_field(field_name=field_name, field=field, build_arg=kwargs.get(field_name))
-                if required and field_name not in kwargs:
-                    raise RequiredArgumentError(f"Required argument {field_name} was not in the build kwargs")
-                kwargs.update(build_arg)
-        build_args = dict(filter(lambda item: item[0] in keys, kwargs.items()))
+        if cls.__lazy__:
+            return cls.build_lazy(**kwargs)
+        build_args = {}
+        for step in cls._get_plan():
+            step(kwargs, build_args)
         return cast(T, cls.__model__(**build_args))
 
+    @classmethod
+    def build_lazy(cls, **kwargs) -> T:
+        """
+        Builds an instance of the factory's __model__ which only generates each attribute when it's first read,
+        including when the instance is serialized or saved. Keys, attributes in the build kwargs and attributes the
+        factory marks Required or Ignored are set straight away, so missing required kwargs still raise here. The
+        rest follow the same overrides and null and default decisions as build(), but a seeded lazy build generates
+        different values than an eager one, since they're drawn in the order they're read.
+
+        Factories with __target_item_bytes__ build eagerly, since sizing an instance needs every attribute.
+
+        Args:
+            kwargs: Will be trimmed to remove extraneous items and used as the values of the instance
+
+        Returns:
+            An instance of the __model__ schema class
+        """
+        eager, lazy = cls._get_lazy_plan()
+        if lazy is None:
+            build_args = {}
+            for step in cls._get_plan():
+                step(kwargs, build_args)
+            return cast(T, cls.__model__(**build_args))
+        build_args = {}
+        for step in eager:
+            step(kwargs, build_args)
+        pending = {}
+        for field_name, step in lazy.items():
+            if field_name in kwargs:
+                # The build arg may only be part of the value, like the kwargs for a nested map
+                step(kwargs, build_args)
+            else:
+                pending[field_name] = step
+        instance = cls.__model__(**build_args)
+        if pending:
+            from pynamodb_factories.lazy import LazyAttributeValues
+            instance.attribute_values = LazyAttributeValues(instance.attribute_values, instance, kwargs, pending)
+        return cast(T, instance)
+
+    @classmethod
+    def build_batch(cls, n: int, item_kwargs: ItemKwargs = None, **kwargs) -> List[T]:
+        """
+        Builds a list of instances of the factory's __model__
+
+        Args:
+            n: The number of instances to build
+            item_kwargs: (Optional) Build kwargs that vary per instance. Either a callable which takes the index of the
+                instance and returns a dict, or an iterable of dicts. These are merged over the shared kwargs.
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            A list of instances of the __model__ schema class
+        """
+        return list(cls.iter_build(n, item_kwargs, **kwargs))
+
+    @classmethod
+    def iter_build(cls, n: Optional[int] = None, item_kwargs: ItemKwargs = None, **kwargs) -> Iterator[T]:
+        """
+        Lazily builds instances of the factory's __model__, one at a time
+
+        Args:
+            n: (Optional) The number of instances to build. If omitted, builds until item_kwargs is exhausted, or
+                forever if there are no item_kwargs.
+            item_kwargs: (Optional) Build kwargs that vary per instance. Either a callable which takes the index of the
+                instance and returns a dict, or an iterable of dicts. These are merged over the shared kwargs.
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            A generator of instances of the __model__ schema class
+        """
+        if cls.__vectorize__:
+            yield from cls._iter_build_vectorized(n, item_kwargs, kwargs)
+            return
+        if cls.__lazy__:
+            for build_kwargs in _iter_build_kwargs(n, item_kwargs, kwargs):
+                yield cls.build_lazy(**build_kwargs)
+            return
+        plan = cls._get_plan()
+        model = cls._get_model()
+        for build_kwargs in _iter_build_kwargs(n, item_kwargs, kwargs):
+            build_args = {}
+            for step in plan:
+                step(build_kwargs, build_args)
+            yield cast(T, model(**build_args))
+
+    @classmethod
+    def build_at(cls, index: int, seed: Optional[int] = None, **kwargs) -> T:
+        """
+        Builds the instance at one position of a seeded run. Each instance is a pure function of the seed, the factory
+        and the index, so a single instance can be rebuilt on its own, and separate processes can build disjoint
+        ranges of the same run without coordinating. See build_range.
+
+        This doesn't change the factory's random state for other builds. Value pools aren't used, because pooled values
+        depend on the instances built before. Registered nested factories with their own random state, from
+        set_random_seed(), keep drawing from it.
+
+        Args:
+            index: The position of the instance in the run
+            seed: (Optional) The seed for the run. Defaults to the seed last set in the calling thread, or 0.
+            kwargs: Will be trimmed to remove extraneous items and passed to the schema constructor
+
+        Returns:
+            An instance of the __model__ schema class
+        """
+        return cls._build_range(index, index + 1, seed, None, kwargs, False)[0]
+
+    @classmethod
+    def build_range(cls, start: int, stop: int, seed: Optional[int] = None, serialized: bool = False,
+                    item_kwargs: ItemKwargs = None, **kwargs) -> list:
+        """
+        Builds the instances at positions start to stop, exclusive, of a seeded run. Each instance is the same as from
+        build_at() with its index, so splitting a run into ranges doesn't change it.
+
+        Args:
+            start: The position of the first instance
+            stop: The position after the last instance
+            seed: (Optional) The seed for the run. Defaults to the seed last set in the calling thread, or 0.
+            serialized: (Optional) Build the serialized form of each instance, as from build_serialized(), instead of
+                the instance itself
+            item_kwargs: (Optional) Build kwargs that vary per instance. Either a callable which takes the position of
+                the instance in the run and returns a dict, or an iterable of dicts, starting with the one for start.
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            A list of instances of the __model__ schema class, or their serialized form
+        """
+        return cls._build_range(start, stop, seed, item_kwargs, kwargs, serialized)
+
+    @classmethod
+    def mutate(cls, instance: T, fields: Optional[Iterable[str]] = None, fraction: Optional[float] = None,
+               bump_version: bool = True, **kwargs) -> T:
+        """
+        Builds a variant of an instance, with only some of its attributes regenerated. The rest of the values are
+        shared with the instance, not copied, so treat them as read-only, and assign new values instead of changing
+        them in place. This costs in proportion to the regenerated attributes, not the whole instance.
+
+        Args:
+            instance: The instance of the __model__ schema class to vary
+            fields: (Optional) The names of the attributes to regenerate
+            fraction: (Optional) The fraction of the attributes to regenerate, chosen at random, from 0 to 1. Key and
+                version attributes, and attributes the factory marks Required or Ignored or sets to a constant,
+                aren't chosen. Any fraction above 0 regenerates at least one attribute, and 0
+                regenerates none. If neither fields nor fraction are given, one attribute is regenerated.
+            bump_version: (Optional) Whether to add 1 to any VersionAttribute. Defaults to True.
+            kwargs: Build kwargs for the regenerated attributes. Attributes in kwargs are always regenerated.
+
+        Returns:
+            A new instance of the __model__ schema class
+        """
+        steps, candidates, versions, size_step = cls._get_mutation_plan()
+        if fields is None:
+            if fraction is None:
+                size = 1
+            elif not 0 <= fraction <= 1:
+                raise ValueError(f"fraction must be between 0 and 1, not {fraction}")
+            else:
+                # Any fraction above 0 regenerates at least one attribute
+                size = max(round(fraction * len(candidates)), 1) if fraction else 0
+            fields = cls.get_random().sample(candidates, min(size, len(candidates)))
+        fields = {*fields, *(field_name for field_name in kwargs if field_name in steps)}
+        unknown = fields - steps.keys()
+        if unknown:
+            raise ValueError(f"{cls._get_model().__name__} has no attributes {', '.join(sorted(unknown))}")
+
+        build_args = {field_name: value for field_name, value in instance.attribute_values.items()
+                      if field_name not in fields}
+        # Regenerate in schema order, so the same seed always draws the same values
+        for field_name, step in steps.items():
+            if field_name in fields:
+                step(kwargs, build_args)
+        if bump_version:
+            for field_name in versions:
+                if field_name not in kwargs:
+                    build_args[field_name] = (build_args.get(field_name) or 0) + 1
+        if size_step is not None:
+            # Only resize the regenerated attributes, by passing the rest as if they were build kwargs
+            size_step((build_args.keys() - fields) | kwargs.keys(), build_args)
+        return cast(T, cls._get_model()(**build_args))
+
+    @classmethod
+    def build_variants(cls, base: T, n: int, fields: Optional[Iterable[str]] = None, fraction: Optional[float] = None,
+                       bump_version: bool = True, **kwargs) -> List[T]:
+        """
+        Builds a list of variants of an instance, like a stream of updates to it. Each variant is a mutation of the
+        one before it. See mutate.
+        """
+        return list(cls.iter_variants(base, n, fields, fraction, bump_version, **kwargs))
+
+    @classmethod
+    def iter_variants(cls, base: T, n: Optional[int] = None, fields: Optional[Iterable[str]] = None,
+                      fraction: Optional[float] = None, bump_version: bool = True, **kwargs) -> Iterator[T]:
+        """
+        Lazily builds variants of an instance, like a stream of updates to it. Each variant is a mutation of the one
+        before it. See mutate.
+
+        Args:
+            base: The instance of the __model__ schema class to start from
+            n: (Optional) The number of variants to build. If omitted, builds forever.
+        """
+        fields = list(fields) if fields is not None else None
+        variant = base
+        for _ in count() if n is None else range(n):
+            variant = cls.mutate(variant, fields, fraction, bump_version, **kwargs)
+            yield variant
+
+    @classmethod
+    def prototype(cls, varying: Optional[Iterable[str]] = None, **kwargs) -> "Prototype[T]":
+        """
+        Builds a template instance, and returns a Prototype which builds new instances by cloning it. Only the varying
+        attributes are generated for each instance: keys, attributes the factory overrides with a Use, a callable or
+        Required, and any named in varying. The rest are the template's, with sets, lists and maps copied.
+
+        Args:
+            varying: (Optional) The names of more attributes to generate for each instance
+            kwargs: Build kwargs for the template. Attributes in them aren't varying, even if they're keys.
+
+        Returns:
+            A Prototype. Keep it for as long as you build from it.
+        """
+        steps, _, _, size_step = cls._get_mutation_plan()
+        varying = {*(varying or ()), *cls._get_varying_fields()} - kwargs.keys()
+        unknown = varying - steps.keys()
+        if unknown:
+            raise ValueError(f"{cls._get_model().__name__} has no attributes {', '.join(sorted(unknown))}")
+        template = {}
+        for step in cls._get_plan():
+            step(kwargs, template)
+        varying_steps = {field_name: step for field_name, step in steps.items() if field_name in varying}
+        from pynamodb_factories.prototype import Prototype
+        return Prototype(cls._get_model(), template, varying_steps, size_step)
+
+    @classmethod
+    def build_serialized(cls, **kwargs) -> Dict[str, Dict[str, Any]]:
+        """
+        Builds an instance of the factory's __model__ directly in DynamoDB's serialized form, the same as from
+        Model.serialize(), without creating the instance. Nested maps and lists of maps are built in serialized form
+        too.
+
+        Args:
+            kwargs: Will be trimmed to remove extraneous items and used as the values of the instance
+
+        Returns:
+            A dict of AttributeValues, keyed by each attribute's attr_name
+        """
+        plan, serializers = cls._get_serialized_plan()
+        build_args = {}
+        for step in plan:
+            step(kwargs, build_args)
+        return serialize_build_args(serializers, build_args)
+
+    @classmethod
+    def build_batch_serialized(cls, n: int, item_kwargs: ItemKwargs = None,
+                               **kwargs) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Builds a list of instances of the factory's __model__ in DynamoDB's serialized form. See build_serialized and
+        build_batch.
+        """
+        return list(cls.iter_build_serialized(n, item_kwargs, **kwargs))
+
+    @classmethod
+    def iter_build_serialized(cls, n: Optional[int] = None, item_kwargs: ItemKwargs = None,
+                              **kwargs) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """
+        Lazily builds instances of the factory's __model__ in DynamoDB's serialized form. See build_serialized and
+        iter_build.
+        """
+        plan, serializers = cls._get_serialized_plan()
+        for build_kwargs in _iter_build_kwargs(n, item_kwargs, kwargs):
+            build_args = {}
+            for step in plan:
+                step(build_kwargs, build_args)
+            yield serialize_build_args(serializers, build_args)
+
+    @classmethod
+    def build_columnar(cls, n: int, item_kwargs: ItemKwargs = None, **kwargs) -> "ColumnarBatch[T]":
+        """
+        Builds a batch of instances of the factory's __model__, stored column by column instead of as instances.
+        Numbers, booleans and datetimes are kept in arrays, strings are dictionary encoded, and maps and lists are
+        built directly in serialized form. Instances are only created when a row of the batch is accessed, and
+        to_serialized() and iter_serialized() never create them, so large batches take a fraction of the memory.
+
+        Args:
+            n: The number of instances to build
+            item_kwargs: (Optional) Build kwargs that vary per instance. See build_batch.
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            A ColumnarBatch of the __model__ schema class
+        """
+        from pynamodb_factories.batch import ColumnarBatch
+        batch = ColumnarBatch(cls._get_model())
+        if cls.__vectorize__:
+            batch.extend(cls._iter_vectorized_build_args(n, item_kwargs, kwargs))
+            return batch
+        plan = cls._get_serialized_plan()[0]
+        for build_kwargs in _iter_build_kwargs(n, item_kwargs, kwargs):
+            build_args = {}
+            for step in plan:
+                step(build_kwargs, build_args)
+            batch.append(build_args)
+        return batch
+
+    @classmethod
+    def export(cls, path: str, n: int, format: str = "binary", item_kwargs: ItemKwargs = None, **kwargs) -> int:
+        """
+        Builds instances of the factory's __model__ in serialized form and writes them to a file, one at a time, so
+        large datasets can be generated once and loaded back with load().
+
+        Args:
+            path: The file to write
+            n: The number of instances to build
+            format: (Optional) "binary", a compact format with an index of the items, or "jsonl", the format of a
+                DynamoDB export to S3. Defaults to "binary".
+            item_kwargs: (Optional) Build kwargs that vary per instance. See build_batch.
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            The number of instances written
+        """
+        from pynamodb_factories.export import FORMATS, JSONL, write_binary, write_jsonl
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {', '.join(FORMATS)}, not {format!r}")
+        items = cls.iter_build_serialized(n, item_kwargs, **kwargs)
+        if format == JSONL:
+            return write_jsonl(path, items)
+        return write_binary(path, cls._get_model(), items)
+
+    @classmethod
+    def load(cls, path: str) -> "ItemReader":
+        """
+        Opens a file written by export() by memory-mapping it. Instances of the factory's __model__ are only
+        deserialized when they're accessed, by index or by iterating the reader. Close the reader when you're done
+        with it, or use it as a context manager.
+
+        Args:
+            path: The file to read, in either format
+
+        Returns:
+            An ItemReader of instances of the __model__ schema class
+        """
+        from pynamodb_factories.export import ItemReader
+        return ItemReader(path, cls._get_model())
+
+    @classmethod
+    def build_batch_cached(cls, n: int, seed: Any = 0, serialized: bool = False,
+                           cache: Optional["FixtureCache"] = None, **kwargs) -> list:
+        """
+        Builds the first n instances of a seeded run, like build_range(0, n, seed), and keeps them in a cache on local
+        disk. Later calls with the same arguments, in this or any other run, load them from the cache instead, until
+        the factory, its model's schema or the installed libraries change.
+
+        Args:
+            n: The number of instances to build
+            seed: (Optional) The seed for the run. Defaults to 0.
+            serialized: (Optional) Return the serialized form of each instance, as from build_serialized(), instead of
+                the instance itself
+            cache: (Optional) The FixtureCache to use. Defaults to one in $PYNAMODB_FACTORIES_CACHE, or in the user's
+                cache directory.
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            A list of instances of the __model__ schema class, or their serialized form
+        """
+        from pynamodb_factories.cache import default_cache
+        return (cache or default_cache()).build_batch(cls, n, seed, serialized, **kwargs)
+
+    @classmethod
+    def save_batch(cls, n: int, writers: int = 1, item_kwargs: ItemKwargs = None, **kwargs) -> SaveResult:
+        """
+        Builds instances of the factory's __model__ and saves them to its table, with BatchWriteItem requests of up to
+        25 items. Unprocessed items are retried with backoff, up to the model's Meta.max_retry_attempts.
+
+        Args:
+            n: The number of instances to build and save
+            writers: (Optional) The number of threads building and writing concurrently. They share the model's
+                connection. Defaults to 1, which writes from the calling thread.
+            item_kwargs: (Optional) Build kwargs that vary per instance. See build_batch. With more than one writer,
+                this must be a callable.
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            A SaveResult, with the number of items saved and the rate they were saved at
+        """
+        model = cls._get_model()
+        start = perf_counter()
+        if writers <= 1:
+            saved = save_models(model, cls.iter_build(n, item_kwargs, **kwargs))
+            return SaveResult(saved, perf_counter() - start)
+
+        if item_kwargs is not None and not callable(item_kwargs):
+            raise ValueError("item_kwargs must be a callable when saving with more than one writer")
+        share, remainder = divmod(n, writers)
+        with ThreadPoolExecutor(max_workers=writers) as executor:
+            futures = []
+            offset = 0
+            for writer in range(writers):
+                size = share + (1 if writer < remainder else 0)
+                items = cls.iter_build(size, _offset_item_kwargs(item_kwargs, offset), **kwargs)
+                futures.append(executor.submit(save_models, model, items))
+                offset += size
+            saved = sum(future.result() for future in futures)
+        return SaveResult(saved, perf_counter() - start)
+
+    @classmethod
+    def aiter_build(cls, n: int, chunk_size: Optional[int] = None, queue_size: Optional[int] = None,
+                    seed: Optional[int] = None, serialized: bool = False,
+                    item_kwargs: Optional[Callable[[int], dict]] = None, executor=None,
+                    metrics: Optional["PipelineMetrics"] = None, **kwargs) -> AsyncIterator:
+        """
+        Builds instances of the factory's __model__ in an executor, a chunk at a time, and yields them without
+        blocking the event loop. Built chunks wait in a bounded queue, so building pauses when the consumer falls
+        behind. Each chunk is built with build_range(), so the run is reproducible from its seed.
+
+        Args:
+            n: The number of instances to build
+            chunk_size: (Optional) The number of instances to build at a time. Defaults to 100.
+            queue_size: (Optional) The number of built chunks to hold before building waits. Defaults to 8.
+            seed: (Optional) The seed for the run. Defaults to a seed drawn from the factory's random state in the
+                calling thread.
+            serialized: (Optional) Yield the serialized form of each instance, as from build_serialized()
+            item_kwargs: (Optional) A callable which takes the index of the instance and returns a dict of build
+                kwargs
+            executor: (Optional) The concurrent.futures executor to build in. Defaults to the event loop's default
+                executor.
+            metrics: (Optional) A PipelineMetrics to update as the run goes, with throughput and queue depth
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            An async generator of instances of the __model__ schema class, or their serialized form
+        """
+        from pynamodb_factories.pipeline import aiter_build
+        chunk_size, queue_size = _async_sizes(chunk_size, queue_size)
+        return aiter_build(cls, n, chunk_size, queue_size, seed, serialized, item_kwargs, executor, metrics, kwargs)
+
+    @classmethod
+    async def abuild_batch(cls, n: int, chunk_size: Optional[int] = None,
+                           queue_size: Optional[int] = None, seed: Optional[int] = None, serialized: bool = False,
+                           item_kwargs: Optional[Callable[[int], dict]] = None, executor=None,
+                           metrics: Optional["PipelineMetrics"] = None, **kwargs) -> list:
+        """
+        Builds a list of instances of the factory's __model__ without blocking the event loop. See aiter_build.
+        """
+        from pynamodb_factories.pipeline import abuild_batch
+        chunk_size, queue_size = _async_sizes(chunk_size, queue_size)
+        return await abuild_batch(
+            cls, n, chunk_size, queue_size, seed, serialized, item_kwargs, executor, metrics, kwargs)
+
+    @classmethod
+    async def asave_batch(cls, n: int, writers: int = 4, chunk_size: Optional[int] = None,
+                          queue_size: Optional[int] = None, seed: Optional[int] = None,
+                          item_kwargs: Optional[Callable[[int], dict]] = None, executor=None,
+                          metrics: Optional["PipelineMetrics"] = None, **kwargs) -> "PipelineMetrics":
+        """
+        Builds instances of the factory's __model__ and saves them to its table without blocking the event loop.
+        Chunks are built in an executor and wait in a bounded queue, while writer tasks save them concurrently with
+        BatchWriteItem requests, also in the executor. Building pauses while the queue is full.
+
+        Args:
+            n: The number of instances to build and save
+            writers: (Optional) The number of chunks to save concurrently. They share the model's connection.
+            chunk_size: (Optional) The number of instances to build and save at a time. Defaults to 100.
+            queue_size: (Optional) The number of built chunks to hold before building waits. Defaults to 8.
+            seed: (Optional) The seed for the run. See aiter_build.
+            item_kwargs: (Optional) A callable which takes the index of the instance and returns a dict of build
+                kwargs
+            executor: (Optional) The concurrent.futures executor to build and save in. It needs a thread for building
+                and one for each writer. Defaults to the event loop's default executor.
+            metrics: (Optional) A PipelineMetrics to update as the run goes, with throughput and queue depth
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            The PipelineMetrics of the run. Its items are the number of instances saved.
+        """
+        from pynamodb_factories.pipeline import asave_batch
+        chunk_size, queue_size = _async_sizes(chunk_size, queue_size)
+        return await asave_batch(
+            cls, n, writers, chunk_size, queue_size, seed, item_kwargs, executor, metrics, kwargs)
+
+    @classmethod
+    def build_parallel(cls, n: int, workers: Optional[int] = None, serialized: bool = False, **kwargs) -> list:
+        """
+        Builds a list of instances of the factory's __model__ across a pool of processes. See iter_build_parallel.
+        """
+        return list(cls.iter_build_parallel(n, workers, serialized, **kwargs))
+
+    @classmethod
+    def iter_build_parallel(cls, n: int, workers: Optional[int] = None, serialized: bool = False,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE, seed: Optional[int] = None,
+                            item_kwargs: Optional[Callable[[int], dict]] = None, **kwargs) -> Iterator:
+        """
+        Builds instances of the factory's __model__ across a pool of processes, and streams them back in order.
+        The factory class must be importable by the worker processes, so it can't be defined locally.
+
+        Each instance is built as by build_range(), from the run seed and its position. The same seed always produces
+        the same instances, regardless of the number of workers or the chunk_size, and unique keys stay unique.
+
+        Args:
+            n: The number of instances to build
+            workers: (Optional) The number of worker processes. Defaults to the number of CPUs.
+            serialized: (Optional) Return the serialized form of each instance, as from Model.serialize(), instead of
+                the instance itself. This skips deserializing them after they're sent back from the workers.
+            chunk_size: (Optional) The number of instances each worker builds at a time
+            seed: (Optional) The seed for the run. Defaults to a seed drawn from the factory's random state.
+            item_kwargs: (Optional) A callable which takes the index of the instance and returns a dict of build
+                kwargs. It must be picklable.
+            kwargs: Build kwargs shared by every instance
+
+        Returns:
+            A generator of instances of the __model__ schema class, or their serialized form
+        """
+        results = iter_build_parallel(cls, n, workers, chunk_size, seed, item_kwargs, kwargs)
+        if serialized:
+            return results
+        model = cls._get_model()
+        return (cast(T, model.from_raw_data(data)) for data in results)
+
     @classmethod
     def create_factory(cls, model: Type[T], base_factory: Optional[Type["PynamoModelFactory"]] = None, **kwargs):
         """
@@ -106,7 +724,7 @@ class PynamoModelFactory(ABC, Generic[T]):
             A PynamoModelFactory object. Call .build() to build a model.
         """
 
-        kwargs.setdefault("__faker__", cls.get_faker())
+        kwargs.setdefault("__faker__", getattr(cls, "__faker__", None))
         kwargs.setdefault("__allow_nulls__", cls.__allow_nulls__)
         kwargs.setdefault("__allow_empty__", cls.__allow_empty__)
         kwargs.setdefault("__raise_unsupported__", cls.__raise_unsupported__)
@@ -122,6 +740,42 @@ class PynamoModelFactory(ABC, Generic[T]):
         )
         pass
 
+    @classmethod
+    def register_factory(cls, model: Type[Attribute], factory: Type["PynamoModelFactory"]):
+        """
+        Use the given factory to build nested values of the given MapAttribute type, in place of a dynamically created
+        one. Registering on a factory applies to that factory and its subclasses. Registering on PynamoModelFactory
+        applies to all factories.
+
+        Args:
+            model: The MapAttribute subclass
+            factory: The factory to build it with
+        """
+        registry = cls.__dict__.get("_factory_registry")
+        if registry is None:
+            registry = {}
+            type.__setattr__(cls, "_factory_registry", registry)
+        registry[model] = factory
+
+    @classmethod
+    def register_provider(cls, attr_type: Type[Attribute], provider: Provider):
+        """
+        Use the given provider to generate values for attributes of the given type, and its subclasses. Registering on
+        a factory applies to that factory and its subclasses. Registering on PynamoModelFactory applies to all
+        factories.
+
+        Args:
+            attr_type: The schema attribute class
+            provider: A callable taking the factory class, the schema attribute object, and the build arg for the
+                attribute, which is None if there isn't one. Returns the value to be set on the attribute.
+        """
+        registry = cls.__dict__.get("_providers")
+        if registry is None:
+            registry = {}
+            type.__setattr__(cls, "_providers", registry)
+        registry[attr_type] = provider
+        _invalidate_plans()
+
     @classmethod
     def set_field_from_factory(cls, field_name):
         """
@@ -151,56 +805,12 @@ class PynamoModelFactory(ABC, Generic[T]):
         Returns:
             The value to be set on the generated model attribute
         """
-        fake = cls.get_faker()
-        if isinstance(field, BinaryAttribute):
-            return build_arg if build_arg is not None else bytes(fake.sentence(), 'utf-8')
-        if isinstance(field, BinarySetAttribute):
-            return build_arg if build_arg is not None else map(_utf8_bytes, fake.sentences(randint(0, 5)))
-        if isinstance(field, BooleanAttribute):
-            return build_arg if build_arg is not None else fake.pybool()
-        if isinstance(field, UnicodeAttribute):
-            return build_arg if build_arg is not None else fake.sentence()
-        if isinstance(field, UnicodeSetAttribute):
-            return build_arg if build_arg is not None else fake.sentences(randint(cls._min_range(), 5))
-        if isinstance(field, JSONAttribute):
-            return build_arg if build_arg is not None else fake.pydict(
-                allowed_types=['str', 'int', 'float', 'email', 'address', 'job', 'phone_number', 'name', 'iso8601'])
-        if isinstance(field, VersionAttribute):
-            return build_arg if build_arg is not None else fake.pyint(1, 5)
-        if isinstance(field, NumberAttribute):
-            return build_arg if build_arg is not None else fake.pyint()
-        if isinstance(field, NumberSetAttribute):
-            return build_arg if build_arg is not None else fake.pylist(randint(cls._min_range(), 5), False, value_types='int')
-        if isinstance(field, TTLAttribute):
-            return build_arg if build_arg is not None else fake.date_time_this_year(after_now=True, tzinfo=timezone.utc)
-        if isinstance(field, UTCDateTimeAttribute):
-            return build_arg if build_arg is not None else fake.date_time(tzinfo=timezone.utc)
-        if isinstance(field, NullAttribute):
+        provider = cls._get_provider(type(field))
+        if provider is None:
+            if cls.__raise_unsupported__:
+                raise UnsupportedException(f'Field {field_name}: {type(field)} is not supported')
             return None
-        if isinstance(field, MapAttribute) or (DynamicMapAttribute and isinstance(field, DynamicMapAttribute)):
-            if field is MapAttribute or field is DynamicMapAttribute:
-                # Just a raw MapAttribute
-                return build_arg if build_arg is not None else fake.pydict()
-            else:
-                build_arg = build_arg if build_arg is not None else {}
-                return cls.create_factory(field.__class__).build(**build_arg)
-        if isinstance(field, ListAttribute):
-            if field.element_type:
-                factory = cls.create_factory(field.element_type)
-                values = []
-                if build_arg is not None:
-                    for arg in build_arg:
-                        values.append(factory.build(**arg))
-                else:
-                    for _ in range(randint(cls._min_range(), 5)):
-                        values.append(factory.build())
-                return values
-            else:
-                return fake.words(randint(0, 5))
-
-        if cls.__raise_unsupported__:
-            raise UnsupportedException(f'Field {field_name}: {type(field)} is not supported')
-        return None
+        return provider(cls, field, build_arg)
 
     @classmethod
     def should_set_field_none(cls, *, field_name, field) -> bool:
@@ -217,7 +827,7 @@ class PynamoModelFactory(ABC, Generic[T]):
         if type(field) in (VersionAttribute,):
             # Some attributes are not None-able
             return False
-        if field.null and random() <= 0.25:
+        if field.null and cls.get_random().random() <= 0.25:
             return True
         return False
 
@@ -232,15 +842,119 @@ class PynamoModelFactory(ABC, Generic[T]):
             bool. True to allow the default value, False to set a generated value.
         """
         if field.default or field.default_for_new:
-            return random() <= 0.25
+            return cls.get_random().random() <= 0.25
         return False
 
     @classmethod
-    def get_faker(cls) -> Faker:
-        """Get the Faker instance"""
+    def get_faker(cls) -> "Faker":
+        """Get the Faker instance for the calling thread"""
         if hasattr(cls, "__faker__") and cls.__faker__:
-            return cls.__faker__
-        return default_faker
+            return cls._random_state.custom_faker(cls.__faker__)
+        return cls._random_state.faker
+
+    @classmethod
+    def configure_default_faker(cls, locale: Optional[str] = None, providers: Optional[List[str]] = None, **config):
+        """
+        Configure the Faker instances created for all factories that don't have their own __faker__. They're created
+        on first use, so factories that have their own never pay for loading Faker's providers.
+
+        Args:
+            locale: (Optional) The Faker locale. Defaults to Faker's default locale.
+            providers: (Optional) The Faker provider modules to load, in place of all of them. Loading fewer providers
+                makes creating the Faker instance faster. providers.FAKER_PROVIDERS lists the ones the default
+                providers need.
+            config: Any other arguments for Faker()
+        """
+        configure_default_faker(locale, providers, **config)
+
+    @classmethod
+    def get_random(cls) -> Random:
+        """Get the factory's random.Random instance for the calling thread"""
+        return cls._random_state.random
+
+    @classmethod
+    def get_stats(cls) -> FactoryStats:
+        """Get the factory's instrumentation counters. They're only updated when __instrument__ is set."""
+        stats = cls.__dict__.get("_stats")
+        if stats is None:
+            stats = FactoryStats(cls.__name__)
+            # Bypass the metaclass, so that creating the stats doesn't invalidate build plans
+            type.__setattr__(cls, "_stats", stats)
+        return stats
+
+    @classmethod
+    def reset_stats(cls):
+        """Zero the factory's instrumentation counters, including those of its nested factories"""
+        cls.get_stats().reset()
+
+    @classmethod
+    def get_pool(cls, name: str, generate: Callable[[], Any]) -> Optional[ValuePool]:
+        """
+        Get the factory's pool of pre-generated values for the calling thread
+
+        Args:
+            name: The name of the pool. Providers that generate the same kind of value should share a name.
+            generate: Called with no arguments to generate a new value, if the pool doesn't exist yet
+        Returns:
+            The ValuePool, or None if pooling is turned off
+        """
+        if not cls.__pool_size__:
+            return None
+        pools = cls._random_state.pools
+        # Factories sharing a random state can have different Fakers, whose values mustn't mix in one pool
+        key = (name, id(cls.get_faker()), cls.__pool_size__, cls.__pool_refresh__)
+        pool = pools.get(key)
+        if pool is None:
+            pool = pools[key] = ValuePool(generate, cls.__pool_size__, cls.__pool_refresh__)
+        return pool
+
+    @classmethod
+    def get_collection_size(cls, field: Attribute) -> int:
+        """
+        Draw the number of elements to generate for a set or list attribute, from __collection_sizes__
+
+        Args:
+            field: The schema attribute object
+        """
+        size = cls._get_collection_sizes().get(field.attr_name)
+        if size is None:
+            return cls.get_random().randint(cls._min_range(), 5)
+        if isinstance(size, int):
+            return size
+        if callable(size):
+            return size(cls.get_random())
+        return cls.get_random().randint(*size)
+
+    @classmethod
+    def get_key_space(cls, seed: Optional[int] = None) -> KeySpace:
+        """
+        Get the factory's allocator of unique keys and index keys, for __unique_keys__, __index_keys__ and
+        __index_range_keys__
+
+        Args:
+            seed: (Optional) The seed for the allocator, if it doesn't exist yet. Defaults to the seed last set in the
+                calling thread.
+        """
+        key_spaces = cls._random_state.key_spaces
+        if key_spaces is None:
+            key_spaces = cls._key_spaces
+        distributions_key, distributions = cls._get_key_distributions()
+        key = (cls, cls.__hash_key_cardinality__, cls.__hash_key_skew__, distributions_key)
+        key_space = key_spaces.get(key)
+        if key_space is None:
+            if seed is None:
+                seed = cls._random_state.seeded_with
+            random = Random(None if seed is None else index_seed(seed, "keys"))
+            key_space = key_spaces.setdefault(
+                key, KeySpace(random, cls.__hash_key_cardinality__, cls.__hash_key_skew__, distributions))
+        return key_space
+
+    @classmethod
+    def get_column_generator(cls) -> ColumnGenerator:
+        """Get the ColumnGenerator instance for vectorized batch builds"""
+        if hasattr(cls, "__columns__") and cls.__columns__:
+            return cls.__columns__
+        return cls._random_state.columns
 
     @classmethod
     def _get_model(cls) -> Type[T]:
@@ -249,23 +963,597 @@ class PynamoModelFactory(ABC, Generic[T]):
         return cls.__model__
 
     @classmethod
-    def _build_field(cls, *, field_name, field, build_arg) -> (dict, bool):
-        set_none = cls.should_set_field_none(field_name=field_name, field=field)
-        none_result = {field_name: None}
-        if hasattr(cls, field_name):
-            if isinstance(getattr(cls, field_name), Required):
-                return {}, True
-            if isinstance(getattr(cls, field_name), Ignored):
-                return {}, False
-            return none_result if set_none else {field_name: cls.set_field_from_factory(field_name=field_name)}, False
-        else:
-            return none_result if set_none else {field_name: cls.set_field(field_name=field_name, field=field, build_arg=build_arg)}, False
-        pass
+    def _has_override(cls, field_name: str) -> bool:
+        """
+        Whether the factory overrides the attribute. Names defined on PynamoModelFactory itself, like its methods,
+        aren't overrides, so model attributes can share them.
+        """
+        for klass in cls.__mro__:
+            if klass is PynamoModelFactory:
+                return False
+            if field_name in klass.__dict__:
+                return True
+        return False
 
     @classmethod
     def _min_range(cls):
         return 0 if cls.__allow_empty__ else 1
 
+    @classmethod
+    def _get_nested_factory(cls, model: Type[Attribute]) -> Type["PynamoModelFactory"]:
+        """
+        Get a factory for building nested values of the given MapAttribute type. Registered factories take priority.
+        Otherwise, a factory is created with the same configuration as this one, and cached for reuse.
+        """
+        factory = cls._find_nested_factory(model)
+        if cls.__instrument__:
+            cls.get_stats().nested.setdefault(model.__name__, factory.get_stats())
+        return factory
+
+    @classmethod
+    def _find_nested_factory(cls, model: Type[Attribute]) -> Type["PynamoModelFactory"]:
+        for klass in cls.__mro__:
+            registry = klass.__dict__.get("_factory_registry")
+            if registry and model in registry:
+                return registry[model]
+
+        key = (cls, model, getattr(cls, "__faker__", None), cls.__allow_nulls__, cls.__allow_empty__, cls.__raise_unsupported__)
+        with _nested_factories_lock:
+            factory = _nested_factories.get(key)
+            if factory is not None:
+                _nested_factories.move_to_end(key)
+                return factory
+            factory = cls.create_factory(model)
+            _nested_factories[key] = factory
+            if len(_nested_factories) > NESTED_FACTORY_CACHE_SIZE:
+                _nested_factories.popitem(last=False)
+            if cls.__instrument__:
+                cls.get_stats().nested_factories_created += 1
+            return factory
+
+    @classmethod
+    def _get_plan(cls) -> List[BuildStep]:
+        """Get the compiled build plan for this factory, compiling it first if it is missing or stale"""
+        return cls._get_compiled("_compiled_plan", cls._compile_plan)
+
+    @classmethod
+    def _get_serialized_plan(cls) -> Tuple[List[BuildStep], List[Serializer]]:
+        """Get the compiled build plan and serializers for serialized builds"""
+        return cls._get_compiled("_compiled_serialized_plan", cls._compile_serialized_plan)
+
+    @classmethod
+    def _get_compiled(cls, name: str, compile_plan: Callable[[], Any]):
+        compiled = cls.__dict__.get(name)
+        if compiled is None or compiled[0] != _current_generation:
+            # Bypass the metaclass, so that caching the plan doesn't invalidate it
+            compiled = (_current_generation, compile_plan())
+            type.__setattr__(cls, name, compiled)
+        return compiled[1]
+
+    @classmethod
+    def _compile_plan(cls) -> List[BuildStep]:
+        return cls._instrument_plan(cls._add_size_step([
+            cls._compile_step(field_name, field) for field_name, field in cls._get_model().get_attributes().items()
+        ]))
+
+    @classmethod
+    def _compile_serialized_plan(cls) -> Tuple[List[BuildStep], List[Serializer]]:
+        """
+        Compile a build plan whose nested MapAttribute and ListAttribute(of=...) values are built directly in
+        serialized form, and the serializers for the rest of the attributes
+        """
+        plan = []
+        serializers = []
+        set_field_overridden = _is_overridden(cls, "set_field")
+        for field_name, field in cls._get_model().get_attributes().items():
+            generate = None
+            if not set_field_overridden and not cls._has_override(field_name):
+                generate = cls._compile_nested_serialized(field)
+            plan.append(cls._compile_step(field_name, field, generate))
+            serializers.append(compile_serializer(field_name, field))
+        return cls._instrument_plan(cls._add_size_step(plan)), serializers
+
+    @classmethod
+    def _compile_nested_serialized(cls, field: Attribute) -> Optional[Callable[[Any], SerializedValue]]:
+        """Get a callable which builds a nested value in serialized form, or None if the attribute isn't nested"""
+        provider = cls._get_provider(type(field))
+        if provider is fake_map and isinstance(field, MapAttribute) and not field.is_raw():
+            def generate(build_arg):
+                nested_factory = cls._get_nested_factory(field.__class__)
+                return SerializedValue(nested_factory.build_serialized(**(build_arg if build_arg is not None else {})))
+            return generate
+
+        element_type = getattr(field, "element_type", None)
+        if provider is fake_list and element_type and issubclass(element_type, MapAttribute):
+            def generate(build_arg):
+                nested_factory = cls._get_nested_factory(element_type)
+                if build_arg is None:
+                    build_arg = ({} for _ in range(cls.get_collection_size(field)))
+                return SerializedValue([{MAP: nested_factory.build_serialized(**arg)} for arg in build_arg])
+            return generate
+        return None
+
+    @classmethod
+    def _compile_step(cls, field_name, field, generate: Optional[Callable[[Any], Any]] = None) -> BuildStep:
+        """
+        Resolve everything about building one attribute that doesn't change between builds
+
+        Args:
+            field_name: The name of the attribute
+            field: The schema attribute object itself
+            generate: (Optional) A callable taking the build arg and returning the value for the attribute. If given,
+                it takes the place of any override or generator.
+        Returns:
+            A callable taking the build kwargs and the dict of args for the model constructor. It adds the value for
+            this attribute to the args, if there should be one.
+        """
+        use_default = cls._compile_default_check(field_name, field)
+        set_none = cls._compile_none_check(field_name, field)
+        stats = cls.get_stats().field(field_name) if cls.__instrument__ else None
+        path = GENERATED
+        key = cls._compile_key(field_name, field) if generate is None else None
+
+        if generate is not None:
+            pass
+        elif cls._has_override(field_name):
+            override = getattr(cls, field_name)
+            if isinstance(override, Required):
+                def step(kwargs, build_args):
+                    if use_default is not None and use_default():
+                        if field_name in kwargs:
+                            build_args[field_name] = kwargs[field_name]
+                        return
+                    if set_none is not None:
+                        set_none()
+                    if field_name not in kwargs:
+                        raise RequiredArgumentError(f"Required argument {field_name} was not in the build kwargs")
+                    build_args[field_name] = kwargs[field_name]
+                return stats.wrap_step(step, REQUIRED) if stats is not None else step
+            if isinstance(override, Ignored):
+                def step(kwargs, build_args):
+                    if use_default is not None and use_default():
+                        pass
+                    elif set_none is not None:
+                        set_none()
+                    if field_name in kwargs:
+                        build_args[field_name] = kwargs[field_name]
+                return stats.wrap_step(step, IGNORED) if stats is not None else step
+
+            def generate(_):
+                return cls.set_field_from_factory(field_name=field_name)
+            path = OVERRIDE
+        elif key is not None:
+            generate = key
+        elif _is_overridden(cls, "set_field"):
+            def generate(build_arg):
+                return cls.set_field(field_name=field_name, field=field, build_arg=build_arg)
+        else:
+            provider = cls._get_provider(type(field))
+            if provider is None:
+                if cls.__raise_unsupported__:
+                    raise UnsupportedException(f'Field {field_name}: {type(field)} is not supported')
+
+                def generate(_):
+                    return None
+            else:
+                def generate(build_arg):
+                    return provider(cls, field, build_arg)
+
+        if stats is not None:
+            use_default = stats.wrap_check(use_default, DEFAULT)
+            set_none = stats.wrap_check(set_none, NONE)
+            generate = stats.wrap_generate(generate, path)
+
+        if use_default is None and set_none is None:
+            def step(kwargs, build_args):
+                build_args[field_name] = generate(kwargs.get(field_name))
+        else:
+            def step(kwargs, build_args):
+                if use_default is not None and use_default():
+                    # Leave the field out of the args and PynamoDB will set the default value on creation
+                    if field_name in kwargs:
+                        build_args[field_name] = kwargs[field_name]
+                    return
+                if set_none is not None and set_none():
+                    build_args[field_name] = None
+                else:
+                    build_args[field_name] = generate(kwargs.get(field_name))
+        return stats.wrap_step(step) if stats is not None else step
+
+    @classmethod
+    def _instrument_plan(cls, plan: List[BuildStep]) -> List[BuildStep]:
+        """Add a step to count builds to the start of the plan, if the factory is instrumented"""
+        if cls.__instrument__:
+            return [cls.get_stats().count_build] + plan
+        return plan
+
+    @classmethod
+    def _get_varying_fields(cls) -> List[str]:
+        """Get the attributes which a prototype generates for each instance by default"""
+        varying = []
+        for field_name, field in cls._get_model().get_attributes().items():
+            if cls._has_override(field_name):
+                override = getattr(cls, field_name)
+                if isinstance(override, (Use, Required)) or callable(override):
+                    varying.append(field_name)
+            elif field.is_hash_key or field.is_range_key or cls._compile_key(field_name, field) is not None:
+                varying.append(field_name)
+        return varying
+
+    @classmethod
+    def _get_lazy_plan(cls) -> Tuple[List[BuildStep], Optional[Dict[str, BuildStep]]]:
+        """
+        Get the compiled plan for build_lazy(): the steps to run straight away, and the build step of each attribute
+        to generate when it's first read, or None if the factory can't build lazily
+        """
+        return cls._get_compiled("_compiled_lazy_plan", cls._compile_lazy_plan)
+
+    @classmethod
+    def _compile_lazy_plan(cls) -> Tuple[List[BuildStep], Optional[Dict[str, BuildStep]]]:
+        if cls._compile_size_step() is not None:
+            return [], None
+        eager = []
+        lazy = {}
+        for field_name, field in cls._get_model().get_attributes().items():
+            step = cls._compile_step(field_name, field)
+            override = getattr(cls, field_name) if cls._has_override(field_name) else None
+            if field.is_hash_key or field.is_range_key or isinstance(override, (Required, Ignored)):
+                eager.append(step)
+            else:
+                lazy[field_name] = step
+        return cls._instrument_plan(eager), lazy
+
+    @classmethod
+    def _get_mutation_plan(cls) -> Tuple[Dict[str, BuildStep], List[str], List[str], Optional[BuildStep]]:
+        """
+        Get the compiled plan for mutate(): the build step of each attribute, the attributes to choose from, the
+        version attributes, and the step to steer the instance to __target_item_bytes__
+        """
+        return cls._get_compiled("_compiled_mutation_plan", cls._compile_mutation_plan)
+
+    @classmethod
+    def _compile_mutation_plan(cls) -> Tuple[Dict[str, BuildStep], List[str], List[str], Optional[BuildStep]]:
+        attributes = cls._get_model().get_attributes()
+        steps = {field_name: cls._compile_step(field_name, field) for field_name, field in attributes.items()}
+        # Attributes the factory marks Required or Ignored, or sets to a constant, can't be regenerated
+        candidates = [field_name for field_name, field in attributes.items()
+                      if not (field.is_hash_key or field.is_range_key or isinstance(field, VersionAttribute))
+                      and (not cls._has_override(field_name) or isinstance(getattr(cls, field_name), Use)
+                           or callable(getattr(cls, field_name)))]
+        versions = [field_name for field_name, field in attributes.items() if isinstance(field, VersionAttribute)]
+        return steps, candidates, versions, cls._compile_size_step()
+
+    @classmethod
+    def _add_size_step(cls, plan: List[BuildStep]) -> List[BuildStep]:
+        """Add a step to steer the instance to __target_item_bytes__ to the end of the plan, if it's set"""
+        size_step = cls._compile_size_step()
+        return plan if size_step is None else plan + [size_step]
+
+    @classmethod
+    def _compile_size_step(cls) -> Optional[BuildStep]:
+        target = cls.__target_item_bytes__
+        model = cls._get_model()
+        # Nested factories inherit the option, but only whole items have a size limit
+        if not target or not issubclass(model, PynamoModel):
+            return None
+        low, high = (target, target) if isinstance(target, int) else target
+        if not 0 < low <= high <= MAX_ITEM_BYTES:
+            raise ValueError(f"{cls.__name__}.__target_item_bytes__ must be between 1 and {MAX_ITEM_BYTES} bytes")
+
+        sizers = []
+        resizers = []
+        for field_name, field in model.get_attributes().items():
+            default = field.default_for_new if field.default_for_new is not None else field.default
+            sizers.append((field_name, compile_sizer(field), default))
+            if (field.is_hash_key or field.is_range_key or cls._has_override(field_name)
+                    or cls._compile_key(field_name, field) is not None):
+                continue
+            if isinstance(field, UnicodeAttribute):
+                resizers.append((field_name, resize_text, utf8_size))
+            elif isinstance(field, BinaryAttribute):
+                resizers.append((field_name, resize_binary, len))
+
+        def step(kwargs, build_args):
+            size = 0
+            for field_name, sizer, default in sizers:
+                if field_name in build_args:
+                    value = build_args[field_name]
+                    if isinstance(value, Iterator):
+                        # Measuring would exhaust it
+                        value = build_args[field_name] = set(value)
+                else:
+                    value = default() if callable(default) else default
+                size += sizer(value)
+            target_size = low if low == high else cls.get_random().randint(low, high)
+            resizable = [each for each in resizers if each[0] not in kwargs and build_args.get(each[0]) is not None]
+            # Spread the difference over the resizable attributes. Ones that can't shrink any further leave the rest
+            # of it to the ones after them.
+            for position, (field_name, resize, measure) in enumerate(resizable):
+                if size == target_size:
+                    return
+                value = build_args[field_name]
+                current = measure(value)
+                resized = resize(value, current + (target_size - size) // (len(resizable) - position))
+                size += measure(resized) - current
+                build_args[field_name] = resized
+        return step
+
+    @classmethod
+    def _build_range(cls, start: int, stop: int, seed: Optional[int], item_kwargs: ItemKwargs, kwargs: dict,
+                     serialized: bool) -> list:
+        state = cls._random_state
+        if seed is None:
+            seed = state.seeded_with if state.seeded_with is not None else 0
+        if callable(item_kwargs):
+            item_kwargs = _offset_item_kwargs(item_kwargs, start)
+        if serialized:
+            plan, serializers = cls._get_serialized_plan()
+        else:
+            plan = cls._get_plan()
+            model = cls._get_model()
+
+        # Reseed for each instance, and put the generator and pools back afterwards. Fakers draw from the same
+        # generator. Unique and index keys come from a key space of the calling thread's own, seeded from the run
+        # seed, and seeked to each instance's position.
+        saved_random = state.random.getstate()
+        saved_pools, state.pools = state.pools, {}
+        saved_key_spaces, state.key_spaces = state.key_spaces, {}
+        key_space = cls.get_key_space(seed) if cls.__unique_keys__ or cls._get_key_distributions()[1] else None
+        items = []
+        try:
+            for index, build_kwargs in zip(range(start, stop), _iter_build_kwargs(stop - start, item_kwargs, kwargs)):
+                seed_at = index_seed(seed, index)
+                state.random.seed(seed_at)
+                state.pools.clear()
+                if key_space is not None:
+                    key_space.seek(index)
+                build_args = {}
+                for step in plan:
+                    step(build_kwargs, build_args)
+                items.append(serialize_build_args(serializers, build_args) if serialized
+                             else cast(T, model(**build_args)))
+        finally:
+            state.random.setstate(saved_random)
+            state.pools = saved_pools
+            state.key_spaces = saved_key_spaces
+        return items
+
+    @classmethod
+    def _iter_build_vectorized(cls, n: Optional[int], item_kwargs: ItemKwargs, kwargs: dict) -> Iterator[T]:
+        model = cls._get_model()
+        for build_args in cls._iter_vectorized_build_args(n, item_kwargs, kwargs):
+            yield cast(T, model(**build_args))
+
+    @classmethod
+    def _iter_vectorized_build_args(cls, n: Optional[int], item_kwargs: ItemKwargs, kwargs: dict) -> Iterator[dict]:
+        """Generate the args for the model constructor of each instance, with scalar attributes a column at a time"""
+        columns = {}
+        plan, column_specs = cls._compile_column_plan(columns)
+        generator = cls.get_column_generator()
+        build_kwargs_iter = _iter_build_kwargs(n, item_kwargs, kwargs)
+        while True:
+            chunk = list(islice(build_kwargs_iter, VECTORIZED_CHUNK_SIZE))
+            if not chunk:
+                return
+            for field_name, column in column_specs.items():
+                columns[field_name] = iter(column(generator, len(chunk)))
+            for build_kwargs in chunk:
+                build_args = {}
+                for step in plan:
+                    step(build_kwargs, build_args)
+                yield build_args
+
+    @classmethod
+    def _compile_column_plan(cls, columns: dict) -> (List[BuildStep], Dict[str, Column]):
+        """
+        Compile a build plan that takes vectorizable attribute values from columns, instead of generating them
+
+        Args:
+            columns: The dict that will hold an iterator of generated values for each vectorized attribute
+        Returns:
+            The build plan, and the column to generate for each vectorized attribute
+        """
+        plan = []
+        column_specs = {}
+        set_field_overridden = _is_overridden(cls, "set_field")
+        for field_name, field in cls._get_model().get_attributes().items():
+            column = None
+            if not set_field_overridden and not cls._has_override(field_name):
+                column = cls._compile_key_column(field_name, field)
+                if column is None and cls._compile_key(field_name, field) is None:
+                    column = cls._get_column(field)
+            if column is None:
+                plan.append(cls._compile_step(field_name, field))
+            else:
+                column_specs[field_name] = column
+                plan.append(cls._compile_step(field_name, field, _column_value(columns, field_name)))
+        return cls._instrument_plan(cls._add_size_step(plan)), column_specs
+
+    @classmethod
+    def _get_column(cls, field: Attribute) -> Optional[Column]:
+        """Find the column generator for the attribute's type, or None if it can't be vectorized"""
+        return PROVIDER_COLUMNS.get(cls._get_provider(type(field)))
+
+    @classmethod
+    def _compile_key(cls, field_name, field) -> Optional[Callable[[Any], Any]]:
+        """
+        Get a callable which generates a unique or partition key for the attribute, or None if __unique_keys__ is off
+        or the attribute doesn't need one. Overrides on the factory take priority.
+        """
+        if cls._has_override(field_name):
+            return None
+        distribution = cls._get_key_distributions()[1].get(field_name)
+        if distribution is not None:
+            value = compile_key_value(field_name, field)
+
+            def generate(build_arg):
+                if build_arg is not None:
+                    return build_arg
+                return value(cls.get_key_space().sampler(field_name).sample(cls.get_random()))
+            return generate
+        if not cls.__unique_keys__ or not (field.is_hash_key or field.is_range_key):
+            return None
+        cardinality = cls.__hash_key_cardinality__
+        if cardinality and cls._get_model()._range_key_attribute() is None:
+            raise ValueError(f"{cls.__name__}.__hash_key_cardinality__ needs a range key to keep keys unique")
+        value = compile_key_value(field_name, field)
+        if field.is_hash_key and cardinality:
+            def generate(build_arg):
+                return build_arg if build_arg is not None else value(cls.get_key_space().partition(cls.get_random()))
+        elif field.is_hash_key or cardinality:
+            def generate(build_arg):
+                return build_arg if build_arg is not None else value(cls.get_key_space().unique())
+        else:
+            # The hash key is already unique
+            return None
+        return generate
+
+    @classmethod
+    def _compile_key_column(cls, field_name, field) -> Optional[Column]:
+        """Get a column of secondary index key values for the attribute, or None if it doesn't have a distribution"""
+        if field_name not in cls._get_key_distributions()[1]:
+            return None
+        value = compile_key_value(field_name, field)
+
+        def column(columns: ColumnGenerator, n: int) -> list:
+            return [value(key) for key in cls.get_key_space().sampler(field_name).column(columns, n)]
+        return column
+
+    @classmethod
+    def _get_collection_sizes(cls) -> dict:
+        """Get __collection_sizes__ keyed by attr_name, which is what providers can see"""
+        return cls._get_compiled("_compiled_collection_sizes", cls._compile_collection_sizes)
+
+    @classmethod
+    def _compile_collection_sizes(cls) -> dict:
+        if not cls.__collection_sizes__:
+            return {}
+        attributes = cls._get_model().get_attributes()
+        return {
+            attributes[field_name].attr_name if field_name in attributes else field_name: size
+            for field_name, size in cls.__collection_sizes__.items()
+        }
+
+    @classmethod
+    def _get_key_distributions(cls) -> Tuple[tuple, Dict[str, KeyDistribution]]:
+        """Get the KeyDistribution of each secondary index key attribute, by attribute name, and a hashable copy"""
+        return cls._get_compiled("_compiled_key_distributions", cls._compile_key_distributions)
+
+    @classmethod
+    def _compile_key_distributions(cls) -> Tuple[tuple, Dict[str, KeyDistribution]]:
+        model = cls._get_model()
+        # Nested factories inherit the options, but MapAttributes don't have indexes
+        if not (cls.__index_keys__ or cls.__index_range_keys__) or not issubclass(model, PynamoModel):
+            return (), {}
+        field_names = {field.attr_name: field_name for field_name, field in model.get_attributes().items()}
+        distributions = {}
+        for specs, is_range_key in ((cls.__index_keys__, False), (cls.__index_range_keys__, True)):
+            for index_name, distribution in specs.items():
+                index = model._indexes.get(index_name) or getattr(model, index_name, None)
+                if not isinstance(index, Index):
+                    raise ValueError(f"{model.__name__} has no index {index_name}")
+                attribute = next((attribute for attribute in index.Meta.attributes.values()
+                                  if (attribute.is_range_key if is_range_key else attribute.is_hash_key)), None)
+                if attribute is None:
+                    raise ValueError(f"Index {index_name} has no range key")
+                field_name = field_names[attribute.attr_name]
+                field = model.get_attributes()[field_name]
+                if cls.__unique_keys__ and (field.is_hash_key or field.is_range_key):
+                    raise ValueError(f"{field_name} is a key of the table, so it's generated by __unique_keys__")
+                distributions[field_name] = distribution
+        return tuple(sorted(distributions.items())), distributions
+
+    @classmethod
+    def _compile_default_check(cls, field_name, field) -> Optional[Callable[[], bool]]:
+        """Get a callable which decides whether to use the field's default, or None if it never will"""
+        if _is_overridden(cls, "should_set_field_default"):
+            return lambda: cls.should_set_field_default(field_name=field_name, field=field)
+        if cls._compile_key(field_name, field) is not None:
+            # A default value would defeat generating keys
+            return None
+        if field.default or field.default_for_new:
+            return _chance(cls, 0.25)
+        return None
+
+    @classmethod
+    def _compile_none_check(cls, field_name, field) -> Optional[Callable[[], bool]]:
+        """Get a callable which decides whether to set the field to None, or None if it never will"""
+        if _is_overridden(cls, "should_set_field_none"):
+            return lambda: cls.should_set_field_none(field_name=field_name, field=field)
+        if not cls.__allow_nulls__ or type(field) in (VersionAttribute,) or not field.null:
+            return None
+        return _chance(cls, 0.25)
+
+    @classmethod
+    def _get_provider(cls, attr_type: Type[Attribute]) -> Optional[Provider]:
+        """
+        Find the provider for an attribute type. Resolved providers are cached per factory until providers or factory
+        attributes change.
+
+        Args:
+            attr_type: The schema attribute class
+        Returns:
+            The provider, or None if the attribute type is not supported
+        """
+        cache = cls.__dict__.get("_provider_cache")
+        if cache is None or cache[0] != _current_generation:
+            # Bypass the metaclass, so that caching doesn't invalidate it
+            cache = (_current_generation, {})
+            type.__setattr__(cls, "_provider_cache", cache)
+        providers = cache[1]
+        if attr_type not in providers:
+            providers[attr_type] = cls._resolve_provider(attr_type)
+        return providers[attr_type]
+
+    @classmethod
+    def _resolve_provider(cls, attr_type: Type[Attribute]) -> Optional[Provider]:
+        # The most specific attribute type wins. For the same attribute type, the most specific factory wins.
+        for base_type in attr_type.__mro__:
+            for klass in cls.__mro__:
+                registry = klass.__dict__.get("_providers")
+                if registry and base_type in registry:
+                    return registry[base_type]
+        return None
+
+
+def _iter_build_kwargs(n: Optional[int], item_kwargs: ItemKwargs, kwargs: dict) -> Iterator[dict]:
+    indices = count() if n is None else range(n)
+    if item_kwargs is None:
+        return (kwargs for _ in indices)
+    if callable(item_kwargs):
+        items = map(item_kwargs, indices)
+    else:
+        items = (item for _, item in zip(indices, item_kwargs))
+    if not kwargs:
+        return items
+    return ({**kwargs, **item} for item in items)
+
+
+def _offset_item_kwargs(item_kwargs: Optional[Callable[[int], dict]], offset: int) -> Optional[Callable[[int], dict]]:
+    if item_kwargs is None:
+        return None
+    return lambda index: item_kwargs(offset + index)
+
+
+def _async_sizes(chunk_size: Optional[int], queue_size: Optional[int]) -> Tuple[int, int]:
+    # The pipeline module is only imported when it's used, so its defaults can't be in the method signatures
+    from pynamodb_factories.pipeline import DEFAULT_ASYNC_CHUNK_SIZE, DEFAULT_QUEUE_SIZE
+    return (DEFAULT_ASYNC_CHUNK_SIZE if chunk_size is None else chunk_size,
+            DEFAULT_QUEUE_SIZE if queue_size is None else queue_size)
+
+
+def _chance(factory, probability: float) -> Callable[[], bool]:
+    def check():
+        return factory._random_state.random.random() <= probability
+    return check
+
+
+def _column_value(columns: dict, field_name) -> Callable[[Any], Any]:
+    def generate(build_arg):
+        value = next(columns[field_name])
+        return build_arg if build_arg is not None else value
+    return generate
+
 
-def _utf8_bytes(string):
-    return bytes(string, 'utf-8')
+def _is_overridden(factory, method_name) -> bool:
+    return getattr(factory, method_name).__func__ is not getattr(PynamoModelFactory, method_name).__func__
@@ -0,0 +1,127 @@
+from collections import Counter
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+# The paths a build can take for one attribute
+DEFAULT = "default"
+NONE = "none"
+OVERRIDE = "override"
+BUILD_ARG = "build_arg"
+GENERATED = "generated"
+REQUIRED = "required"
+IGNORED = "ignored"
+
+BuildStep = Callable[[dict, dict], None]
+
+
+class FieldStats:
+    """
+    Counters for building one attribute
+
+    Attributes:
+        calls: The number of times the attribute was built
+        seconds: The total time spent building it, including any nested factories
+        paths: How many times each path was taken. One of default, none, override, build_arg, generated, required or
+            ignored.
+    """
+    __slots__ = ("calls", "seconds", "paths")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.paths = Counter()
+
+    def reset(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.paths.clear()
+
+    def wrap_step(self, step: BuildStep, path: Optional[str] = None) -> BuildStep:
+        """Count and time a build step, and record the path it takes if it only has one"""
+        def timed(kwargs, build_args):
+            start = perf_counter()
+            try:
+                step(kwargs, build_args)
+            finally:
+                self.calls += 1
+                self.seconds += perf_counter() - start
+            if path is not None:
+                self.paths[path] += 1
+        return timed
+
+    def wrap_check(self, check: Optional[Callable[[], bool]], path: str) -> Optional[Callable[[], bool]]:
+        """Record the path whenever the check passes"""
+        if check is None:
+            return None
+
+        def recorded():
+            result = check()
+            if result:
+                self.paths[path] += 1
+            return result
+        return recorded
+
+    def wrap_generate(self, generate: Callable[[Any], Any], path: str) -> Callable[[Any], Any]:
+        """Record the path whenever a value is generated. A build arg takes priority, unless the factory overrides it."""
+        def recorded(build_arg):
+            self.paths[BUILD_ARG if build_arg is not None and path != OVERRIDE else path] += 1
+            return generate(build_arg)
+        return recorded
+
+    def __repr__(self):
+        return f"FieldStats(calls={self.calls}, seconds={self.seconds:.6f}, paths={dict(self.paths)})"
+    pass
+
+
+class FactoryStats:
+    """
+    Counters for an instrumented factory. Counts may be approximate when building from several threads at once.
+
+    Attributes:
+        name: The name of the factory
+        builds: The number of instances built
+        fields: The FieldStats for each attribute
+        nested_factories_created: The number of nested factories this factory has created
+        nested: The FactoryStats of each nested factory this factory has used, by the name of its model
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.builds = 0
+        self.fields: Dict[str, FieldStats] = {}
+        self.nested_factories_created = 0
+        self.nested: Dict[str, FactoryStats] = {}
+
+    def field(self, field_name: str) -> FieldStats:
+        stats = self.fields.get(field_name)
+        if stats is None:
+            stats = self.fields[field_name] = FieldStats()
+        return stats
+
+    def count_build(self, kwargs, build_args):
+        """A build step which counts builds"""
+        self.builds += 1
+
+    def reset(self):
+        """Zero every counter, including those of nested factories"""
+        self.builds = 0
+        self.nested_factories_created = 0
+        for stats in self.fields.values():
+            stats.reset()
+        for stats in self.nested.values():
+            stats.reset()
+
+    def report(self) -> str:
+        """Format the counters as a table, with the slowest attributes first"""
+        lines = [f"{self.name}: {self.builds} builds, {self.nested_factories_created} nested factories created",
+                 f"  {'field':<24}{'calls':>10}{'seconds':>12}  paths"]
+        for field_name, stats in sorted(self.fields.items(), key=lambda item: -item[1].seconds):
+            paths = ", ".join(f"{path}={count}" for path, count in stats.paths.most_common())
+            lines.append(f"  {field_name:<24}{stats.calls:>10}{stats.seconds:>12.6f}  {paths}")
+        for stats in self.nested.values():
+            lines.extend("  " + line for line in stats.report().splitlines())
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"FactoryStats(name={self.name!r}, builds={self.builds}, fields={self.fields})"
+    pass
@@ -0,0 +1,194 @@
+from bisect import bisect
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate, count
+from random import Random
+from typing import Any, Callable, Dict, List, Optional
+
+from pynamodb.attributes import Attribute, BinaryAttribute, NumberAttribute, UnicodeAttribute, UTCDateTimeAttribute
+
+from pynamodb_factories.columns import ColumnGenerator
+from pynamodb_factories.exceptions import UnsupportedException
+
+# Keys are drawn from the numbers below 2 ** 48, which is enough for any table, fits a double exactly, and keeps
+# UTCDateTimeAttribute keys within about 9 years of KEY_EPOCH
+KEY_BITS = 48
+KEY_MASK = (1 << KEY_BITS) - 1
+KEY_EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+UNIFORM = "uniform"
+ZIPF = "zipf"
+SEQUENTIAL = "sequential"
+DISTRIBUTIONS = (UNIFORM, ZIPF, SEQUENTIAL)
+
+
+class Permutation:
+    """
+    A seeded bijection on the numbers below 2 ** 48. Distinct numbers always map to distinct numbers, so permuting a
+    counter gives unique values without remembering the ones already used, and they aren't in ascending order.
+    """
+    __slots__ = ("_multiplier", "_offset", "_mixer")
+
+    def __init__(self, random: Random):
+        # Multiplying by an odd number, adding, and xor-shifting right are each invertible modulo 2 ** 48
+        self._multiplier = random.getrandbits(KEY_BITS) | 1
+        self._offset = random.getrandbits(KEY_BITS)
+        self._mixer = random.getrandbits(KEY_BITS) | 1
+
+    def __call__(self, n: int) -> int:
+        n = (n * self._multiplier + self._offset) & KEY_MASK
+        n ^= n >> 24
+        n = (n * self._mixer) & KEY_MASK
+        return n ^ (n >> 20)
+    pass
+
+
+class KeyDistribution:
+    """
+    How instances are spread over the values of a key attribute
+
+    Args:
+        cardinality: The number of distinct values
+        distribution: (Optional) One of "uniform", "zipf", where the first values are much more common than the rest,
+            or "sequential", which cycles through the values in order. Defaults to "uniform".
+        skew: (Optional) The exponent of the zipf distribution. Defaults to 1.
+    """
+    __slots__ = ("cardinality", "distribution", "skew")
+
+    def __init__(self, cardinality: int, distribution: str = UNIFORM, skew: float = 1.0):
+        if cardinality < 1:
+            raise ValueError(f"cardinality must be at least 1, not {cardinality}")
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {', '.join(DISTRIBUTIONS)}, not {distribution!r}")
+        self.cardinality = cardinality
+        self.distribution = distribution
+        self.skew = skew
+
+    def _key(self):
+        return self.cardinality, self.distribution, self.skew
+
+    def __eq__(self, other):
+        return isinstance(other, KeyDistribution) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"KeyDistribution({self.cardinality}, {self.distribution!r}, skew={self.skew})"
+    pass
+
+
+class KeySampler:
+    """
+    Draws the values of a key attribute from a KeyDistribution. A value is the permuted rank of one of the
+    cardinality values, so no table of them is kept.
+
+    Args:
+        distribution: The KeyDistribution
+        random: Seeds the permutation
+    """
+
+    def __init__(self, distribution: KeyDistribution, random: Random):
+        self.distribution = distribution
+        self._permutation = Permutation(random)
+        self._counter = count()
+        self._weights = None
+        if distribution.distribution == ZIPF:
+            skew = distribution.skew
+            self._weights = list(accumulate(1 / rank ** skew for rank in range(1, distribution.cardinality + 1)))
+
+    def seek(self, position: int):
+        """Make position the next position of a sequential distribution"""
+        self._counter = count(position)
+
+    def sample(self, random: Random) -> int:
+        """Draw a value, using the given Random for uniform and zipf distributions"""
+        cardinality = self.distribution.cardinality
+        if self._weights is not None:
+            weights = self._weights
+            # min() guards against random() * total rounding up to total
+            return self._permutation(min(bisect(weights, random.random() * weights[-1]), len(weights) - 1))
+        if self.distribution.distribution == SEQUENTIAL:
+            return self._permutation(next(self._counter) % cardinality)
+        return self._permutation(random.randrange(cardinality))
+
+    def column(self, columns: ColumnGenerator, n: int) -> List[int]:
+        """Draw n values at once, using the ColumnGenerator for uniform and zipf distributions"""
+        cardinality = self.distribution.cardinality
+        if self._weights is not None:
+            ranks = columns.choices(n, self._weights)
+        elif self.distribution.distribution == SEQUENTIAL:
+            ranks = [next(self._counter) % cardinality for _ in range(n)]
+        else:
+            ranks = columns.integers(n, 0, cardinality - 1)
+        permutation = self._permutation
+        return [permutation(rank) for rank in ranks]
+    pass
+
+
+class KeySpace:
+    """
+    Allocates unique keys for one factory, without keeping the keys already allocated
+
+    Unique keys are a permuted counter, so allocating one is safe from several threads at once. Partition keys are
+    chosen from a fixed number of partitions, either uniformly or with a Zipf distribution, so the first partitions
+    are much hotter than the rest. The keys of secondary indexes are drawn from their own KeyDistributions.
+
+    Args:
+        random: Seeds the permutations
+        cardinality: (Optional) The number of distinct partition keys
+        skew: (Optional) The exponent of the Zipf distribution of partition keys. Defaults to 0, which is uniform.
+        distributions: (Optional) The KeyDistribution of each secondary index key attribute, by attribute name
+    """
+
+    def __init__(self, random: Random, cardinality: Optional[int] = None, skew: float = 0.0,
+                 distributions: Optional[Dict[str, KeyDistribution]] = None):
+        self._unique = Permutation(random)
+        self._partitions = None
+        if cardinality:
+            self._partitions = KeySampler(KeyDistribution(cardinality, ZIPF if skew else UNIFORM, skew), random)
+        self._counter = count()
+        self._samplers = {
+            field_name: KeySampler(distribution, random)
+            for field_name, distribution in sorted((distributions or {}).items())
+        }
+
+    def seek(self, position: int):
+        """Make position the next unique key to allocate, and the next position of sequential index keys"""
+        self._counter = count(position)
+        for sampler in self._samplers.values():
+            sampler.seek(position)
+
+    def unique(self) -> int:
+        """Allocate a key that hasn't been allocated before"""
+        position = next(self._counter)
+        if position > KEY_MASK:
+            raise OverflowError("all unique keys have been allocated")
+        return self._unique(position)
+
+    def partition(self, random: Random) -> int:
+        """Choose a partition key, drawing from the given Random"""
+        return self._partitions.sample(random)
+
+    def sampler(self, field_name: str) -> KeySampler:
+        """Get the KeySampler for a secondary index key attribute"""
+        return self._samplers[field_name]
+    pass
+
+
+def compile_key_value(field_name: str, field: Attribute) -> Callable[[int], Any]:
+    """
+    Get a callable which turns an allocated key into a value for the attribute. Distinct keys always give distinct
+    values.
+
+    Raises:
+        UnsupportedException: The attribute type can't be generated as a unique key
+    """
+    if isinstance(field, UTCDateTimeAttribute):
+        return lambda key: KEY_EPOCH + timedelta(microseconds=key)
+    if isinstance(field, UnicodeAttribute):
+        return lambda key: f"{key:012x}"
+    if isinstance(field, NumberAttribute):
+        return lambda key: key
+    if isinstance(field, BinaryAttribute):
+        return lambda key: key.to_bytes(KEY_BITS // 8, "big")
+    raise UnsupportedException(f"Field {field_name}: {type(field)} can't be generated as a unique key")
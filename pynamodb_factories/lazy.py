@@ -0,0 +1,125 @@
+from typing import Any, Callable, Dict
+
+BuildStep = Callable[[dict, dict], None]
+
+
+class LazyAttributeValues(dict):
+    """
+    The attribute_values of a lazily built model instance. PynamoDB reads every attribute through this dict, so an
+    attribute that hasn't been generated yet is generated by its build step when it's first read, including when the
+    instance is serialized or saved. Setting an attribute first means it's never generated.
+
+    Anything that reads the dict as a whole, like iterating it or copying it, generates every attribute first.
+
+    Args:
+        values: The values already set on the instance, from its build args and defaults
+        instance: The model instance
+        kwargs: The build kwargs, which the build steps take their build args from
+        pending: The build step of each attribute still to generate, by attribute name
+    """
+    __slots__ = ("_instance", "_kwargs", "_pending")
+
+    def __init__(self, values: Dict[str, Any], instance: Any, kwargs: dict, pending: Dict[str, BuildStep]):
+        super().__init__(values)
+        self._instance = instance
+        self._kwargs = kwargs
+        self._pending = pending
+
+    @property
+    def pending(self):
+        """The names of the attributes still to generate"""
+        return list(self._pending)
+
+    def _generate(self, key: str):
+        step = self._pending.pop(key, None)
+        if step is None:
+            return
+        build_args = {}
+        step(self._kwargs, build_args)
+        if key in build_args:
+            # Set it through the attribute, like the model constructor does
+            setattr(self._instance, key, build_args[key])
+
+    def generate_all(self):
+        """Generate every attribute still to generate"""
+        while self._pending:
+            self._generate(next(iter(self._pending)))
+
+    def get(self, key, default=None):
+        if self._pending:
+            self._generate(key)
+        return dict.get(self, key, default)
+
+    def __getitem__(self, key):
+        if self._pending:
+            self._generate(key)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if self._pending:
+            self._generate(key)
+        return dict.__contains__(self, key)
+
+    def __setitem__(self, key, value):
+        self._pending.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._pending.pop(key, None)
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        self._pending.pop(key, None)
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        if self._pending:
+            self._generate(key)
+        return dict.setdefault(self, key, default)
+
+    def __iter__(self):
+        self.generate_all()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self.generate_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self.generate_all()
+        return dict.keys(self)
+
+    def values(self):
+        self.generate_all()
+        return dict.values(self)
+
+    def items(self):
+        self.generate_all()
+        return dict.items(self)
+
+    def copy(self):
+        self.generate_all()
+        return dict.copy(self)
+
+    def __eq__(self, other):
+        self.generate_all()
+        if isinstance(other, LazyAttributeValues):
+            other.generate_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self.generate_all()
+        if isinstance(other, LazyAttributeValues):
+            other.generate_all()
+        return dict.__ne__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self.generate_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        # Copies and pickles get a plain dict, with every attribute generated
+        return dict, (self.copy(),)
+    pass
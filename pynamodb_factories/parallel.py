@@ -0,0 +1,51 @@
+import os
+from collections import deque
+from typing import Callable, Iterator, List, Optional
+
+# Each instance of a parallel build is built as by build_range(), from the run seed and its position, so the output
+# doesn't depend on how many workers there are or how the run is split into chunks.
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def iter_build_parallel(factory, n: int, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        seed: Optional[int] = None, item_kwargs: Optional[Callable[[int], dict]] = None,
+                        kwargs: Optional[dict] = None) -> Iterator[dict]:
+    """
+    Build serialized instances of the factory's __model__ across a pool of processes, in order
+
+    Args:
+        factory: The factory class. It must be importable by the worker processes, so it can't be defined locally.
+        n: The number of instances to build
+        workers: (Optional) The number of worker processes. Defaults to the number of CPUs.
+        chunk_size: (Optional) The number of instances each worker builds at a time
+        seed: (Optional) The seed for the run. The same seed always produces the same output. Defaults to a seed
+            drawn from the factory's random state, so set_random_seed() makes the run reproducible.
+        item_kwargs: (Optional) A callable which takes the index of the instance and returns a dict of build kwargs.
+            It must be picklable.
+        kwargs: (Optional) Build kwargs shared by every instance
+    Returns:
+        A generator of serialized instances, as from Model.serialize()
+    """
+    # Imported here, because it pulls in multiprocessing, which slows down importing this package
+    from concurrent.futures import ProcessPoolExecutor
+
+    if seed is None:
+        seed = factory.get_random().getrandbits(63)
+    workers = workers or os.cpu_count() or 1
+    starts = range(0, n, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded number of chunks in flight, so results stream with bounded memory
+        pending = deque()
+        for start in starts:
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(
+                _build_chunk, factory, seed, start, min(chunk_size, n - start), item_kwargs, kwargs or {}))
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _build_chunk(factory, seed: int, start: int, size: int, item_kwargs: Optional[Callable[[int], dict]],
+                 kwargs: dict) -> List[dict]:
+    # Unique keys are seeked to each instance's position in the run, so they don't collide across chunks
+    return factory.build_range(start, start + size, seed, serialized=True, item_kwargs=item_kwargs, **kwargs)
@@ -0,0 +1,223 @@
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+from pynamodb_factories.saving import SaveResult, save_models
+
+# Async builds hand instances from the executor to the event loop this many at a time. Saving sends them to
+# BatchWriteItem in 25s, so this is a multiple of 25.
+DEFAULT_ASYNC_CHUNK_SIZE = 100
+# The number of built chunks to hold before the builder waits for them to be consumed
+DEFAULT_QUEUE_SIZE = 8
+
+
+class PipelineMetrics(SaveResult):
+    """
+    Counters for an async build or save pipeline, updated as it runs. Pass one in to watch a pipeline from another
+    task.
+
+    Attributes:
+        items: The number of instances consumed: yielded by an async iterator, or saved by an async writer
+        seconds: The time since the pipeline started, as of the last update
+        built: The number of instances built
+        chunks: The number of chunks built
+        queue_depth: The number of built chunks waiting to be consumed
+        max_queue_depth: The deepest the queue has been
+    """
+
+    def __init__(self):
+        super().__init__(0, 0.0)
+        self.built = 0
+        self.chunks = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+        self._start: Optional[float] = None
+
+    @property
+    def mean_queue_depth(self) -> float:
+        """The average queue depth, sampled each time a chunk is queued"""
+        return self._depth_total / self._depth_samples if self._depth_samples else 0.0
+
+    @property
+    def built_per_second(self) -> float:
+        return self.built / self.seconds if self.seconds else 0.0
+
+    def _started(self):
+        if self._start is None:
+            self._start = perf_counter()
+
+    def _queued(self, size: int, depth: int):
+        self.built += size
+        self.chunks += 1
+        self._sample(depth)
+
+    def _consumed(self, size: int, depth: int):
+        self.items += size
+        self._sample(depth)
+
+    def _sample(self, depth: int):
+        self.queue_depth = depth
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self._depth_total += depth
+        self._depth_samples += 1
+        self.seconds = perf_counter() - self._start
+
+    def __repr__(self):
+        return (f"PipelineMetrics(items={self.items}, built={self.built}, seconds={self.seconds:.3f}, "
+                f"items_per_second={self.items_per_second:.1f}, queue_depth={self.queue_depth}, "
+                f"max_queue_depth={self.max_queue_depth})")
+    pass
+
+
+class _Failed:
+    """Passes an exception from the builder task to the consumer"""
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+    pass
+
+
+async def _produce(factory, queue, n: int, chunk_size: int, seed: int, serialized: bool,
+                   item_kwargs: Optional[Callable[[int], dict]], executor, metrics: PipelineMetrics, kwargs: dict,
+                   consumers: int):
+    import asyncio
+    loop = asyncio.get_running_loop()
+    try:
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            chunk = await loop.run_in_executor(
+                executor, lambda: factory.build_range(start, stop, seed, serialized, item_kwargs, **kwargs))
+            # Waits while the queue is full, so building never runs too far ahead of consuming
+            await queue.put(chunk)
+            metrics._queued(len(chunk), queue.qsize())
+    except Exception as error:
+        await queue.put(_Failed(error))
+        return
+    for _ in range(consumers):
+        await queue.put(None)
+
+
+def _resolve_seed(factory, seed: Optional[int]) -> int:
+    # Chunks are built in executor threads, which don't share the calling thread's random state. Drawing the run seed
+    # here means seeding the factory in the calling thread still makes the run reproducible.
+    return factory.get_random().getrandbits(63) if seed is None else seed
+
+
+async def aiter_build(factory, n: int, chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+                      queue_size: int = DEFAULT_QUEUE_SIZE, seed: Optional[int] = None, serialized: bool = False,
+                      item_kwargs: Optional[Callable[[int], dict]] = None, executor=None,
+                      metrics: Optional[PipelineMetrics] = None, kwargs: Optional[dict] = None) -> AsyncIterator[Any]:
+    """
+    Build instances of the factory's __model__ in an executor, a chunk at a time, and yield them without blocking the
+    event loop. Built chunks wait in a bounded queue, so building pauses when the consumer falls behind.
+
+    Args:
+        factory: The factory class
+        n: The number of instances to build
+        chunk_size: (Optional) The number of instances to build at a time
+        queue_size: (Optional) The number of built chunks to hold before building waits
+        seed: (Optional) The seed for the run. See build_range. Defaults to a seed drawn from the factory's random
+            state in the calling thread.
+        serialized: (Optional) Yield the serialized form of each instance, as from build_serialized()
+        item_kwargs: (Optional) A callable which takes the index of the instance and returns a dict of build kwargs
+        executor: (Optional) The concurrent.futures executor to build in. Defaults to the event loop's default
+            executor.
+        metrics: (Optional) The PipelineMetrics to update
+        kwargs: (Optional) Build kwargs shared by every instance
+    Returns:
+        An async generator of instances of the __model__ schema class, or their serialized form
+    """
+    import asyncio
+    metrics = metrics if metrics is not None else PipelineMetrics()
+    metrics._started()
+    queue = asyncio.Queue(maxsize=queue_size)
+    producer = asyncio.ensure_future(_produce(
+        factory, queue, n, chunk_size, _resolve_seed(factory, seed), serialized, item_kwargs, executor, metrics,
+        kwargs or {}, 1))
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            if isinstance(chunk, _Failed):
+                raise chunk.error
+            metrics._consumed(len(chunk), queue.qsize())
+            for item in chunk:
+                yield item
+    finally:
+        if not producer.done():
+            # The consumer stopped early
+            producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+
+async def abuild_batch(factory, n: int, chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+                       queue_size: int = DEFAULT_QUEUE_SIZE, seed: Optional[int] = None, serialized: bool = False,
+                       item_kwargs: Optional[Callable[[int], dict]] = None, executor=None,
+                       metrics: Optional[PipelineMetrics] = None, kwargs: Optional[dict] = None) -> List[Any]:
+    """Build a list of instances without blocking the event loop. See aiter_build."""
+    return [item async for item in aiter_build(
+        factory, n, chunk_size, queue_size, seed, serialized, item_kwargs, executor, metrics, kwargs)]
+
+
+async def asave_batch(factory, n: int, writers: int = 4, chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+                      queue_size: int = DEFAULT_QUEUE_SIZE, seed: Optional[int] = None,
+                      item_kwargs: Optional[Callable[[int], dict]] = None, executor=None,
+                      metrics: Optional[PipelineMetrics] = None, kwargs: Optional[dict] = None) -> PipelineMetrics:
+    """
+    Build instances of the factory's __model__ and save them to its table, without blocking the event loop. Chunks
+    are built in an executor and wait in a bounded queue, while writer tasks save them concurrently with the
+    model's batch_write(), also in the executor. Building pauses while the queue is full.
+
+    Args:
+        factory: The factory class
+        n: The number of instances to build and save
+        writers: (Optional) The number of chunks to save concurrently. They share the model's connection.
+        chunk_size: (Optional) The number of instances to build and save at a time
+        queue_size: (Optional) The number of built chunks to hold before building waits
+        seed: (Optional) The seed for the run. See aiter_build.
+        item_kwargs: (Optional) A callable which takes the index of the instance and returns a dict of build kwargs
+        executor: (Optional) The concurrent.futures executor to build and save in. It needs a thread for the builder
+            and each writer. Defaults to the event loop's default executor.
+        metrics: (Optional) The PipelineMetrics to update
+        kwargs: (Optional) Build kwargs shared by every instance
+    Returns:
+        The PipelineMetrics of the run. Its items are the number of instances saved.
+    """
+    import asyncio
+    if writers < 1:
+        raise ValueError("writers must be at least 1")
+    loop = asyncio.get_running_loop()
+    model = factory._get_model()
+    metrics = metrics if metrics is not None else PipelineMetrics()
+    metrics._started()
+    queue = asyncio.Queue(maxsize=queue_size)
+
+    async def write():
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                return
+            if isinstance(chunk, _Failed):
+                raise chunk.error
+            depth = queue.qsize()
+            saved = await loop.run_in_executor(executor, save_models, model, chunk)
+            metrics._consumed(saved, depth)
+
+    tasks = [asyncio.ensure_future(_produce(
+        factory, queue, n, chunk_size, _resolve_seed(factory, seed), False, item_kwargs, executor, metrics,
+        kwargs or {}, writers))]
+    tasks += [asyncio.ensure_future(write()) for _ in range(writers)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return metrics
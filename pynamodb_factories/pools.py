@@ -0,0 +1,36 @@
+from random import Random
+from typing import Any, Callable, List
+
+
+class ValuePool:
+    """
+    A bounded pool of pre-generated values to sample from, in place of calling an expensive generator every time.
+
+    The pool fills lazily. Until it reaches its size, each sample is a newly generated value which is added to the
+    pool. After that, samples are drawn from the pool at random. With a refresh rate, each sample has that chance of
+    first replacing a random member of the pool with a newly generated value, so the pool slowly rotates.
+
+    Args:
+        generate: Called with no arguments to generate a new value
+        size: The maximum number of values to keep
+        refresh: (Optional) The chance, from 0 to 1, that a sample replaces a pool member. Defaults to 0.
+    """
+
+    def __init__(self, generate: Callable[[], Any], size: int, refresh: float = 0.0):
+        self.generate = generate
+        self.size = size
+        self.refresh = refresh
+        self.values: List[Any] = []
+
+    def sample(self, random: Random) -> Any:
+        """Get a value from the pool, using the given Random to choose it"""
+        values = self.values
+        if len(values) < self.size:
+            value = self.generate()
+            values.append(value)
+            return value
+        index = random.randrange(self.size)
+        if self.refresh and random.random() < self.refresh:
+            values[index] = self.generate()
+        return values[index]
+    pass
@@ -0,0 +1,104 @@
+from datetime import datetime
+from decimal import Decimal
+from itertools import count
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Type, TypeVar
+
+from pynamodb.attributes import MapAttribute
+
+from pynamodb_factories.serialization import SerializedValue
+
+T = TypeVar("T")
+BuildStep = Callable[[dict, dict], None]
+
+# Values of these types are never changed in place, so clones can share them
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, Decimal, datetime, SerializedValue, type(None))
+
+
+def clone_value(value: Any) -> Any:
+    """
+    Copy the mutable parts of an attribute value: sets, lists, dicts and MapAttribute instances. Unlike deepcopy,
+    this keeps no memo and shares every immutable value.
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, (set, frozenset)):
+        # Set members are hashable, so they're immutable
+        return set(value)
+    if isinstance(value, list):
+        return [clone_value(each) for each in value]
+    if isinstance(value, dict):
+        return {key: clone_value(each) for key, each in value.items()}
+    if isinstance(value, MapAttribute):
+        return type(value)(**{key: clone_value(each) for key, each in value.attribute_values.items()})
+    return value
+
+
+class Prototype(Generic[T]):
+    """
+    A template of a factory's model, which new instances are cloned from. Only the varying attributes are generated
+    for each instance, so building from a prototype costs in proportion to them, not to the whole model.
+
+    Create one with PynamoModelFactory.prototype(), and keep it for as long as you build from it.
+
+    Args:
+        model: The model class
+        template: The args for the model constructor of the template instance
+        steps: The build steps of the varying attributes
+        size_step: (Optional) The build step which steers instances to the factory's __target_item_bytes__
+    """
+
+    def __init__(self, model: Type[T], template: dict, steps: Dict[str, BuildStep],
+                 size_step: Optional[BuildStep] = None):
+        self.model = model
+        self.steps = steps
+        self._size_step = size_step
+        fixed = {field_name: value for field_name, value in template.items() if field_name not in steps}
+        self._shared = {field_name: value for field_name, value in fixed.items()
+                        if isinstance(value, IMMUTABLE_TYPES)}
+        self._copied = [(field_name, value) for field_name, value in fixed.items()
+                        if field_name not in self._shared]
+        self._fields = set(model.get_attributes())
+
+    @property
+    def varying(self) -> List[str]:
+        """The names of the attributes generated for each instance"""
+        return list(self.steps)
+
+    def build(self, **kwargs) -> T:
+        """
+        Builds an instance by cloning the template and generating its varying attributes
+
+        Args:
+            kwargs: Build kwargs for the varying attributes, or values to replace any of the others with
+        """
+        build_args = self._shared.copy()
+        for field_name, value in self._copied:
+            build_args[field_name] = clone_value(value)
+        for step in self.steps.values():
+            step(kwargs, build_args)
+        for field_name, value in kwargs.items():
+            if field_name not in self.steps and field_name in self._fields:
+                build_args[field_name] = value
+        if self._size_step is not None:
+            # Only resize the varying attributes, by passing the rest as if they were build kwargs
+            self._size_step((build_args.keys() - self.steps.keys()) | kwargs.keys(), build_args)
+        return self.model(**build_args)
+
+    def build_batch(self, n: int, item_kwargs: Optional[Callable[[int], dict]] = None, **kwargs) -> List[T]:
+        """Builds a list of instances. See iter_build."""
+        return list(self.iter_build(n, item_kwargs, **kwargs))
+
+    def iter_build(self, n: Optional[int] = None, item_kwargs: Optional[Callable[[int], dict]] = None,
+                   **kwargs) -> Iterator[T]:
+        """
+        Lazily builds instances, one at a time
+
+        Args:
+            n: (Optional) The number of instances to build. If omitted, builds forever.
+            item_kwargs: (Optional) A callable which takes the index of the instance and returns a dict of build
+                kwargs. These are merged over the shared kwargs.
+            kwargs: Build kwargs shared by every instance
+        """
+        for index in count() if n is None else range(n):
+            yield self.build(**kwargs) if item_kwargs is None else self.build(**{**kwargs, **item_kwargs(index)})
+    pass
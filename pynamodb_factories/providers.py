@@ -0,0 +1,252 @@
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Type
+
+from pynamodb.attributes import (
+    Attribute, BinaryAttribute, BinarySetAttribute, UnicodeAttribute, UnicodeSetAttribute, JSONAttribute,
+    BooleanAttribute, NumberAttribute, NumberSetAttribute, VersionAttribute, TTLAttribute, UTCDateTimeAttribute,
+    NullAttribute, MapAttribute, ListAttribute
+)
+
+try:
+    from pynamodb.attributes import DynamicMapAttribute
+except ImportError:
+    DynamicMapAttribute = None
+    pass
+
+from pynamodb_factories.columns import ColumnGenerator
+
+# A provider generates the value for one attribute. It's called with the factory class, the schema attribute object,
+# and the build arg for the attribute, which is None if there isn't one.
+Provider = Callable[[Any, Attribute, Any], Any]
+# A column generates n values for one attribute at once, for vectorized batch builds
+Column = Callable[[ColumnGenerator, int], list]
+
+
+def fake_binary(factory, field, build_arg):
+    return build_arg if build_arg is not None else bytes(_sentence(factory), 'utf-8')
+
+
+def fake_binary_set(factory, field, build_arg):
+    if build_arg is not None:
+        return build_arg
+    return _unique(map(_utf8_bytes, _sentences(factory, factory.get_collection_size(field))), b" #%d")
+
+
+def fake_boolean(factory, field, build_arg):
+    return build_arg if build_arg is not None else factory.get_faker().pybool()
+
+
+def fake_unicode(factory, field, build_arg):
+    return build_arg if build_arg is not None else _sentence(factory)
+
+
+def fake_unicode_set(factory, field, build_arg):
+    if build_arg is not None:
+        return build_arg
+    return _unique(_sentences(factory, factory.get_collection_size(field)), " #%d")
+
+
+def fake_json(factory, field, build_arg):
+    return build_arg if build_arg is not None else dict(_pooled(factory, 'json', _json))
+
+
+def fake_version(factory, field, build_arg):
+    return build_arg if build_arg is not None else factory.get_faker().pyint(1, 5)
+
+
+def fake_number(factory, field, build_arg):
+    return build_arg if build_arg is not None else factory.get_faker().pyint()
+
+
+def fake_number_set(factory, field, build_arg):
+    if build_arg is not None:
+        return build_arg
+    # Sampling a range draws distinct members without retrying. Same range as Faker's pyint(), unless the set is
+    # larger than it.
+    n = factory.get_collection_size(field)
+    return set(factory.get_random().sample(range(max(10000, n)), n))
+
+
+def fake_ttl(factory, field, build_arg):
+    return build_arg if build_arg is not None else factory.get_faker().date_time_this_year(
+        after_now=True, tzinfo=timezone.utc)
+
+
+def fake_datetime(factory, field, build_arg):
+    return build_arg if build_arg is not None else factory.get_faker().date_time(tzinfo=timezone.utc)
+
+
+def fake_null(factory, field, build_arg):
+    return None
+
+
+def fake_map(factory, field, build_arg):
+    if field.is_raw() and not (DynamicMapAttribute and isinstance(field, DynamicMapAttribute)):
+        # Just a raw MapAttribute. PynamoDB serializes a dict set on a DynamicMapAttribute with its internals, so those
+        # are built as an instance of their own, like typed maps.
+        return build_arg if build_arg is not None else dict(_pooled(factory, 'pydict', _pydict))
+    build_arg = build_arg if build_arg is not None else {}
+    return factory._get_nested_factory(field.__class__).build(**build_arg)
+
+
+def fake_list(factory, field, build_arg):
+    if field.element_type:
+        nested_factory = factory._get_nested_factory(field.element_type)
+        values = []
+        if build_arg is not None:
+            for arg in build_arg:
+                values.append(nested_factory.build(**arg))
+        else:
+            for _ in range(factory.get_collection_size(field)):
+                values.append(nested_factory.build())
+        return values
+    return _words(factory, factory.get_collection_size(field))
+
+
+def number_column(columns: ColumnGenerator, n: int) -> list:
+    # Same range as Faker's pyint()
+    return columns.integers(n, 0, 9999)
+
+
+def version_column(columns: ColumnGenerator, n: int) -> list:
+    return columns.integers(n, 1, 5)
+
+
+def boolean_column(columns: ColumnGenerator, n: int) -> list:
+    return columns.booleans(n)
+
+
+def ttl_column(columns: ColumnGenerator, n: int) -> list:
+    # Any time this year, same as Faker's date_time_this_year(after_now=True)
+    now = datetime.now(timezone.utc)
+    return columns.datetimes(n, datetime(now.year, 1, 1, tzinfo=timezone.utc),
+                             datetime(now.year + 1, 1, 1, tzinfo=timezone.utc))
+
+
+def datetime_column(columns: ColumnGenerator, n: int) -> list:
+    # Between the epoch and now, same as Faker's date_time()
+    return columns.datetimes(n, datetime.fromtimestamp(0, timezone.utc), datetime.now(timezone.utc))
+
+
+# The providers for the attribute types PynamoDB ships with. Subclasses of these types use the provider of their
+# nearest registered base class.
+DEFAULT_PROVIDERS: Dict[Type[Attribute], Provider] = {
+    BinaryAttribute: fake_binary,
+    BinarySetAttribute: fake_binary_set,
+    BooleanAttribute: fake_boolean,
+    UnicodeAttribute: fake_unicode,
+    UnicodeSetAttribute: fake_unicode_set,
+    JSONAttribute: fake_json,
+    VersionAttribute: fake_version,
+    NumberAttribute: fake_number,
+    NumberSetAttribute: fake_number_set,
+    TTLAttribute: fake_ttl,
+    UTCDateTimeAttribute: fake_datetime,
+    NullAttribute: fake_null,
+    MapAttribute: fake_map,
+    ListAttribute: fake_list,
+}
+if DynamicMapAttribute:
+    DEFAULT_PROVIDERS[DynamicMapAttribute] = fake_map
+
+# The Faker provider modules the default providers use. Pass these to configure_default_faker() to avoid loading the
+# rest of them.
+FAKER_PROVIDERS = [
+    "faker.providers.address",
+    "faker.providers.date_time",
+    "faker.providers.internet",
+    "faker.providers.job",
+    "faker.providers.lorem",
+    "faker.providers.person",
+    "faker.providers.phone_number",
+    "faker.providers.python",
+]
+
+# Providers which can be replaced by a column in vectorized batch builds
+PROVIDER_COLUMNS: Dict[Provider, Column] = {
+    fake_number: number_column,
+    fake_version: version_column,
+    fake_boolean: boolean_column,
+    fake_ttl: ttl_column,
+    fake_datetime: datetime_column,
+}
+
+
+def _pooled(factory, name: str, generate: Callable[[Any], Any]):
+    """Generate a value with the factory's Faker, or sample one from the factory's pool when pooling is on"""
+    faker = factory.get_faker()
+    pool = factory.get_pool(name, lambda: generate(faker))
+    if pool is None:
+        return generate(faker)
+    return pool.sample(factory.get_random())
+
+
+def _pooled_list(factory, name: str, generate: Callable[[Any], Any], generate_many: Callable[[Any, int], list],
+                 n: int) -> list:
+    """Generate n values with the factory's Faker, or sample them from the factory's pool when pooling is on"""
+    faker = factory.get_faker()
+    pool = factory.get_pool(name, lambda: generate(faker))
+    if pool is None:
+        return generate_many(faker, n)
+    random = factory.get_random()
+    return [pool.sample(random) for _ in range(n)]
+
+
+def _sentence(factory) -> str:
+    return _pooled(factory, 'sentence', _fake_sentence)
+
+
+def _sentences(factory, n: int) -> List[str]:
+    return _pooled_list(factory, 'sentence', _fake_sentence, _fake_sentences, n)
+
+
+def _words(factory, n: int) -> List[str]:
+    return _pooled_list(factory, 'word', _fake_word, _fake_words, n)
+
+
+def _fake_sentence(faker) -> str:
+    return faker.sentence()
+
+
+def _fake_sentences(faker, n: int) -> List[str]:
+    return faker.sentences(n)
+
+
+def _fake_word(faker) -> str:
+    return faker.word()
+
+
+def _fake_words(faker, n: int) -> List[str]:
+    return faker.words(n)
+
+
+def _json(faker) -> dict:
+    return faker.pydict(
+        allowed_types=['str', 'int', 'float', 'email', 'address', 'job', 'phone_number', 'name', 'iso8601'])
+
+
+def _pydict(faker) -> dict:
+    # Raw maps can't serialize Faker's datetimes and Decimals
+    return faker.pydict(value_types=(str, int))
+
+
+def _utf8_bytes(string):
+    return bytes(string, 'utf-8')
+
+
+def _unique(values: Iterable, suffix) -> set:
+    """
+    Make a set of all the values, in linear time. Repeated values get the suffix formatted with their position, so
+    the set keeps as many members as there were values. Faker's sentences never contain a #, so suffixed values can't
+    collide with the rest.
+    """
+    values = list(values)
+    members = set(values)
+    if len(members) == len(values):
+        return members
+    members = set()
+    for position, value in enumerate(values):
+        if value in members:
+            value = value + suffix % position
+        members.add(value)
+    return members
@@ -0,0 +1,43 @@
+"""
+A pytest plugin providing a session-scoped FixtureCache, so session datasets are only built once across test runs.
+
+Enable it in your top-level conftest.py:
+```
+pytest_plugins = ["pynamodb_factories.pytest_plugin"]
+
+@pytest.fixture(scope="session")
+def users(factory_cache):
+    return factory_cache.build_batch(UserFactory, 10000, seed=1)
+```
+
+Options:
+    --factory-cache-dir: The directory to keep batches in. Also the factory_cache_dir ini option.
+    --no-factory-cache: Build every batch instead of using the cache
+    factory_cache_max_bytes: An ini option for the size to keep the cache under
+"""
+import pytest
+
+from pynamodb_factories.cache import DEFAULT_MAX_BYTES, FixtureCache
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("pynamodb-factories")
+    group.addoption("--factory-cache-dir", default=None,
+                    help="directory to cache datasets built by pynamodb-factories in")
+    group.addoption("--no-factory-cache", action="store_true", default=False,
+                    help="build every pynamodb-factories dataset instead of loading it from the cache")
+    parser.addini("factory_cache_dir", "directory to cache datasets built by pynamodb-factories in")
+    parser.addini("factory_cache_max_bytes", "size to keep the pynamodb-factories dataset cache under",
+                  default=str(DEFAULT_MAX_BYTES))
+
+
+@pytest.fixture(scope="session")
+def factory_cache(request) -> FixtureCache:
+    """A FixtureCache configured from the command line and ini options"""
+    config = request.config
+    directory = config.getoption("--factory-cache-dir") or config.getini("factory_cache_dir") or None
+    return FixtureCache(
+        directory=directory,
+        max_bytes=int(config.getini("factory_cache_max_bytes")),
+        enabled=not config.getoption("--no-factory-cache"),
+    )
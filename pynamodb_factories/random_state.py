@@ -0,0 +1,104 @@
+from copy import deepcopy
+from random import Random
+from threading import local
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from pynamodb_factories.columns import ColumnGenerator
+from pynamodb_factories.pools import ValuePool
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+# The arguments for the Faker instances created for factories that don't have their own __faker__. Fakers created
+# before the configuration last changed are replaced on their next use.
+_faker_config: Dict[str, Any] = {}
+_faker_config_version = 0
+
+
+def configure_default_faker(locale: Optional[str] = None, providers: Optional[List[str]] = None, **config):
+    """
+    Configure the Faker instances created for factories that don't have their own __faker__
+
+    Args:
+        locale: (Optional) The Faker locale. Defaults to Faker's default locale.
+        providers: (Optional) The Faker provider modules to load, in place of all of them. Loading fewer providers
+            makes creating the Faker instance faster. See providers.FAKER_PROVIDERS for the ones the default
+            providers need.
+        config: Any other arguments for Faker()
+    """
+    global _faker_config, _faker_config_version
+    _faker_config = {**config}
+    if locale is not None:
+        _faker_config["locale"] = locale
+    if providers is not None:
+        _faker_config["providers"] = list(providers)
+    _faker_config_version += 1
+
+
+def index_seed(seed, index: int) -> str:
+    """Derive an independent, deterministic seed for the instance at one position of a run"""
+    return f"{seed}/{index}"
+
+
+class RandomState(local):
+    """
+    The random number generators used by a factory. Each thread gets its own generators, so concurrent builds don't
+    interfere with each other. Seeding only affects the calling thread.
+
+    The Faker instance draws from the same random.Random as the factory itself, so one seed determines everything
+    the factory generates. A factory's own __faker__ is copied for each thread, and the copy draws from it too. Value pools are kept here too, so they're never shared between threads.
+    """
+
+    def __init__(self):
+        self.random = Random()
+        self._seed = None
+        self._faker = None
+        self._faker_version = None
+        self._columns = None
+        self._custom_fakers: Dict[int, Tuple["Faker", "Faker"]] = {}
+        self.pools: Dict[Tuple, ValuePool] = {}
+        # Replaces the factory's shared key spaces in the calling thread, while building a range of a seeded run
+        self.key_spaces: Optional[dict] = None
+
+    @property
+    def seeded_with(self):
+        """The seed last set in the calling thread, or None"""
+        return self._seed
+
+    def seed(self, seed):
+        """Reset the calling thread's generators with a known seed"""
+        self._seed = seed
+        self.random.seed(seed)
+        # Pooled values were drawn from the old seed
+        self.pools.clear()
+        if self._columns is not None:
+            self._columns.seed(seed)
+
+    @property
+    def faker(self) -> "Faker":
+        # Faker is imported and created on first use, because loading its providers is slow
+        if self._faker is None or self._faker_version != _faker_config_version:
+            from faker import Faker
+            self._faker = Faker(**_faker_config)
+            self._faker.random = self.random
+            self._faker_version = _faker_config_version
+        return self._faker
+
+    def custom_faker(self, faker: "Faker") -> "Faker":
+        """Get the calling thread's copy of a factory's own Faker, with its locales and providers"""
+        entry = self._custom_fakers.get(id(faker))
+        if entry is None or entry[0] is not faker:
+            copied = deepcopy(faker)
+            # Each locale has its own generator, and a Faker with several of them can't set random on them all at once
+            for generator in getattr(copied, "factories", [copied]):
+                generator.random = self.random
+            # Keep the original, so its id isn't reused while the copy is cached
+            entry = self._custom_fakers[id(faker)] = (faker, copied)
+        return entry[1]
+
+    @property
+    def columns(self) -> ColumnGenerator:
+        if self._columns is None:
+            self._columns = ColumnGenerator(seed=self._seed)
+        return self._columns
+    pass
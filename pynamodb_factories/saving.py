@@ -0,0 +1,44 @@
+from typing import Iterable, Type
+
+from pynamodb.models import Model as PynamoModel
+
+
+class SaveResult:
+    """
+    The outcome of saving generated items to a table
+
+    Attributes:
+        items: The number of items saved
+        seconds: The time taken to build and save them
+    """
+
+    def __init__(self, items: int, seconds: float):
+        self.items = items
+        self.seconds = seconds
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return f"SaveResult(items={self.items}, seconds={self.seconds:.3f}, items_per_second={self.items_per_second:.1f})"
+    pass
+
+
+def save_models(model: Type[PynamoModel], items: Iterable[PynamoModel]) -> int:
+    """
+    Save items with the model's batch_write(). It sends BatchWriteItem requests of up to 25 items, and retries any
+    UnprocessedItems with exponential backoff, up to the model's Meta.max_retry_attempts.
+
+    Args:
+        model: The model class of the items
+        items: The items to save
+    Returns:
+        The number of items saved
+    """
+    count = 0
+    with model.batch_write() as batch:
+        for item in items:
+            batch.save(item)
+            count += 1
+    return count
@@ -0,0 +1,60 @@
+from typing import Any, Callable, Dict, List
+
+from pynamodb.attributes import Attribute, MapAttribute
+from pynamodb.exceptions import AttributeNullError
+
+# Serializes one attribute from the build args into the AttributeValue dict being built
+Serializer = Callable[[dict, Dict[str, Dict[str, Any]]], None]
+
+
+class SerializedValue:
+    """A value that is already in DynamoDB's serialized form, so it can be emitted as-is"""
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+    pass
+
+
+def compile_serializer(field_name: str, field: Attribute) -> Serializer:
+    """
+    Build a serializer for one attribute, which follows the same rules as constructing a Model and calling serialize()
+
+    Args:
+        field_name: The name of the attribute
+        field: The schema attribute object itself
+    Returns:
+        A callable taking the args for the model constructor and the dict of serialized attributes. It adds the
+        serialized value of this attribute to the dict, if there is one.
+    """
+    attr_name = field.attr_name
+    attr_type = field.attr_type
+    default = field.default_for_new if field.default_for_new is not None else field.default
+    if isinstance(field, MapAttribute):
+        def serialize(value):
+            return field.serialize(value, null_check=True)
+    else:
+        serialize = field.serialize
+
+    def serializer(build_args, attribute_values):
+        if field_name in build_args:
+            value = build_args[field_name]
+        else:
+            value = default() if callable(default) else default
+        if type(value) is SerializedValue:
+            attribute_values[attr_name] = {attr_type: value.value}
+            return
+        attr_value = serialize(value) if value is not None else None
+        if attr_value is None:
+            if not field.null:
+                raise AttributeNullError(field_name)
+            return
+        attribute_values[attr_name] = {attr_type: attr_value}
+    return serializer
+
+
+def serialize_build_args(serializers: List[Serializer], build_args: dict) -> Dict[str, Dict[str, Any]]:
+    attribute_values = {}
+    for serializer in serializers:
+        serializer(build_args, attribute_values)
+    return attribute_values
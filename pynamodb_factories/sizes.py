@@ -0,0 +1,153 @@
+from typing import Any, Callable, Dict, Optional
+
+from pynamodb.attributes import (
+    Attribute, BinaryAttribute, BinarySetAttribute, BooleanAttribute, NullAttribute, NumberAttribute,
+    NumberSetAttribute, TTLAttribute, UnicodeAttribute, UnicodeSetAttribute, UTCDateTimeAttribute
+)
+from pynamodb.constants import (
+    BINARY, BINARY_SET, BOOLEAN, LIST, MAP, NULL, NUMBER, NUMBER_SET, STRING, STRING_SET
+)
+
+from pynamodb_factories.serialization import SerializedValue
+
+# The largest item DynamoDB accepts
+MAX_ITEM_BYTES = 400 * 1024
+# Lists and maps take 3 bytes, plus 1 byte per element
+COLLECTION_OVERHEAD = 3
+# UTCDateTimeAttribute values are always formatted like 2020-01-01T00:00:00.000000+0000
+DATETIME_SIZE = 31
+
+# Measures the size of one attribute's value, including its name
+Sizer = Callable[[Any], int]
+
+
+def utf8_size(value: str) -> int:
+    return len(value) if value.isascii() else len(value.encode("utf-8"))
+
+
+def number_size(value: Any) -> int:
+    """The size of a number: 1 byte per 2 significant digits, plus 1 byte"""
+    mantissa = str(value).lower().split("e")[0].lstrip("-+")
+    digits = mantissa.replace(".", "").strip("0")
+    return (len(digits) + 1) // 2 + 1
+
+
+def base64_size(value: Any) -> int:
+    """The size of binary data, which PynamoDB may have base64 encoded"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return len(value) * 3 // 4 - value.count("=")
+
+
+def attribute_value_size(attribute_value: Dict[str, Any]) -> int:
+    """
+    The size DynamoDB counts for a serialized AttributeValue, without its name
+
+    Args:
+        attribute_value: A dict with a single type key, like {"S": "value"}
+    """
+    (attr_type, value), = attribute_value.items()
+    if attr_type == STRING:
+        return utf8_size(value)
+    if attr_type == NUMBER:
+        return number_size(value)
+    if attr_type == BINARY:
+        return base64_size(value)
+    if attr_type in (BOOLEAN, NULL):
+        return 1
+    if attr_type == STRING_SET:
+        return sum(utf8_size(each) for each in value)
+    if attr_type == NUMBER_SET:
+        return sum(number_size(each) for each in value)
+    if attr_type == BINARY_SET:
+        return sum(base64_size(each) for each in value)
+    if attr_type == LIST:
+        return COLLECTION_OVERHEAD + sum(1 + attribute_value_size(each) for each in value)
+    if attr_type == MAP:
+        return COLLECTION_OVERHEAD + sum(1 + utf8_size(name) + attribute_value_size(each)
+                                         for name, each in value.items())
+    raise ValueError(f"Unknown attribute type {attr_type}")
+
+
+def item_size(attribute_values: Dict[str, Dict[str, Any]]) -> int:
+    """The size DynamoDB counts for a serialized item, as from Model.serialize()"""
+    return sum(utf8_size(name) + attribute_value_size(value) for name, value in attribute_values.items())
+
+
+def compile_sizer(field: Attribute) -> Sizer:
+    """
+    Build a sizer for one attribute, which measures its value without serializing it where it can
+
+    Args:
+        field: The schema attribute object
+    Returns:
+        A callable taking the value of the attribute and returning the size DynamoDB counts for it, including its
+        name, or 0 if the value is None
+    """
+    name_size = utf8_size(field.attr_name)
+    attr_type = field.attr_type
+    measure: Optional[Callable[[Any], int]] = None
+    # PynamoDB leaves empty sets out of the item
+    is_set = isinstance(field, (UnicodeSetAttribute, NumberSetAttribute, BinarySetAttribute))
+    if isinstance(field, UnicodeAttribute):
+        measure = utf8_size
+    elif isinstance(field, BinaryAttribute):
+        measure = len
+    elif isinstance(field, NumberAttribute):
+        measure = number_size
+    elif isinstance(field, (BooleanAttribute, NullAttribute)):
+        def measure(_):
+            return 1
+    elif isinstance(field, UTCDateTimeAttribute):
+        def measure(_):
+            return DATETIME_SIZE
+    elif isinstance(field, TTLAttribute):
+        def measure(value):
+            return number_size(int(value.timestamp())) if hasattr(value, "timestamp") else number_size(value)
+    elif isinstance(field, UnicodeSetAttribute):
+        def measure(value):
+            return sum(utf8_size(each) for each in value)
+    elif isinstance(field, NumberSetAttribute):
+        def measure(value):
+            return sum(number_size(each) for each in value)
+    elif isinstance(field, BinarySetAttribute):
+        def measure(value):
+            return sum(len(each) for each in value)
+
+    def sizer(value):
+        if value is None or (is_set and not value):
+            return 0
+        if type(value) is SerializedValue:
+            return name_size + attribute_value_size({attr_type: value.value})
+        if measure is None:
+            serialized = field.serialize(value)
+            return name_size + attribute_value_size({attr_type: serialized}) if serialized is not None else 0
+        return name_size + measure(value)
+    return sizer
+
+
+def resize_text(value: str, size: int) -> str:
+    """
+    Grow or shrink a string to about size bytes of UTF-8, by repeating or truncating it. Multi-byte characters cut
+    in half are dropped, so the result may be a few bytes short.
+    """
+    size = max(size, 1)
+    if value.isascii():
+        if len(value) >= size:
+            return value[:size]
+        unit = (value or "x") + " "
+        return (unit * (size // len(unit) + 1))[:size]
+    encoded = value.encode("utf-8")
+    if len(encoded) < size:
+        unit = encoded + b" "
+        encoded = unit * (size // len(unit) + 1)
+    return encoded[:size].decode("utf-8", errors="ignore")
+
+
+def resize_binary(value: bytes, size: int) -> bytes:
+    """Grow or shrink binary data to size bytes, by repeating or truncating it"""
+    size = max(size, 1)
+    if len(value) >= size:
+        return value[:size]
+    unit = value or b"\0"
+    return (unit * (size // len(unit) + 1))[:size]
@@ -0,0 +1,60 @@
+from itertools import islice
+
+from pynamodb_factories.factory import PynamoModelFactory
+from tests.test_models.models import UnicodeModel, NumberModel
+
+
+class TestBatch:
+    def test_build_batch(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        actual = UnicodeFactory.build_batch(10, line='given line')
+        assert len(actual) == 10
+        for each in actual:
+            assert isinstance(each, UnicodeModel)
+            assert each.line == 'given line'
+        pass
+
+    def test_item_kwargs_callable(self):
+        class NumberFactory(PynamoModelFactory):
+            __model__ = NumberModel
+            pass
+
+        actual = NumberFactory.build_batch(5, lambda i: {'num': i})
+        assert [each.num for each in actual] == [0, 1, 2, 3, 4]
+        pass
+
+    def test_item_kwargs_iterable(self):
+        class NumberFactory(PynamoModelFactory):
+            __model__ = NumberModel
+            __allow_nulls__ = False
+            pass
+
+        actual = NumberFactory.build_batch(3, ({'num': i} for i in range(10)), nums={1})
+        assert [each.num for each in actual] == [0, 1, 2]
+        assert all(each.nums == {1} for each in actual)
+        pass
+
+    def test_iter_build(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        assert len(list(islice(UnicodeFactory.iter_build(), 7))) == 7
+        assert len(list(UnicodeFactory.iter_build(item_kwargs=[{}, {}]))) == 2
+        pass
+
+    def test_iter_build_is_reproducible(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        UnicodeFactory.set_random_seed(1)
+        batch = [each.line for each in UnicodeFactory.iter_build(5)]
+        UnicodeFactory.set_random_seed(1)
+        single = [UnicodeFactory.build().line for _ in range(5)]
+        assert batch == single
+        pass
+    pass
@@ -0,0 +1,30 @@
+from benchmarks.cases import CASES, deep_model, wide_model
+from benchmarks.runner import compare, measure
+
+
+class TestBenchmarks:
+    def test_cases_build(self):
+        for name, case in CASES.items():
+            assert case().build() is not None, name
+        pass
+
+    def test_shapes(self):
+        assert len(wide_model(10).get_attributes()) == 10
+        model = deep_model(3)
+        assert model.get_attributes()['root'].get_attributes()['child'].get_attributes()['child'] is not None
+        pass
+
+    def test_measure(self):
+        result = measure('unicode', items=5, rounds=1)
+        assert result['items_per_second'] > 0
+        assert result['peak_bytes'] > 0
+        pass
+
+    def test_compare(self):
+        baseline = {'a': {'items_per_second': 100.0}, 'b': {'items_per_second': 100.0}}
+        results = {'a': {'items_per_second': 80.0}, 'b': {'items_per_second': 70.0}, 'c': {'items_per_second': 1.0}}
+        regressions = compare(results, baseline, threshold=0.25)
+        assert len(regressions) == 1
+        assert regressions[0].startswith('b:')
+        pass
+    pass
@@ -0,0 +1,87 @@
+from faker import Faker
+
+from pynamodb_factories.factory import PynamoModelFactory
+from tests.test_models.models import JsonModel, MapListMapModel, NumberModel, UnicodeModel
+
+
+class MapListMapFactory(PynamoModelFactory):
+    __model__ = MapListMapModel
+    pass
+
+
+class TestBuildAt:
+    def test_build_at_is_reproducible(self):
+        first = MapListMapFactory.build_at(7, seed=3).serialize()
+        MapListMapFactory.build()
+        assert MapListMapFactory.build_at(7, seed=3).serialize() == first
+        assert MapListMapFactory.build_at(8, seed=3).serialize() != first
+        assert MapListMapFactory.build_at(7, seed=4).serialize() != first
+        pass
+
+    def test_range_matches_build_at(self):
+        items = [each.serialize() for each in MapListMapFactory.build_range(10, 20, seed=5)]
+        assert items == [MapListMapFactory.build_at(index, seed=5).serialize() for index in range(10, 20)]
+        assert items[5:] == [each.serialize() for each in MapListMapFactory.build_range(15, 20, seed=5)]
+        pass
+
+    def test_serialized(self):
+        expected = [each.serialize() for each in MapListMapFactory.build_range(0, 5, seed=1)]
+        assert MapListMapFactory.build_range(0, 5, seed=1, serialized=True) == expected
+        pass
+
+    def test_default_seed(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        UnicodeFactory.set_random_seed(9)
+        assert UnicodeFactory.build_at(2).line == UnicodeFactory.build_at(2, seed=9).line
+        pass
+
+    def test_does_not_change_random_state(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __pool_size__ = 4
+            pass
+
+        UnicodeFactory.set_random_seed(2)
+        expected = [each.line for each in UnicodeFactory.build_batch(10)]
+        UnicodeFactory.set_random_seed(2)
+        actual = [each.line for each in UnicodeFactory.build_batch(5)]
+        UnicodeFactory.build_range(0, 3, seed=1)
+        actual += [each.line for each in UnicodeFactory.build_batch(5)]
+        assert actual == expected
+        pass
+
+    def test_pools_are_not_used(self):
+        class JsonFactory(PynamoModelFactory):
+            __model__ = JsonModel
+            __pool_size__ = 1
+            pass
+
+        items = [each.serialize() for each in JsonFactory.build_range(0, 5, seed=1)]
+        assert items[3] == JsonFactory.build_at(3, seed=1).serialize()
+        pass
+
+    def test_custom_faker(self):
+        class NumberFactory(PynamoModelFactory):
+            __model__ = NumberModel
+            __faker__ = Faker()
+            pass
+
+        expected = [each.num for each in NumberFactory.build_range(0, 10, seed=1)]
+        NumberFactory.__faker__.pyint()
+        assert [NumberFactory.build_at(index, seed=1).num for index in range(10)] == expected
+        pass
+
+    def test_item_kwargs_use_position_in_run(self):
+        class NumberFactory(PynamoModelFactory):
+            __model__ = NumberModel
+            pass
+
+        items = NumberFactory.build_range(5, 8, seed=1, item_kwargs=lambda index: {'num': index})
+        assert [each.num for each in items] == [5, 6, 7]
+        items = NumberFactory.build_range(5, 8, seed=1, item_kwargs=[{'num': 1}, {'num': 2}])
+        assert [each.num for each in items] == [1, 2]
+        pass
+    pass
@@ -0,0 +1,77 @@
+from pytest import raises
+
+from pynamodb_factories.exceptions import RequiredArgumentError
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.fields import Required
+from tests.test_models.models import UnicodeModel, NumberModel
+
+
+class TestBuildPlan:
+    def test_plan_is_reused(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        UnicodeFactory.build()
+        plan = UnicodeFactory._get_plan()
+        UnicodeFactory.build()
+        assert UnicodeFactory._get_plan() is plan
+        pass
+
+    def test_plan_is_invalidated(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        UnicodeFactory.build()
+        UnicodeFactory.line = 'given line'
+        assert UnicodeFactory.build().line == 'given line'
+
+        del UnicodeFactory.line
+        assert UnicodeFactory.build().line != 'given line'
+        pass
+
+    def test_parent_change_invalidates_child(self):
+        class ParentFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        class ChildFactory(ParentFactory):
+            pass
+
+        ChildFactory.build()
+        ParentFactory.line = 'given line'
+        assert ChildFactory.build().line == 'given line'
+        pass
+
+    def test_overridden_hooks(self):
+        class HookFactory(PynamoModelFactory):
+            __model__ = NumberModel
+
+            @classmethod
+            def set_field(cls, *, field_name, field, build_arg):
+                if field_name == 'num':
+                    return 7
+                return super().set_field(field_name=field_name, field=field, build_arg=build_arg)
+
+            @classmethod
+            def should_set_field_none(cls, *, field_name, field) -> bool:
+                return field_name == 'nums'
+            pass
+
+        actual = HookFactory.build()
+        assert actual.num == 7
+        assert actual.nums is None
+        pass
+
+    def test_required(self):
+        class RequiredFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            line = Required()
+            pass
+
+        with raises(RequiredArgumentError):
+            RequiredFactory.build()
+        assert RequiredFactory.build(line='given line').line == 'given line'
+        pass
+    pass
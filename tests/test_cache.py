@@ -0,0 +1,173 @@
+import os
+
+from faker import Faker
+from faker.providers.bank import Provider as BankProvider
+
+from pynamodb_factories.cache import FixtureCache, factory_fingerprint, schema_fingerprint
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.fields import Use
+from tests.test_models.models import (
+    ComplexMap, HashRangeKeyModel, IndexedModel, MapListMap, MapListMapModel, ScalarModel, UnicodeModel,
+)
+
+pytest_plugins = ['pytester']
+
+
+class TestFixtureCache:
+    def test_reuses_batches(self, tmp_path):
+        cache = FixtureCache(str(tmp_path))
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        first = cache.build_batch(factory, 50, seed=3, serialized=True)
+        second = cache.build_batch(factory, 50, seed=3, serialized=True)
+        assert first == second == factory.build_range(0, 50, 3, serialized=True)
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert len(cache.entries()) == 1
+
+        instances = factory.build_batch_cached(50, seed=3, cache=cache)
+        assert [each.serialize() for each in instances] == first
+        assert cache.hits == 2
+        pass
+
+    def test_key_changes(self, tmp_path):
+        cache = FixtureCache(str(tmp_path))
+        factory = PynamoModelFactory.create_factory(UnicodeModel)
+        cache.build_batch(factory, 5, seed=1)
+        cache.build_batch(factory, 5, seed=2)
+        cache.build_batch(factory, 6, seed=1)
+        cache.build_batch(factory, 5, seed=1, line='given')
+        cache.build_batch(PynamoModelFactory.create_factory(UnicodeModel, __allow_nulls__=False), 5, seed=1)
+        assert (cache.misses, cache.hits) == (5, 0)
+        cache.build_batch(PynamoModelFactory.create_factory(UnicodeModel), 5, seed=1)
+        assert cache.hits == 1
+        pass
+
+    def test_key_includes_faker_config(self, tmp_path):
+        cache = FixtureCache(str(tmp_path))
+        factory = PynamoModelFactory.create_factory(UnicodeModel)
+        default = cache.key(factory, 5, 1, {})
+        try:
+            PynamoModelFactory.configure_default_faker(locale='ja_JP')
+            assert cache.key(factory, 5, 1, {}) != default
+        finally:
+            PynamoModelFactory.configure_default_faker()
+        assert cache.key(factory, 5, 1, {}) == default
+        pass
+
+    def test_fingerprints(self):
+        assert schema_fingerprint(ScalarModel) == schema_fingerprint(ScalarModel)
+        assert schema_fingerprint(HashRangeKeyModel) != schema_fingerprint(IndexedModel)
+
+        def fingerprint(**kwargs):
+            return factory_fingerprint(PynamoModelFactory.create_factory(ScalarModel, **kwargs))
+
+        assert fingerprint() == fingerprint()
+        assert fingerprint(line='a') != fingerprint(line='b')
+        assert fingerprint(line=Use(str, 1)) == fingerprint(line=Use(str, 1))
+        assert fingerprint(line=Use(str, 1)) != fingerprint(line=Use(str, 2))
+        assert fingerprint(line=lambda: 'a') != fingerprint(line=lambda: 'b')
+        pass
+
+    def test_custom_faker(self):
+        def fingerprint(faker):
+            return factory_fingerprint(PynamoModelFactory.create_factory(ScalarModel, __faker__=faker))
+
+        assert fingerprint(Faker('ja_JP')) == fingerprint(Faker('ja_JP'))
+        assert fingerprint(Faker('ja_JP')) != fingerprint(Faker('de_DE'))
+        faker = Faker()
+        faker.add_provider(BankProvider)
+        assert fingerprint(Faker()) != fingerprint(faker)
+        pass
+
+    def test_closures(self):
+        def line(value):
+            return lambda: value
+
+        def fingerprint(**kwargs):
+            return factory_fingerprint(PynamoModelFactory.create_factory(ScalarModel, **kwargs))
+
+        assert fingerprint(line=line('a')) == fingerprint(line=line('a'))
+        assert fingerprint(line=line('a')) != fingerprint(line=line('b'))
+
+        def recursive(depth=0):
+            return 'line' if depth > 2 else recursive(depth + 1)
+
+        assert fingerprint(line=recursive) == fingerprint(line=recursive)
+        pass
+
+    def test_registered_factories(self):
+        def fingerprint(name):
+            factory = PynamoModelFactory.create_factory(MapListMapModel)
+            inner = PynamoModelFactory.create_factory(MapListMap)
+            inner.register_factory(ComplexMap, PynamoModelFactory.create_factory(ComplexMap, name=name))
+            factory.register_factory(MapListMap, inner)
+            # Registered on itself, as for a recursive map
+            inner.register_factory(MapListMap, inner)
+            return factory_fingerprint(factory)
+
+        assert factory_fingerprint(PynamoModelFactory.create_factory(MapListMapModel)) != fingerprint('a')
+        assert fingerprint('a') == fingerprint('a')
+        assert fingerprint('a') != fingerprint('b')
+        pass
+
+    def test_lru_eviction(self, tmp_path):
+        factory = PynamoModelFactory.create_factory(ScalarModel, __allow_nulls__=False)
+        cache = FixtureCache(str(tmp_path))
+        cache.build_batch(factory, 100, seed=1)
+        size = os.path.getsize(cache.entries()[0])
+        cache.max_bytes = int(size * 2.5)
+        cache.build_batch(factory, 100, seed=2)
+        first, second = cache.entries()
+        os.utime(first, (1, 1))
+        os.utime(second, (2, 2))
+        # Reading the first batch makes the second the least recently used
+        cache.build_batch(factory, 100, seed=1)
+        cache.build_batch(factory, 100, seed=3)
+        assert len(cache.entries()) == 2
+        assert second not in cache.entries()
+        assert first in cache.entries()
+        pass
+
+    def test_disabled(self, tmp_path):
+        cache = FixtureCache(str(tmp_path / 'cache'), enabled=False)
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        assert cache.build_batch(factory, 5, seed=1, serialized=True) == factory.build_range(0, 5, 1, serialized=True)
+        cache.build_batch(factory, 5, seed=1)
+        assert cache.misses == 2
+        assert cache.entries() == []
+        pass
+
+    def test_damaged_entry(self, tmp_path):
+        cache = FixtureCache(str(tmp_path))
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        expected = cache.build_batch(factory, 5, seed=1, serialized=True)
+        path, = cache.entries()
+        with open(path, 'r+b') as f:
+            f.write(b'PNMF\xff\xff')
+        assert cache.build_batch(factory, 5, seed=1, serialized=True) == expected
+        assert cache.misses == 2
+        pass
+
+    def test_pytest_plugin(self, pytester, tmp_path):
+        pytester.makeconftest('pytest_plugins = ["pynamodb_factories.pytest_plugin"]')
+        pytester.makepyfile(
+            '''
+            from pynamodb_factories.factory import PynamoModelFactory
+            from tests.test_models.models import ScalarModel
+
+            def test_cache(factory_cache):
+                assert factory_cache.max_bytes == 1000000
+                factory = PynamoModelFactory.create_factory(ScalarModel)
+                assert len(factory_cache.build_batch(factory, 10, seed=1)) == 10
+            '''
+        )
+        pytester.makeini('[pytest]\nfactory_cache_max_bytes = 1000000')
+        pytester.syspathinsert(os.path.dirname(os.path.dirname(__file__)))
+        result = pytester.runpytest_inprocess('--factory-cache-dir', str(tmp_path / 'cache'))
+        result.assert_outcomes(passed=1)
+        assert len(os.listdir(tmp_path / 'cache')) == 1
+
+        result = pytester.runpytest_inprocess('--factory-cache-dir', str(tmp_path / 'other'), '--no-factory-cache')
+        result.assert_outcomes(passed=1)
+        assert not (tmp_path / 'other').exists()
+        pass
+    pass
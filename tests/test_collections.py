@@ -0,0 +1,84 @@
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.providers import _unique
+from tests.test_models.models import BinaryModel, ListModel, NumberModel, UnicodeModel
+
+
+class TestCollectionSizes:
+    def test_fixed_size(self):
+        class NumberFactory(PynamoModelFactory):
+            __model__ = NumberModel
+            __allow_nulls__ = False
+            __collection_sizes__ = {'nums': 5000}
+            pass
+
+        actual = NumberFactory.build().nums
+        assert isinstance(actual, set)
+        assert len(actual) == 5000
+        pass
+
+    def test_larger_than_faker_range(self):
+        class NumberFactory(PynamoModelFactory):
+            __model__ = NumberModel
+            __allow_nulls__ = False
+            __collection_sizes__ = {'nums': 20000}
+            pass
+
+        assert len(NumberFactory.build().nums) == 20000
+        pass
+
+    def test_size_range(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __allow_nulls__ = False
+            __collection_sizes__ = {'lines': (10, 20)}
+            pass
+
+        sizes = {len(UnicodeFactory.build().lines) for _ in range(30)}
+        assert min(sizes) >= 10
+        assert max(sizes) <= 20
+        pass
+
+    def test_callable_size(self):
+        class ListFactory(PynamoModelFactory):
+            __model__ = ListModel
+            __allow_nulls__ = False
+            __collection_sizes__ = {'list': lambda random: 7, 'list_of': 3}
+            pass
+
+        actual = ListFactory.build()
+        assert len(actual.list) == 7
+        assert len(actual.list_of) == 3
+        assert len(ListFactory.build_serialized()['list_of']['L']) == 3
+        pass
+
+    def test_unique_pooled_members(self):
+        class BinaryFactory(PynamoModelFactory):
+            __model__ = BinaryModel
+            __allow_nulls__ = False
+            __pool_size__ = 3
+            __collection_sizes__ = {'bins': 100}
+            pass
+
+        actual = BinaryFactory.build().bins
+        assert isinstance(actual, set)
+        assert len(actual) == 100
+        assert len(BinaryFactory.build().serialize()['bins']['BS']) == 100
+        pass
+
+    def test_default_size(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __allow_nulls__ = False
+            __allow_empty__ = False
+            pass
+
+        sizes = {len(UnicodeFactory.build().lines) for _ in range(50)}
+        assert min(sizes) >= 1
+        assert max(sizes) <= 5
+        pass
+
+    def test_unique(self):
+        assert _unique(['a', 'b', 'a', 'a'], ' #%d') == {'a', 'b', 'a #2', 'a #3'}
+        assert _unique(iter([b'a', b'a']), b' #%d') == {b'a', b'a #1'}
+        pass
+    pass
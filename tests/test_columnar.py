@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+
+import pytest
+from pynamodb.attributes import NumberAttribute
+
+from pynamodb_factories.batch import IntColumn, SerializedColumn, StringColumn, _ArrayColumn, _Column
+from pynamodb_factories.factory import PynamoModelFactory
+from tests.test_models.models import (
+    BinaryModel, ListModel, MapListMapModel, MapModel, NullModel, NumberModel, ScalarModel, UnicodeModel
+)
+
+
+def _sorted_sets(item):
+    # Set order isn't kept by deserializing
+    return {
+        name: {attr_type: sorted(value) if attr_type in ('SS', 'NS', 'BS') else value}
+        for name, attribute_value in item.items()
+        for attr_type, value in attribute_value.items()
+    }
+
+
+def _column(batch, field_name):
+    column, = [each for each in batch._columns if each.field_name == field_name]
+    return column
+
+
+class TestColumnarBatch:
+    @pytest.mark.parametrize('model', [
+        ScalarModel, NumberModel, BinaryModel, UnicodeModel, MapModel, ListModel, MapListMapModel, NullModel,
+    ])
+    def test_same_as_serialized(self, model):
+        factory = PynamoModelFactory.create_factory(model)
+        factory.set_random_seed(5)
+        expected = factory.build_batch_serialized(30)
+        factory.set_random_seed(5)
+        batch = factory.build_columnar(30)
+        assert len(batch) == 30
+        assert batch.to_serialized() == expected
+        if model is MapModel:
+            # PynamoDB doesn't deserialize DynamicMapAttribute values the way it serialized them
+            return
+        assert [_sorted_sets(each.serialize()) for each in batch] == [_sorted_sets(each) for each in expected]
+        pass
+
+    def test_vectorized(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel, __vectorize__=True)
+        batch = factory.build_columnar(50, line='given')
+        assert isinstance(_column(batch, 'num'), IntColumn)
+        assert {each.line for each in batch} == {'given'}
+        assert all(isinstance(each, ScalarModel) for each in batch)
+        pass
+
+    def test_indexing_and_slicing(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        batch = factory.build_columnar(10, item_kwargs=lambda index: {'num': index})
+        assert batch[3].num == 3
+        assert batch[-1].num == 9
+        assert [each.num for each in batch[2:8:2]] == [2, 4, 6]
+        assert len(batch[2:8:2]) == 3
+        assert batch[2:8][1:3].column('num') == [3, 4]
+        assert batch.serialized(4)['num'] == {'N': '4'}
+        with pytest.raises(IndexError):
+            batch[10]
+        with pytest.raises(ValueError):
+            batch[1:2].append({})
+        pass
+
+    def test_columns(self):
+        date = datetime(2021, 3, 4, 5, 6, 7, 890, tzinfo=timezone.utc)
+        factory = PynamoModelFactory.create_factory(ScalarModel, __allow_nulls__=False)
+        batch = factory.build_columnar(3, date=date, boolean=True)
+        assert batch.column('date') == [date] * 3
+        assert batch.column('boolean') == [True] * 3
+        with pytest.raises(KeyError):
+            batch.column('missing')
+        pass
+
+    def test_falls_back_for_other_values(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        batch = factory.build_columnar(3, item_kwargs=iter([{}, {'num': 1.5}, {'num': 2 ** 70}]))
+        assert isinstance(_column(batch, 'num'), SerializedColumn)
+        assert batch.column('num')[1:] == [1.5, 2 ** 70]
+        assert batch.serialized(1)['num'] == {'N': '1.5'}
+        pass
+
+    def test_strings(self):
+        factory = PynamoModelFactory.create_factory(UnicodeModel, __pool_size__=10)
+        column = _column(factory.build_columnar(2000), 'line')
+        assert isinstance(column, StringColumn)
+        assert column.codes is not None
+        assert len(column.strings) <= 11
+
+        column = _column(PynamoModelFactory.create_factory(UnicodeModel).build_columnar(2000), 'line')
+        assert column.codes is None
+        assert len(column) == 2000
+        pass
+
+    def test_incomplete_column_types(self):
+        class NoDecodeColumn(_ArrayColumn):
+            def encode(self, value):
+                return value
+            pass
+
+        with pytest.raises(TypeError):
+            NoDecodeColumn('num', NumberAttribute())
+        with pytest.raises(TypeError):
+            _Column('num', NumberAttribute())
+        pass
+    pass
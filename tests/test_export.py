@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from pynamodb_factories import export
+from pynamodb_factories.export import ItemReader
+from pynamodb_factories.factory import PynamoModelFactory
+from tests.test_models.models import BinaryModel, MapListMapModel, NullModel, ScalarModel, UnicodeModel
+
+
+def _sorted_sets(item):
+    # Set order isn't kept by deserializing
+    return {
+        name: {attr_type: sorted(value) if attr_type in ('SS', 'NS', 'BS') else value}
+        for name, attribute_value in item.items()
+        for attr_type, value in attribute_value.items()
+    }
+
+
+class TestExport:
+    @pytest.mark.parametrize('format', ['binary', 'jsonl'])
+    @pytest.mark.parametrize('model', [ScalarModel, BinaryModel, UnicodeModel, MapListMapModel, NullModel])
+    def test_round_trip(self, tmp_path, format, model):
+        factory = PynamoModelFactory.create_factory(model)
+        factory.set_random_seed(7)
+        expected = factory.build_batch_serialized(20)
+        factory.set_random_seed(7)
+        path = str(tmp_path / 'items')
+        assert factory.export(path, 20, format=format) == 20
+
+        with factory.load(path) as reader:
+            assert reader.format == format
+            assert len(reader) == 20
+            assert list(reader.iter_serialized()) == expected
+            assert [reader.serialized(index) for index in range(20)] == expected
+            expected = [_sorted_sets(each) for each in expected]
+            assert [_sorted_sets(each.serialize()) for each in reader] == expected
+            assert _sorted_sets(reader[3].serialize()) == expected[3]
+            assert _sorted_sets(reader[-1].serialize()) == expected[-1]
+            with pytest.raises(IndexError):
+                reader.serialized(20)
+        pass
+
+    def test_jsonl_is_dynamodb_export(self, tmp_path):
+        factory = PynamoModelFactory.create_factory(ScalarModel, __allow_nulls__=False)
+        path = tmp_path / 'items.json'
+        factory.export(str(path), 3, format='jsonl', line='exported')
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 3
+        for line in lines:
+            item = json.loads(line)['Item']
+            assert item['line'] == {'S': 'exported'}
+            assert set(item['num']) == {'N'}
+        pass
+
+    def test_binary_is_smaller(self, tmp_path):
+        factory = PynamoModelFactory.create_factory(ScalarModel, __allow_nulls__=False)
+        factory.set_random_seed(1)
+        factory.export(str(tmp_path / 'items.json'), 200, format='jsonl')
+        factory.set_random_seed(1)
+        factory.export(str(tmp_path / 'items.bin'), 200)
+        assert (tmp_path / 'items.bin').stat().st_size < (tmp_path / 'items.json').stat().st_size
+        pass
+
+    def test_empty(self, tmp_path):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        for format in ('binary', 'jsonl'):
+            path = str(tmp_path / format)
+            factory.export(path, 0, format=format)
+            with factory.load(path) as reader:
+                assert len(reader) == 0
+                assert list(reader) == []
+        pass
+
+    def test_without_model(self, tmp_path):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        path = str(tmp_path / 'items')
+        factory.export(path, 2)
+        with ItemReader(path) as reader:
+            assert len(reader.serialized(1)) > 0
+            with pytest.raises(ValueError):
+                reader[0]
+        pass
+
+    @pytest.mark.parametrize('truncated', [False, True])
+    def test_bad_header_closes_file(self, tmp_path, monkeypatch, truncated):
+        path = tmp_path / 'items'
+        PynamoModelFactory.create_factory(ScalarModel).export(str(path), 2)
+        # Either an unknown format version, or only the magic bytes
+        data = path.read_bytes()
+        path.write_bytes(data[:4] if truncated else data[:4] + b'\xff\xff' + data[6:])
+        opened = []
+
+        def recording_open(*args, **kwargs):
+            opened.append(open(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(export, 'open', recording_open, raising=False)
+        with pytest.raises(ValueError):
+            ItemReader(str(path), ScalarModel)
+        assert len(opened) == 1 and opened[0].closed
+        pass
+
+    def test_unknown_format(self, tmp_path):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        with pytest.raises(ValueError):
+            factory.export(str(tmp_path / 'items'), 2, format='csv')
+        pass
+    pass
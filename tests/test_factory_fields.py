@@ -1,8 +1,16 @@
 from datetime import datetime
 
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+
 from pynamodb_factories.factory import PynamoModelFactory
 from pynamodb_factories.fields import Use
-from tests.test_models.models import MapModel
+from tests.test_models.models import EmptyModel, MapModel
+
+
+class MethodNamedModel(EmptyModel):
+    load = NumberAttribute()
+    export = UnicodeAttribute()
+    mutate = UnicodeAttribute(null=True)
 
 
 class TestFactoryFields:
@@ -50,4 +58,22 @@ class TestFactoryFields:
         assert actual.map_of.name == 'given name'
         assert actual.map_of.email == 'given_email@example.com'
         assert actual.map_of.birthday == datetime(1990, 1, 1, 12, 0, 0)
+
+    def test_attributes_named_like_factory_methods(self):
+        class MethodNamedFactory(PynamoModelFactory):
+            __model__ = MethodNamedModel
+            __allow_nulls__ = False
+            pass
+
+        actual = MethodNamedFactory.build()
+        assert isinstance(actual.load, int)
+        assert isinstance(actual.export, str)
+        assert isinstance(MethodNamedFactory.build_serialized()['load']['N'], str)
+
+        class OverrideFactory(MethodNamedFactory):
+            export = 'given'
+            pass
+
+        assert OverrideFactory.build().export == 'given'
+        pass
     pass
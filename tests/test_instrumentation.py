@@ -0,0 +1,51 @@
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.fields import Ignored
+from tests.test_models.models import MapListMapModel, UnicodeModel, NumberModel
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        UnicodeFactory.build()
+        assert UnicodeFactory.get_stats().builds == 0
+        assert UnicodeFactory.get_stats().fields == {}
+        pass
+
+    def test_field_stats(self):
+        class NumberFactory(PynamoModelFactory):
+            __model__ = NumberModel
+            __instrument__ = True
+            nums = Ignored()
+            pass
+
+        NumberFactory.build_batch(10, lambda i: {'num': i} if i < 3 else {})
+        stats = NumberFactory.get_stats()
+        assert stats.builds == 10
+        assert stats.fields['num'].calls == 10
+        assert stats.fields['num'].seconds > 0
+        assert stats.fields['num'].paths == {'build_arg': 3, 'generated': 7}
+        assert stats.fields['nums'].paths['ignored'] + stats.fields['nums'].paths['none'] == 10
+        pass
+
+    def test_nested_stats(self):
+        class MapListMapFactory(PynamoModelFactory):
+            __model__ = MapListMapModel
+            __instrument__ = True
+            pass
+
+        MapListMapFactory.build_batch(5)
+        stats = MapListMapFactory.get_stats()
+        assert stats.nested_factories_created == 1
+        assert stats.nested['MapListMap'].builds == 5
+        assert stats.fields['val'].paths['default'] + stats.fields['val'].paths['generated'] == 5
+        assert 'MapListMap' in stats.report()
+
+        MapListMapFactory.reset_stats()
+        assert stats.builds == 0
+        assert stats.nested['MapListMap'].builds == 0
+        assert stats.fields['map'].calls == 0
+        pass
+    pass
@@ -0,0 +1,231 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+
+import pytest
+
+from pynamodb.attributes import BooleanAttribute
+
+from pynamodb_factories.exceptions import UnsupportedException
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.keys import KeyDistribution, KeySpace, Permutation
+from tests.test_models.models import EmptyModel, HashKeyModel, HashRangeKeyModel, IndexedModel, UnicodeModel
+
+
+class HashKeyFactory(PynamoModelFactory):
+    __model__ = HashKeyModel
+    __unique_keys__ = True
+    pass
+
+
+class HashRangeKeyFactory(PynamoModelFactory):
+    __model__ = HashRangeKeyModel
+    __unique_keys__ = True
+    __hash_key_cardinality__ = 10
+    pass
+
+
+class TestKeys:
+    def test_permutation_is_a_bijection(self):
+        permutation = Permutation(Random(1))
+        values = [permutation(n) for n in range(100000)]
+        assert len(set(values)) == len(values)
+        assert values != sorted(values)
+        pass
+
+    def test_unique_hash_keys(self):
+        keys = [each.id for each in HashKeyFactory.build_batch(5000)]
+        assert len(set(keys)) == len(keys)
+        pass
+
+    def test_unique_hash_keys_across_threads(self):
+        def build(_):
+            return [each.id for each in HashKeyFactory.build_batch(1000)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            keys = [key for batch in executor.map(build, range(4)) for key in batch]
+        assert len(set(keys)) == len(keys)
+        pass
+
+    def test_hash_key_cardinality(self):
+        items = HashRangeKeyFactory.build_batch(2000)
+        assert len({each.tenant for each in items}) == 10
+        assert len({(each.tenant, each.created) for each in items}) == len(items)
+        pass
+
+    def test_hash_key_skew(self):
+        class SkewedFactory(HashRangeKeyFactory):
+            __hash_key_cardinality__ = 100
+            __hash_key_skew__ = 1.5
+            pass
+
+        SkewedFactory.set_random_seed(1)
+        counts = Counter(each.tenant for each in SkewedFactory.build_batch(2000)).most_common()
+        assert counts[0][1] > 2000 * 0.3
+        assert counts[-1][1] < 20
+        pass
+
+    def test_seeded_keys_are_reproducible(self):
+        HashKeyFactory.set_random_seed(4)
+        first = [each.id for each in HashKeyFactory.build_batch(10)]
+        HashKeyFactory.set_random_seed(4)
+        assert [each.id for each in HashKeyFactory.build_batch(10)] == first
+        pass
+
+    def test_build_range_keys(self):
+        keys = [each.id for each in HashKeyFactory.build_range(0, 20, seed=2)]
+        assert len(set(keys)) == 20
+        assert HashKeyFactory.build_at(15, seed=2).id == keys[15]
+        pass
+
+    def test_build_args_take_priority(self):
+        assert HashKeyFactory.build(id='given').id == 'given'
+        pass
+
+    def test_vectorized(self):
+        class VectorizedFactory(HashKeyFactory):
+            __vectorize__ = True
+            pass
+
+        keys = [each.id for each in VectorizedFactory.build_batch(100)]
+        assert len(set(keys)) == 100
+        pass
+
+    def test_serialized(self):
+        items = HashRangeKeyFactory.build_batch_serialized(100)
+        assert len({(each['tenant']['N'], each['created']['S']) for each in items}) == 100
+        pass
+
+    def test_off_by_default(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __hash_key_cardinality__ = 10
+            pass
+
+        assert UnicodeFactory.build().line
+        pass
+
+    def test_cardinality_needs_range_key(self):
+        class CardinalityFactory(HashKeyFactory):
+            __hash_key_cardinality__ = 10
+            pass
+
+        with pytest.raises(ValueError):
+            CardinalityFactory.build()
+        pass
+
+    def test_unsupported_key_type(self):
+        class BooleanKeyModel(EmptyModel):
+            flag = BooleanAttribute(hash_key=True)
+            pass
+
+        with pytest.raises(UnsupportedException):
+            PynamoModelFactory.create_factory(BooleanKeyModel, __unique_keys__=True).build()
+        pass
+
+    def test_key_space_seek(self):
+        key_space = KeySpace(Random(1))
+        keys = [key_space.unique() for _ in range(5)]
+        key_space.seek(3)
+        assert key_space.unique() == keys[3]
+        pass
+    pass
+
+
+class IndexedFactory(PynamoModelFactory):
+    __model__ = IndexedModel
+    __allow_nulls__ = False
+    __index_keys__ = {'by-status': KeyDistribution(5)}
+    __index_range_keys__ = {'by_score': KeyDistribution(20, 'sequential')}
+    pass
+
+
+class TestIndexKeys:
+    def test_index_key_cardinality(self):
+        items = IndexedFactory.build_batch(500)
+        assert len({each.status for each in items}) == 5
+        assert len({each.score for each in items}) == 20
+        pass
+
+    def test_sequential(self):
+        IndexedFactory.set_random_seed(1)
+        scores = [each.score for each in IndexedFactory.build_batch(40)]
+        assert scores[:20] == scores[20:]
+        assert len(set(scores[:20])) == 20
+        pass
+
+    def test_zipf(self):
+        class ZipfFactory(IndexedFactory):
+            __index_keys__ = {'by-status': KeyDistribution(50, 'zipf', skew=2.0)}
+            pass
+
+        ZipfFactory.set_random_seed(1)
+        counts = Counter(each.status for each in ZipfFactory.build_batch(1000)).most_common()
+        assert counts[0][1] > 1000 * 0.5
+        pass
+
+    def test_vectorized(self):
+        class VectorizedFactory(IndexedFactory):
+            __vectorize__ = True
+            __index_keys__ = {'by-status': KeyDistribution(5, 'zipf')}
+            pass
+
+        items = VectorizedFactory.build_batch(2000)
+        assert len({each.status for each in items}) == 5
+        assert len({each.score for each in items}) == 20
+        pass
+
+    def test_seeded_index_keys_are_reproducible(self):
+        IndexedFactory.set_random_seed(2)
+        first = [(each.status, each.score) for each in IndexedFactory.build_batch(20)]
+        IndexedFactory.set_random_seed(2)
+        assert [(each.status, each.score) for each in IndexedFactory.build_batch(20)] == first
+        pass
+
+    def test_build_range(self):
+        items = [(each.status, each.score) for each in IndexedFactory.build_range(0, 6, seed=1)]
+        assert items == [(each.status, each.score) for each in
+                         IndexedFactory.build_range(0, 3, seed=1) + IndexedFactory.build_range(3, 6, seed=1)]
+        assert items == [(each.status, each.score) for each in
+                         (IndexedFactory.build_at(index, seed=1) for index in range(6))]
+        assert len({each.status for each in IndexedFactory.build_range(0, 500, seed=1)}) == 5
+        pass
+
+    def test_with_unique_keys(self):
+        class UniqueFactory(IndexedFactory):
+            __unique_keys__ = True
+            __hash_key_cardinality__ = 3
+            pass
+
+        items = UniqueFactory.build_batch(300)
+        assert len({each.tenant for each in items}) == 3
+        assert len({(each.tenant, each.created) for each in items}) == 300
+        assert len({each.status for each in items}) == 5
+        pass
+
+    def test_table_keys_are_rejected_with_unique_keys(self):
+        class TableKeyFactory(IndexedFactory):
+            __unique_keys__ = True
+            __index_keys__ = {'by-score': KeyDistribution(5)}
+            pass
+
+        with pytest.raises(ValueError):
+            TableKeyFactory.build()
+        pass
+
+    def test_unknown_index(self):
+        class UnknownIndexFactory(IndexedFactory):
+            __index_keys__ = {'missing': KeyDistribution(5)}
+            pass
+
+        with pytest.raises(ValueError):
+            UnknownIndexFactory.build()
+        pass
+
+    def test_invalid_distribution(self):
+        with pytest.raises(ValueError):
+            KeyDistribution(5, 'normal')
+        with pytest.raises(ValueError):
+            KeyDistribution(0)
+        pass
+    pass
@@ -0,0 +1,96 @@
+import copy
+import pickle
+
+import pytest
+
+from pynamodb_factories.exceptions import RequiredArgumentError
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.fields import Ignored, Required, Use
+from pynamodb_factories.lazy import LazyAttributeValues
+from tests.test_models.models import HashKeyModel, MapListMapModel, ScalarModel, UnicodeModel, VersionedModel
+
+
+class TestLazyBuild:
+    def test_generates_on_first_read(self):
+        factory = PynamoModelFactory.create_factory(VersionedModel, __allow_nulls__=False)
+        item = factory.build_lazy(num=3)
+        assert isinstance(item, VersionedModel)
+        assert isinstance(item.attribute_values, LazyAttributeValues)
+        assert sorted(item.attribute_values.pending) == ['line', 'map_of', 'ver']
+
+        line = item.line
+        assert isinstance(line, str)
+        assert item.line == line
+        assert sorted(item.attribute_values.pending) == ['map_of', 'ver']
+        assert item.num == 3
+        assert item.id is not None
+        pass
+
+    def test_serialize_generates_everything(self):
+        factory = PynamoModelFactory.create_factory(MapListMapModel, __allow_nulls__=False, __allow_empty__=False)
+        item = factory.build_lazy()
+        serialized = item.serialize()
+        assert set(serialized) == {'map', 'val'}
+        assert item.attribute_values.pending == []
+        assert item.serialize() == serialized
+        pass
+
+    def test_set_before_read(self):
+        factory = PynamoModelFactory.create_factory(UnicodeModel, __allow_nulls__=False)
+        item = factory.build_lazy()
+        item.line = 'set'
+        assert item.line == 'set'
+        assert item.attribute_values.pending == ['lines']
+        pass
+
+    def test_overrides_and_defaults(self):
+        class ScalarFactory(PynamoModelFactory):
+            __model__ = ScalarModel
+            __allow_nulls__ = False
+            line = Use(str.upper, 'used')
+            num = Required()
+            boolean = Ignored()
+            pass
+
+        with pytest.raises(RequiredArgumentError):
+            ScalarFactory.build_lazy()
+        item = ScalarFactory.build_lazy(num=5)
+        assert item.num == 5
+        assert item.boolean is None
+        assert item.line == 'USED'
+
+        item = PynamoModelFactory.create_factory(MapListMapModel, __allow_nulls__=False).build_lazy()
+        # Either the model's default or a generated value, the same as an eager build
+        assert isinstance(item.val, int)
+        pass
+
+    def test_build_arg_for_nested_map(self):
+        factory = PynamoModelFactory.create_factory(MapListMapModel, __allow_nulls__=False, __allow_empty__=False)
+        item = factory.build_lazy(val=7)
+        assert item.attribute_values.pending == ['map']
+        assert item.val == 7
+        pass
+
+    def test_lazy_option(self):
+        factory = PynamoModelFactory.create_factory(HashKeyModel, __lazy__=True, __unique_keys__=True)
+        item = factory.build()
+        assert item.attribute_values.pending == ['num']
+        items = factory.build_batch(5)
+        assert len({each.id for each in items}) == 5
+        assert all(each.attribute_values.pending == ['num'] for each in items)
+        pass
+
+    def test_target_size_is_eager(self):
+        factory = PynamoModelFactory.create_factory(UnicodeModel, __target_item_bytes__=100)
+        assert not isinstance(factory.build_lazy().attribute_values, LazyAttributeValues)
+        pass
+
+    def test_copies_are_plain(self):
+        factory = PynamoModelFactory.create_factory(UnicodeModel, __allow_nulls__=False)
+        item = factory.build_lazy()
+        copied = copy.deepcopy(item)
+        assert type(copied.attribute_values) is dict
+        assert copied.line == item.line
+        assert pickle.loads(pickle.dumps(factory.build_lazy())).line is not None
+        pass
+    pass
@@ -1,6 +1,7 @@
 from pynamodb.attributes import NumberAttribute, NumberSetAttribute, BinaryAttribute, BinarySetAttribute, \
     BooleanAttribute, UnicodeAttribute, UnicodeSetAttribute, JSONAttribute, VersionAttribute, TTLAttribute, \
     UTCDateTimeAttribute, NullAttribute, MapAttribute, ListAttribute, DynamicMapAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, LocalSecondaryIndex, AllProjection, KeysOnlyProjection
 from pynamodb.models import Model, MetaModel
 
 
@@ -89,3 +90,56 @@ class ListModel(EmptyModel):
 class MapListMapModel(EmptyModel):
     map = MapListMap()
     val = NumberAttribute(default=1001)
+
+
+class ScalarModel(EmptyModel):
+    num = NumberAttribute()
+    boolean = BooleanAttribute()
+    ver = VersionAttribute()
+    ttl = TTLAttribute()
+    date = UTCDateTimeAttribute()
+    line = UnicodeAttribute()
+
+
+class HashKeyModel(EmptyModel):
+    id = UnicodeAttribute(hash_key=True)
+    num = NumberAttribute()
+
+
+class HashRangeKeyModel(EmptyModel):
+    tenant = NumberAttribute(hash_key=True)
+    created = UTCDateTimeAttribute(range_key=True)
+    line = UnicodeAttribute()
+
+
+class StatusIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "by-status"
+        projection = AllProjection()
+    status = UnicodeAttribute(hash_key=True)
+    score = NumberAttribute(range_key=True)
+
+
+class TenantScoreIndex(LocalSecondaryIndex):
+    class Meta:
+        index_name = "by-score"
+        projection = KeysOnlyProjection()
+    tenant = NumberAttribute(hash_key=True)
+    score = NumberAttribute(range_key=True)
+
+
+class IndexedModel(EmptyModel):
+    tenant = NumberAttribute(hash_key=True)
+    created = UTCDateTimeAttribute(range_key=True)
+    status = UnicodeAttribute(null=True)
+    score = NumberAttribute()
+    by_status = StatusIndex()
+    by_score = TenantScoreIndex()
+
+
+class VersionedModel(EmptyModel):
+    id = UnicodeAttribute(hash_key=True)
+    ver = VersionAttribute()
+    line = UnicodeAttribute()
+    num = NumberAttribute()
+    map_of = ComplexMap()
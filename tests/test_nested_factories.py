@@ -0,0 +1,53 @@
+from pynamodb_factories.factory import PynamoModelFactory
+from tests.test_models.models import ComplexMap, ListModel, MapListMapModel, MapModel
+
+
+class TestNestedFactories:
+    def test_nested_factory_is_reused(self):
+        class MapListMapFactory(PynamoModelFactory):
+            __model__ = MapListMapModel
+            pass
+
+        first = MapListMapFactory._get_nested_factory(ComplexMap)
+        MapListMapFactory.build()
+        assert MapListMapFactory._get_nested_factory(ComplexMap) is first
+        pass
+
+    def test_nested_factory_per_config(self):
+        class NullableFactory(PynamoModelFactory):
+            __model__ = MapModel
+            pass
+
+        class NotNullableFactory(PynamoModelFactory):
+            __model__ = MapModel
+            __allow_nulls__ = False
+            pass
+
+        nullable = NullableFactory._get_nested_factory(ComplexMap)
+        not_nullable = NotNullableFactory._get_nested_factory(ComplexMap)
+        assert nullable is not not_nullable
+        assert not not_nullable.__allow_nulls__
+        pass
+
+    def test_registered_factory(self):
+        class ComplexMapFactory(PynamoModelFactory):
+            __model__ = ComplexMap
+            name = 'registered name'
+            pass
+
+        class ListFactory(PynamoModelFactory):
+            __model__ = ListModel
+            pass
+
+        class MapFactory(PynamoModelFactory):
+            __model__ = MapModel
+            pass
+
+        ListFactory.register_factory(ComplexMap, ComplexMapFactory)
+        actual = ListFactory.build(list_of=[{}, {}])
+        assert [each.name for each in actual.list_of] == ['registered name', 'registered name']
+
+        # Registration only applies to the factory it was registered on
+        assert MapFactory.build().map_of.name != 'registered name'
+        pass
+    pass
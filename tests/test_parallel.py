@@ -0,0 +1,61 @@
+from pynamodb_factories.factory import PynamoModelFactory
+from tests.test_models.models import HashKeyModel, MapListMapModel, NumberModel
+
+
+class MapListMapFactory(PynamoModelFactory):
+    __model__ = MapListMapModel
+    pass
+
+
+class NumberFactory(PynamoModelFactory):
+    __model__ = NumberModel
+    pass
+
+
+class HashKeyFactory(PynamoModelFactory):
+    __model__ = HashKeyModel
+    __unique_keys__ = True
+    pass
+
+
+def number_kwargs(index):
+    return {'num': index}
+
+
+class TestParallel:
+    def test_build_parallel(self):
+        actual = MapListMapFactory.build_parallel(25, workers=2, chunk_size=10)
+        assert len(actual) == 25
+        for each in actual:
+            assert isinstance(each, MapListMapModel)
+            assert each.serialize() is not None
+        pass
+
+    def test_independent_of_workers(self):
+        one = MapListMapFactory.build_parallel(30, workers=1, serialized=True, chunk_size=7, seed=11)
+        three = MapListMapFactory.build_parallel(30, workers=3, serialized=True, chunk_size=7, seed=11)
+        assert one == three
+        pass
+
+    def test_same_as_build_range(self):
+        actual = MapListMapFactory.build_parallel(30, workers=2, serialized=True, chunk_size=4, seed=11)
+        assert actual == MapListMapFactory.build_range(0, 30, 11, serialized=True)
+        pass
+
+    def test_unique_keys_across_chunks(self):
+        actual = HashKeyFactory.build_parallel(200, workers=3, serialized=True, chunk_size=10, seed=5)
+        assert len({str(each['id']) for each in actual}) == 200
+        pass
+
+    def test_seeded_from_factory(self):
+        MapListMapFactory.set_random_seed(7)
+        first = MapListMapFactory.build_parallel(12, workers=2, serialized=True, chunk_size=5)
+        MapListMapFactory.set_random_seed(7)
+        assert MapListMapFactory.build_parallel(12, workers=2, serialized=True, chunk_size=5) == first
+        pass
+
+    def test_item_kwargs_in_order(self):
+        actual = NumberFactory.build_parallel(20, workers=2, chunk_size=3, item_kwargs=number_kwargs)
+        assert [each.num for each in actual] == list(range(20))
+        pass
+    pass
@@ -0,0 +1,133 @@
+import asyncio
+import os
+import threading
+
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+from pynamodb.models import Model
+from pytest import fixture, importorskip, raises
+
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.pipeline import PipelineMetrics
+from tests.test_models.models import ScalarModel
+
+
+class PipelineModel(Model):
+    class Meta:
+        table_name = 'pipeline'
+        region = 'us-east-1'
+        pass
+
+    id = UnicodeAttribute(hash_key=True)
+    line = UnicodeAttribute()
+    num = NumberAttribute()
+
+
+class PipelineFactory(PynamoModelFactory):
+    __model__ = PipelineModel
+    __unique_keys__ = True
+    pass
+
+
+@fixture
+def table(monkeypatch):
+    moto = importorskip('moto')
+    # moto 5 replaced the per-service mocks with mock_aws
+    mock_aws = getattr(moto, 'mock_aws', None) or moto.mock_dynamodb
+    monkeypatch.setitem(os.environ, 'AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setitem(os.environ, 'AWS_SECRET_ACCESS_KEY', 'testing')
+    with mock_aws():
+        PipelineModel._connection = None
+        PipelineModel.create_table(read_capacity_units=1, write_capacity_units=1, wait=True)
+        yield PipelineModel
+        PipelineModel._connection = None
+
+
+class TestAsyncBuild:
+    def test_abuild_batch(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        items = asyncio.run(factory.abuild_batch(250, chunk_size=100, seed=4, serialized=True))
+        assert items == factory.build_range(0, 250, 4, serialized=True)
+        pass
+
+    def test_seeded_from_calling_thread(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        factory.set_random_seed(9)
+        first = asyncio.run(factory.abuild_batch(20, serialized=True))
+        factory.set_random_seed(9)
+        assert asyncio.run(factory.abuild_batch(20, serialized=True)) == first
+        pass
+
+    def test_aiter_build_backpressure(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+        metrics = PipelineMetrics()
+        builder_threads = set()
+
+        def item_kwargs(index):
+            builder_threads.add(threading.get_ident())
+            return {'num': index}
+
+        async def consume():
+            nums = []
+            async for item in factory.aiter_build(100, chunk_size=10, queue_size=2, item_kwargs=item_kwargs,
+                                                  metrics=metrics, line='given'):
+                nums.append(item.num)
+                assert item.line == 'given'
+                # Give the builder a chance to run ahead
+                await asyncio.sleep(0.001)
+                assert metrics.queue_depth <= 2
+            return nums
+
+        assert asyncio.run(consume()) == list(range(100))
+        assert threading.get_ident() not in builder_threads
+        assert metrics.items == metrics.built == 100
+        assert metrics.chunks == 10
+        assert 0 < metrics.max_queue_depth <= 2
+        assert metrics.items_per_second > 0
+        pass
+
+    def test_early_exit(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+
+        async def first():
+            async for item in factory.aiter_build(1000, chunk_size=10, queue_size=1):
+                return item
+
+        assert isinstance(asyncio.run(first()), ScalarModel)
+        pass
+
+    def test_build_errors(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel)
+
+        def item_kwargs(index):
+            if index == 15:
+                raise KeyError(index)
+            return {}
+
+        with raises(KeyError):
+            asyncio.run(factory.abuild_batch(30, chunk_size=10, item_kwargs=item_kwargs))
+        pass
+    pass
+
+
+class TestAsyncSave:
+    def test_asave_batch(self, table):
+        metrics = asyncio.run(PipelineFactory.asave_batch(260, writers=3, chunk_size=50, queue_size=2))
+        assert metrics.items == metrics.built == 260
+        assert metrics.chunks == 6
+        assert metrics.max_queue_depth <= 2
+        assert metrics.items_per_second > 0
+        assert table.count() == 260
+        pass
+
+    def test_save_errors(self, table):
+        def item_kwargs(index):
+            if index == 120:
+                raise KeyError(index)
+            return {}
+
+        with raises(KeyError):
+            asyncio.run(PipelineFactory.asave_batch(200, writers=2, chunk_size=25, item_kwargs=item_kwargs))
+        with raises(ValueError):
+            asyncio.run(PipelineFactory.asave_batch(10, writers=0))
+        pass
+    pass
@@ -0,0 +1,111 @@
+from random import Random
+
+from faker import Faker
+
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.pools import ValuePool
+from tests.test_models.models import UnicodeModel, JsonModel, MapModel
+
+
+class TestPools:
+    def test_pool_fills_lazily(self):
+        generated = []
+
+        def generate():
+            generated.append(len(generated))
+            return generated[-1]
+
+        pool = ValuePool(generate, 3)
+        random = Random(1)
+        assert [pool.sample(random) for _ in range(3)] == [0, 1, 2]
+        for _ in range(20):
+            assert pool.sample(random) in (0, 1, 2)
+        assert len(generated) == 3
+        pass
+
+    def test_pool_refresh(self):
+        generated = []
+
+        def generate():
+            generated.append(len(generated))
+            return generated[-1]
+
+        pool = ValuePool(generate, 3, refresh=1.0)
+        random = Random(1)
+        for _ in range(10):
+            pool.sample(random)
+        assert len(generated) == 10
+        assert len(pool.values) == 3
+        pass
+
+    def test_pooled_factory(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __pool_size__ = 5
+            pass
+
+        actual = UnicodeFactory.build_batch(50)
+        lines = {each.line for each in actual}
+        assert len(lines) <= 5
+        for each in actual:
+            for line in each.lines if each.lines else range(0):
+                # Repeated members of a set are made unique with a suffix
+                assert line.split(' #')[0] in UnicodeFactory.get_pool('sentence', None).values
+        pass
+
+    def test_pooled_values_are_not_shared(self):
+        class JsonFactory(PynamoModelFactory):
+            __model__ = JsonModel
+            __pool_size__ = 1
+            pass
+
+        first, second = JsonFactory.build_batch(2)
+        assert first.json == second.json
+        first.json['mutated'] = True
+        assert 'mutated' not in second.json
+        pass
+
+    def test_pools_are_per_faker(self):
+        class JapaneseFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __faker__ = Faker('ja_JP')
+            __pool_size__ = 5
+            __allow_nulls__ = False
+            pass
+
+        class DefaultFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __pool_size__ = 5
+            __allow_nulls__ = False
+            pass
+
+        assert all(not each.line.isascii() for each in JapaneseFactory.build_batch(10))
+        assert all(each.line.isascii() for each in DefaultFactory.build_batch(10))
+        pass
+
+    def test_pooled_raw_maps(self):
+        class MapFactory(PynamoModelFactory):
+            __model__ = MapModel
+            __pool_size__ = 3
+            __allow_nulls__ = False
+            pass
+
+        actual = MapFactory.build_batch(30)
+        pool = MapFactory.get_pool('pydict', None)
+        assert pool is not None and len(pool.values) <= 3
+        assert all(each.map.as_dict() in pool.values for each in actual)
+        assert all(each.serialize() for each in actual)
+        pass
+
+    def test_pooled_is_reproducible(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __pool_size__ = 5
+            pass
+
+        UnicodeFactory.set_random_seed(2)
+        first = [each.serialize() for each in UnicodeFactory.build_batch(20)]
+        UnicodeFactory.set_random_seed(2)
+        assert [each.serialize() for each in UnicodeFactory.build_batch(20)] == first
+        pass
+    pass
@@ -0,0 +1,95 @@
+import pytest
+
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.fields import Use
+from pynamodb_factories.prototype import clone_value
+from tests.test_models.models import ComplexMap, HashKeyModel, MapListMapModel, UnicodeModel, VersionedModel
+
+
+class TestPrototype:
+    def test_clones_share_fixed_values(self):
+        class VersionedFactory(PynamoModelFactory):
+            __model__ = VersionedModel
+            __allow_nulls__ = False
+            pass
+
+        prototype = VersionedFactory.prototype()
+        assert prototype.varying == ['id']
+        items = prototype.build_batch(10)
+        assert len({each.id for each in items}) == 10
+        assert len({each.line for each in items}) == 1
+        assert len({each.map_of.name for each in items}) == 1
+        pass
+
+    def test_mutable_values_are_copied(self):
+        class MapListMapFactory(PynamoModelFactory):
+            __model__ = MapListMapModel
+            __allow_nulls__ = False
+            __allow_empty__ = False
+            pass
+
+        prototype = MapListMapFactory.prototype()
+        first, second = prototype.build_batch(2)
+        assert first.map is not second.map
+        assert first.map.arr is not second.map.arr
+        assert first.serialize() == second.serialize()
+        first.map.arr.append(ComplexMap(name='added'))
+        assert len(second.map.arr) == len(first.map.arr) - 1
+        pass
+
+    def test_overrides_vary(self):
+        calls = []
+
+        class CountingFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            line = Use(lambda: calls.append(1) or 'called')
+            pass
+
+        prototype = CountingFactory.prototype()
+        assert prototype.varying == ['line']
+        prototype.build_batch(5)
+        assert len(calls) == 6
+        pass
+
+    def test_varying_and_template_kwargs(self):
+        class HashKeyFactory(PynamoModelFactory):
+            __model__ = HashKeyModel
+            __unique_keys__ = True
+            pass
+
+        prototype = HashKeyFactory.prototype(varying=['num'], id='fixed')
+        assert prototype.varying == ['num']
+        items = prototype.build_batch(20)
+        assert {each.id for each in items} == {'fixed'}
+        assert len({each.num for each in items}) > 1
+        pass
+
+    def test_build_kwargs(self):
+        class HashKeyFactory(PynamoModelFactory):
+            __model__ = HashKeyModel
+            pass
+
+        prototype = HashKeyFactory.prototype()
+        items = prototype.build_batch(3, item_kwargs=lambda index: {'id': str(index)}, num=7)
+        assert [each.id for each in items] == ['0', '1', '2']
+        assert {each.num for each in items} == {7}
+        pass
+
+    def test_unknown_varying(self):
+        class HashKeyFactory(PynamoModelFactory):
+            __model__ = HashKeyModel
+            pass
+
+        with pytest.raises(ValueError):
+            HashKeyFactory.prototype(varying=['missing'])
+        pass
+
+    def test_clone_value(self):
+        value = {'a': [1, {'b': {2, 3}}], 'c': 'text'}
+        clone = clone_value(value)
+        assert clone == value
+        assert clone['a'] is not value['a']
+        assert clone['a'][1]['b'] is not value['a'][1]['b']
+        assert clone['c'] is value['c']
+        pass
+    pass
@@ -0,0 +1,69 @@
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+from pynamodb.models import Model
+
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.providers import fake_number
+from tests.test_models.models import Meta, VersionModel, NumberModel
+
+
+class UpperAttribute(UnicodeAttribute):
+    pass
+
+
+class CustomModel(Model):
+    Meta = Meta
+    upper = UpperAttribute()
+    line = UnicodeAttribute()
+
+
+def fake_upper(factory, field, build_arg):
+    return build_arg if build_arg is not None else factory.get_faker().word().upper()
+
+
+class TestProviders:
+    def test_subclass_uses_base_provider(self):
+        class CustomFactory(PynamoModelFactory):
+            __model__ = CustomModel
+            pass
+
+        assert isinstance(CustomFactory.build().upper, str)
+        pass
+
+    def test_register_provider(self):
+        class CustomFactory(PynamoModelFactory):
+            __model__ = CustomModel
+            pass
+
+        class OtherFactory(PynamoModelFactory):
+            __model__ = CustomModel
+            pass
+
+        CustomFactory.build()
+        CustomFactory.register_provider(UpperAttribute, fake_upper)
+        actual = CustomFactory.build()
+        assert actual.upper == actual.upper.upper()
+        assert actual.line != actual.line.upper()
+        assert OtherFactory._get_provider(UpperAttribute) is not fake_upper
+        pass
+
+    def test_most_specific_type_wins(self):
+        class VersionFactory(PynamoModelFactory):
+            __model__ = VersionModel
+            pass
+
+        VersionFactory.register_provider(NumberAttribute, lambda factory, field, build_arg: 100)
+        assert VersionFactory.build().ver <= 5
+        pass
+
+    def test_global_provider(self):
+        class NumberFactory(PynamoModelFactory):
+            __model__ = NumberModel
+            pass
+
+        PynamoModelFactory.register_provider(NumberAttribute, lambda factory, field, build_arg: -1)
+        try:
+            assert NumberFactory.build().num == -1
+        finally:
+            PynamoModelFactory.register_provider(NumberAttribute, fake_number)
+        pass
+    pass
@@ -0,0 +1,107 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from faker import Faker
+
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.providers import FAKER_PROVIDERS
+from tests.test_models.models import MapListMapModel, UnicodeModel
+
+
+class TestRandomState:
+    def test_seed_is_reproducible(self):
+        class MapListMapFactory(PynamoModelFactory):
+            __model__ = MapListMapModel
+            pass
+
+        MapListMapFactory.set_random_seed(3)
+        first = [each.serialize() for each in MapListMapFactory.build_batch(10)]
+        MapListMapFactory.set_random_seed(3)
+        second = [each.serialize() for each in MapListMapFactory.build_batch(10)]
+        assert first == second
+        pass
+
+    def test_factories_are_isolated(self):
+        class FirstFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        class SecondFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        FirstFactory.set_random_seed(3)
+        expected = [FirstFactory.build().serialize() for _ in range(5)]
+
+        FirstFactory.set_random_seed(3)
+        SecondFactory.set_random_seed(4)
+        actual = []
+        for _ in range(5):
+            actual.append(FirstFactory.build().serialize())
+            SecondFactory.build()
+        assert actual == expected
+        pass
+
+    @pytest.mark.parametrize('faker', [None, Faker(), Faker('ja_JP')])
+    def test_threads_are_isolated(self, faker):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __faker__ = faker
+            pass
+
+        def build(seed):
+            UnicodeFactory.set_random_seed(seed)
+            return [each.serialize() for each in UnicodeFactory.build_batch(200)]
+
+        expected = [build(seed) for seed in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            actual = list(executor.map(build, range(8)))
+        assert actual == expected
+        pass
+
+    def test_custom_faker_is_seeded(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            __faker__ = Faker()
+            pass
+
+        UnicodeFactory.set_random_seed(3)
+        first = UnicodeFactory.build().line
+        UnicodeFactory.set_random_seed(3)
+        assert UnicodeFactory.build().line == first
+        pass
+
+    def test_faker_is_imported_lazily(self):
+        code = "import sys, pynamodb_factories; print(sorted({'faker', 'numpy'} & set(sys.modules)))"
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+        assert output.stdout.strip() == '[]'
+        pass
+
+    def test_optional_modules_are_imported_lazily(self):
+        names = ['batch', 'cache', 'export', 'lazy', 'pipeline', 'prototype']
+        modules = [f'pynamodb_factories.{name}' for name in names]
+        code = f"import sys, pynamodb_factories; print(sorted(set({modules!r}) & set(sys.modules)))"
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+        assert output.stdout.strip() == '[]'
+        pass
+
+    def test_configure_default_faker(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            pass
+
+        default = UnicodeFactory.get_faker()
+        try:
+            PynamoModelFactory.configure_default_faker(locale='fr_FR', providers=FAKER_PROVIDERS)
+            faker = UnicodeFactory.get_faker()
+            assert faker is not default
+            assert faker.locales == ['fr_FR']
+            assert faker.random is UnicodeFactory.get_random()
+            assert UnicodeFactory.build().line
+        finally:
+            PynamoModelFactory.configure_default_faker()
+        assert UnicodeFactory.get_faker().locales == ['en_US']
+        pass
+    pass
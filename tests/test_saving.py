@@ -0,0 +1,60 @@
+import os
+
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+from pynamodb.models import Model
+from pytest import fixture, importorskip, raises
+
+from pynamodb_factories.factory import PynamoModelFactory
+
+moto = importorskip('moto')
+# moto 5 replaced the per-service mocks with mock_aws
+mock_aws = getattr(moto, 'mock_aws', None) or moto.mock_dynamodb
+
+
+class SavedModel(Model):
+    class Meta:
+        table_name = 'saved'
+        region = 'us-east-1'
+        pass
+
+    id = UnicodeAttribute(hash_key=True)
+    line = UnicodeAttribute()
+    num = NumberAttribute()
+
+
+class SavedFactory(PynamoModelFactory):
+    __model__ = SavedModel
+    pass
+
+
+@fixture
+def table(monkeypatch):
+    monkeypatch.setitem(os.environ, 'AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setitem(os.environ, 'AWS_SECRET_ACCESS_KEY', 'testing')
+    with mock_aws():
+        SavedModel._connection = None
+        SavedModel.create_table(read_capacity_units=1, write_capacity_units=1, wait=True)
+        yield SavedModel
+        SavedModel._connection = None
+
+
+class TestSaving:
+    def test_save_batch(self, table):
+        result = SavedFactory.save_batch(60, item_kwargs=lambda i: {'id': str(i)})
+        assert result.items == 60
+        assert result.items_per_second > 0
+        assert table.count() == 60
+        pass
+
+    def test_save_batch_writers(self, table):
+        result = SavedFactory.save_batch(103, writers=4, item_kwargs=lambda i: {'id': str(i)})
+        assert result.items == 103
+        assert table.count() == 103
+        assert table.get('102').id == '102'
+        pass
+
+    def test_writers_need_callable(self, table):
+        with raises(ValueError):
+            SavedFactory.save_batch(10, writers=2, item_kwargs=[{'id': '1'}])
+        pass
+    pass
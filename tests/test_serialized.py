@@ -0,0 +1,85 @@
+from datetime import datetime
+
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+from pynamodb.models import Model
+from pytest import mark, raises
+from pynamodb.exceptions import AttributeNullError
+
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.fields import Ignored
+from tests.test_models.models import Meta, NumberModel, BinaryModel, BooleanModel, UnicodeModel, JsonModel, \
+    VersionModel, TtlModel, DateModel, NullModel, MapModel, ListModel, MapListMapModel
+
+
+class RenamedModel(Model):
+    Meta = Meta
+    name = UnicodeAttribute(attr_name='n')
+    count = NumberAttribute(default=lambda: 3)
+
+
+@mark.parametrize('model', [NumberModel, BinaryModel, BooleanModel, UnicodeModel, JsonModel, VersionModel, TtlModel,
+                            DateModel, NullModel, MapModel, ListModel, MapListMapModel, RenamedModel])
+class TestSerialized:
+    def test_same_as_model(self, model):
+        class SerializedFactory(PynamoModelFactory):
+            __model__ = model
+            pass
+
+        for seed in range(10):
+            SerializedFactory.set_random_seed(seed)
+            expected = SerializedFactory.build().serialize()
+            SerializedFactory.set_random_seed(seed)
+            assert SerializedFactory.build_serialized() == expected
+        pass
+
+    def test_batch_same_as_model(self, model):
+        class SerializedFactory(PynamoModelFactory):
+            __model__ = model
+            pass
+
+        SerializedFactory.set_random_seed(1)
+        expected = [each.serialize() for each in SerializedFactory.build_batch(10)]
+        SerializedFactory.set_random_seed(1)
+        assert SerializedFactory.build_batch_serialized(10) == expected
+        pass
+    pass
+
+
+class TestSerializedArgs:
+    def test_nested_build_args(self):
+        class MapListMapFactory(PynamoModelFactory):
+            __model__ = MapListMapModel
+            pass
+
+        build_args = {
+            'map': {'arr': [
+                {'name': 'one', 'birthday': datetime(1990, 1, 1, 12, 0, 0)},
+                {'name': 'two', 'email': 'given_email@example.com'},
+            ]}
+        }
+        actual = MapListMapFactory.build_serialized(**build_args)
+        arr = actual['map']['M']['arr']['L']
+        assert arr[0]['M']['name'] == {'S': 'one'}
+        assert arr[1]['M']['email'] == {'S': 'given_email@example.com'}
+        pass
+
+    def test_attr_name_and_default(self):
+        class RenamedFactory(PynamoModelFactory):
+            __model__ = RenamedModel
+            count = Ignored()
+            pass
+
+        actual = RenamedFactory.build_serialized(name='given name')
+        assert actual == {'n': {'S': 'given name'}, 'count': {'N': '3'}}
+        pass
+
+    def test_null_check(self):
+        class UnicodeFactory(PynamoModelFactory):
+            __model__ = UnicodeModel
+            line = Ignored()
+            pass
+
+        with raises(AttributeNullError):
+            UnicodeFactory.build_serialized()
+        pass
+    pass
@@ -0,0 +1,79 @@
+import pytest
+
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.sizes import attribute_value_size, item_size, number_size, resize_binary, resize_text
+from tests.test_models.models import BinaryModel, HashRangeKeyModel, ScalarModel, UnicodeModel
+
+
+class TestSizes:
+    def test_attribute_value_size(self):
+        assert attribute_value_size({'S': 'héllo'}) == 6
+        assert attribute_value_size({'N': '12345'}) == 4
+        assert attribute_value_size({'B': 'YWJj'}) == 3
+        assert attribute_value_size({'BOOL': True}) == 1
+        assert attribute_value_size({'SS': ['a', 'bc']}) == 3
+        assert attribute_value_size({'L': [{'S': 'a'}, {'N': '1'}]}) == 3 + 2 + 3
+        assert attribute_value_size({'M': {'key': {'S': 'value'}}}) == 3 + 1 + 3 + 5
+        pass
+
+    def test_number_size(self):
+        assert number_size(0) == 1
+        assert number_size(-3.5) == 2
+        assert number_size('0.0012') == 2
+        assert number_size(1e20) == 2
+        pass
+
+    def test_item_size(self):
+        assert item_size({'id': {'S': 'abc'}, 'n': {'N': '1'}}) == 2 + 3 + 1 + 2
+        pass
+
+    def test_resize(self):
+        assert resize_text('abc', 8) == 'abc abc '
+        assert resize_text('abcdef', 2) == 'ab'
+        assert len(resize_text('héllo', 20).encode('utf-8')) in (19, 20)
+        assert resize_binary(b'ab', 5) == b'ababa'
+        assert resize_binary(b'abc', 1) == b'a'
+        pass
+    pass
+
+
+class TestTargetItemBytes:
+    def test_exact_size(self):
+        for model in (BinaryModel, UnicodeModel, ScalarModel):
+            factory = PynamoModelFactory.create_factory(model, __target_item_bytes__=3000, __allow_nulls__=False)
+            assert {item_size(factory.build().serialize()) for _ in range(20)} == {3000}
+            assert {item_size(each) for each in factory.build_batch_serialized(20)} == {3000}
+        pass
+
+    def test_shrinks(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel, __target_item_bytes__=100)
+        assert {item_size(factory.build().serialize()) for _ in range(20)} == {100}
+        pass
+
+    def test_size_range(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel, __target_item_bytes__=(1000, 2000))
+        sizes = {item_size(factory.build().serialize()) for _ in range(50)}
+        assert min(sizes) >= 1000
+        assert max(sizes) <= 2000
+        assert len(sizes) > 1
+        pass
+
+    def test_vectorized(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel, __target_item_bytes__=500, __vectorize__=True)
+        assert {item_size(each.serialize()) for each in factory.build_batch(50)} == {500}
+        pass
+
+    def test_keys_and_build_args_are_left_alone(self):
+        factory = PynamoModelFactory.create_factory(
+            HashRangeKeyModel, __target_item_bytes__=1000, __unique_keys__=True, __hash_key_cardinality__=2)
+        item = factory.build()
+        assert item_size(item.serialize()) == 1000
+        assert len(factory.build(line='given').line) == 5
+        pass
+
+    def test_invalid_target(self):
+        factory = PynamoModelFactory.create_factory(ScalarModel, __target_item_bytes__=500 * 1024)
+        with pytest.raises(ValueError):
+            factory.build()
+        pass
+    pass
@@ -0,0 +1,112 @@
+import pytest
+
+from pynamodb_factories.factory import PynamoModelFactory
+from pynamodb_factories.fields import Ignored, Required
+from pynamodb_factories.sizes import item_size
+from tests.test_models.models import VersionedModel
+
+
+class VersionedFactory(PynamoModelFactory):
+    __model__ = VersionedModel
+    __allow_nulls__ = False
+    pass
+
+
+class TestVariants:
+    def test_mutate_fields(self):
+        base = VersionedFactory.build(ver=1)
+        variant = VersionedFactory.mutate(base, fields=['line'])
+        assert variant is not base
+        assert variant.line != base.line
+        assert variant.id == base.id
+        assert variant.num == base.num
+        assert variant.map_of is base.map_of
+        assert variant.ver == 2
+        pass
+
+    def test_mutate_leaves_base_alone(self):
+        base = VersionedFactory.build(ver=1)
+        expected = base.serialize()
+        VersionedFactory.mutate(base, fields=['line', 'map_of'])
+        assert base.serialize() == expected
+        pass
+
+    def test_fraction(self):
+        base = VersionedFactory.build(ver=1)
+        variant = VersionedFactory.mutate(base, fraction=1.0, bump_version=False)
+        assert variant.id == base.id
+        assert variant.ver == 1
+        assert variant.line != base.line
+        assert variant.map_of is not base.map_of
+        pass
+
+    def test_zero_fraction(self):
+        base = VersionedFactory.build(ver=1)
+        variant = VersionedFactory.mutate(base, fraction=0.0, bump_version=False)
+        assert variant.serialize() == base.serialize()
+        assert all(getattr(variant, name) is getattr(base, name) for name in ('line', 'num', 'map_of'))
+        assert VersionedFactory.mutate(base, fraction=0.0, num=5).num == 5
+        with pytest.raises(ValueError):
+            VersionedFactory.mutate(base, fraction=1.5)
+        pass
+
+    def test_default_mutates_one_attribute(self):
+        base = VersionedFactory.build(ver=1)
+        variant = VersionedFactory.mutate(base, bump_version=False)
+        changed = [name for name in ('line', 'num', 'map_of') if getattr(variant, name) is not getattr(base, name)]
+        assert len(changed) == 1
+        pass
+
+    def test_skips_required_and_ignored(self):
+        class OverriddenFactory(VersionedFactory):
+            line = Required()
+            num = Ignored()
+            pass
+
+        base = OverriddenFactory.build(line='given', num=7)
+        for _ in range(20):
+            variant = OverriddenFactory.mutate(base, bump_version=False)
+            assert variant.line == 'given'
+            assert variant.num == 7
+            assert variant.map_of is not base.map_of
+        pass
+
+    def test_kwargs(self):
+        base = VersionedFactory.build(ver=1)
+        variant = VersionedFactory.mutate(base, fields=[], num=5, ver=10)
+        assert variant.num == 5
+        assert variant.ver == 10
+        assert variant.line == base.line
+        pass
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError):
+            VersionedFactory.mutate(VersionedFactory.build(), fields=['missing'])
+        pass
+
+    def test_build_variants(self):
+        base = VersionedFactory.build(ver=1)
+        variants = VersionedFactory.build_variants(base, 5, fields=['num'])
+        assert [each.ver for each in variants] == [2, 3, 4, 5, 6]
+        assert all(each.id == base.id and each.line == base.line for each in variants)
+        pass
+
+    def test_seeded_variants_are_reproducible(self):
+        VersionedFactory.set_random_seed(1)
+        base = VersionedFactory.build()
+        first = [each.serialize() for each in VersionedFactory.build_variants(base, 5, fraction=0.5)]
+        VersionedFactory.set_random_seed(1)
+        base = VersionedFactory.build()
+        assert [each.serialize() for each in VersionedFactory.build_variants(base, 5, fraction=0.5)] == first
+        pass
+
+    def test_target_item_bytes(self):
+        class SizedFactory(VersionedFactory):
+            __target_item_bytes__ = 1000
+            pass
+
+        base = SizedFactory.build(ver=1)
+        variant = SizedFactory.mutate(base, fields=['line'])
+        assert item_size(variant.serialize()) == 1000
+        pass
+    pass
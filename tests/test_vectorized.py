@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+
+from pytest import mark, importorskip
+
+from pynamodb_factories.columns import ColumnGenerator, numpy_available
+from pynamodb_factories.factory import PynamoModelFactory
+from tests.test_models.models import ScalarModel
+
+
+@mark.parametrize('use_numpy', [False, True] if numpy_available() else [False])
+class TestVectorized:
+    def test_vectorized_batch(self, use_numpy):
+        class ScalarFactory(PynamoModelFactory):
+            __model__ = ScalarModel
+            __vectorize__ = True
+            __columns__ = ColumnGenerator(seed=1, use_numpy=use_numpy)
+            pass
+
+        actual = ScalarFactory.build_batch(2000)
+        assert len(actual) == 2000
+        for each in actual:
+            assert each.serialize() is not None
+            assert type(each.num) is int and 0 <= each.num <= 9999
+            assert type(each.boolean) is bool
+            assert 1 <= each.ver <= 5
+            assert each.ttl.year == datetime.now(timezone.utc).year
+            assert each.date <= datetime.now(timezone.utc)
+            assert isinstance(each.line, str)
+        pass
+
+    def test_build_args_take_priority(self, use_numpy):
+        class ScalarFactory(PynamoModelFactory):
+            __model__ = ScalarModel
+            __vectorize__ = True
+            __columns__ = ColumnGenerator(use_numpy=use_numpy)
+            pass
+
+        actual = ScalarFactory.build_batch(10, lambda i: {'num': i}, boolean=True)
+        assert [each.num for each in actual] == list(range(10))
+        assert all(each.boolean for each in actual)
+        pass
+
+    def test_reproducible(self, use_numpy):
+        class ScalarFactory(PynamoModelFactory):
+            __model__ = ScalarModel
+            __vectorize__ = True
+            __columns__ = ColumnGenerator(use_numpy=use_numpy)
+            pass
+
+        def build():
+            ScalarFactory.set_random_seed(5)
+            # Dates are drawn up to the current time, so they can move by a second between builds
+            return [{name: value for name, value in each.serialize().items() if name != 'date'}
+                    for each in ScalarFactory.build_batch(50)]
+
+        assert build() == build()
+        pass
+    pass
+
+
+class TestColumnGenerator:
+    def test_numpy_generator_seed(self):
+        np = importorskip('numpy')
+        columns = ColumnGenerator(seed=np.random.default_rng(3))
+        assert columns.integers(5, 0, 10) == ColumnGenerator(seed=3).integers(5, 0, 10)
+        pass
+
+    @mark.parametrize('use_numpy', [False, True] if numpy_available() else [False])
+    @mark.parametrize('seed', ['abc', -1, b'seed'])
+    def test_any_seed(self, use_numpy, seed):
+        class ScalarFactory(PynamoModelFactory):
+            __model__ = ScalarModel
+            __vectorize__ = True
+            __columns__ = ColumnGenerator(use_numpy=use_numpy)
+            pass
+
+        # Datetime columns are bounded by the current time, so fix them to keep the comparison stable
+        now = datetime.now(timezone.utc)
+        ScalarFactory.set_random_seed(seed)
+        first = [each.serialize() for each in ScalarFactory.build_batch(10, date=now, ttl=now)]
+        ScalarFactory.set_random_seed(seed)
+        assert [each.serialize() for each in ScalarFactory.build_batch(10, date=now, ttl=now)] == first
+        assert ColumnGenerator(seed, use_numpy=use_numpy).integers(5, 0, 10) == \
+            ColumnGenerator(seed, use_numpy=use_numpy).integers(5, 0, 10)
+        pass
+
+    @mark.parametrize('use_numpy', [False, True] if numpy_available() else [False])
+    def test_datetimes_use_the_same_random_state_for_any_range(self, use_numpy):
+        def draw(end):
+            columns = ColumnGenerator(seed=4, use_numpy=use_numpy)
+            dates = columns.datetimes(20, datetime(2000, 1, 1, tzinfo=timezone.utc), end)
+            return dates, columns.integers(20, 0, 9999)
+
+        dates, following = draw(datetime(2020, 1, 1, tzinfo=timezone.utc))
+        assert all(datetime(2000, 1, 1, tzinfo=timezone.utc) <= each <= datetime(2020, 1, 1, tzinfo=timezone.utc)
+                   for each in dates)
+        assert draw(datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc))[1] == following
+        pass
+
+    def test_python_fallback(self):
+        columns = ColumnGenerator(seed=3, use_numpy=False)
+        assert columns.integers(5, 0, 10) == ColumnGenerator(seed=3, use_numpy=False).integers(5, 0, 10)
+        assert all(type(each) is bool for each in columns.booleans(5))
+        pass
+    pass